@@ -0,0 +1,294 @@
+"""
+In-memory corpus of benchmark cases.
+
+Each case directory is read once into an immutable ``CaseRecord`` holding
+meta.json, the plan, both context variants (``context.md`` for explicit runs
+and ``context_base.md`` for implicit runs), the implementation, and the
+optional diff, rubric and expected critique. Every record carries a SHA-256
+hash of those files, so callers can tell when a case changed.
+
+The runner, evaluator and the catalog/critique generators get cases from
+``get_corpus(cases_dir)`` instead of reading case files themselves.
+"""
+
+import hashlib
+import json
+import threading
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any
+
+# Implementation file extension per framework directory
+IMPL_EXTENSIONS = {
+    "rails": ".rb",
+    "django": ".py",
+    "laravel": ".php",
+    "springboot-java": ".java",
+    "springboot-kotlin": ".kt",
+}
+
+# Files that make up a case, in hashing order (impl{ext} is added per case)
+CASE_FILES = (
+    "meta.json", "plan.md", "context.md", "context_base.md",
+    "pr.diff", "rubric.json", "expected_critique.md",
+)
+
+
+def freeze(value: Any) -> Any:
+    """Read-only copy of parsed JSON (dicts become mappingproxies, lists tuples)."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+def thaw(value: Any) -> Any:
+    """Mutable, JSON-serializable copy of a frozen value."""
+    if isinstance(value, Mapping):
+        return {key: thaw(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [thaw(item) for item in value]
+    return value
+
+
+def find_impl_file(case_dir: Path, framework: str) -> Path | None:
+    """Implementation file of a case, preferring the framework's extension."""
+    preferred = case_dir / f"impl{IMPL_EXTENSIONS.get(framework, '.rb')}"
+    if preferred.exists():
+        return preferred
+    # Fallback: rails/django cases occasionally carry the other language
+    for ext in (".py", ".rb"):
+        candidate = case_dir / f"impl{ext}"
+        if candidate.exists():
+            return candidate
+    return next(iter(sorted(case_dir.glob("impl.*"))), None)
+
+
+@dataclass(frozen=True)
+class CaseRecord:
+    """All files of one case, read once.
+
+    Missing optional files are None. ``meta`` and ``rubric`` are frozen; use
+    ``thaw`` (or ``to_case``) for mutable copies.
+    """
+    framework: str
+    case_id: str
+    case_dir: Path
+    meta: Mapping[str, Any]
+    plan: str | None
+    explicit_context: str | None
+    implicit_context: str | None
+    impl: str | None
+    impl_file: str | None
+    diff: str | None
+    rubric: Mapping[str, Any] | None
+    expected_critique: str | None
+    content_hash: str
+
+    @classmethod
+    def load(cls, case_dir: Path, framework: str | None = None) -> "CaseRecord":
+        """Read a case directory.
+
+        Args:
+            case_dir: Directory containing meta.json
+            framework: Framework the case belongs to (default: parent directory name)
+
+        Raises:
+            FileNotFoundError: If the directory has no meta.json
+        """
+        framework = framework or case_dir.parent.name
+        impl_path = find_impl_file(case_dir, framework)
+        names = list(CASE_FILES) + ([impl_path.name] if impl_path else [])
+
+        texts: dict[str, str] = {}
+        digest = hashlib.sha256()
+        for name in names:
+            path = case_dir / name
+            if not path.exists():
+                continue
+            data = path.read_bytes()
+            texts[name] = data.decode("utf-8")
+            digest.update(f"{name}\0{len(data)}\0".encode())
+            digest.update(data)
+        if "meta.json" not in texts:
+            raise FileNotFoundError(f"No meta.json in {case_dir}")
+
+        meta = json.loads(texts["meta.json"])
+        rubric = json.loads(texts["rubric.json"]) if "rubric.json" in texts else None
+        return cls(
+            framework=framework,
+            case_id=meta.get("case_id", case_dir.name),
+            case_dir=case_dir,
+            meta=freeze(meta),
+            plan=texts.get("plan.md"),
+            explicit_context=texts.get("context.md"),
+            implicit_context=texts.get("context_base.md"),
+            impl=texts.get(impl_path.name) if impl_path else None,
+            impl_file=impl_path.name if impl_path else None,
+            diff=texts.get("pr.diff"),
+            rubric=freeze(rubric) if rubric is not None else None,
+            expected_critique=texts.get("expected_critique.md"),
+            content_hash=digest.hexdigest(),
+        )
+
+    @property
+    def is_dual_capable(self) -> bool:
+        return self.meta.get("evaluation_mode") == "dual"
+
+    def context(self, mode: str) -> tuple[str | None, str]:
+        """Context text and file name for a run mode.
+
+        Implicit runs use context_base.md, falling back to context.md.
+        """
+        if mode == "implicit" and self.implicit_context is not None:
+            return self.implicit_context, "context_base.md"
+        return self.explicit_context, "context.md"
+
+    def to_case(self, mode: str = "explicit") -> dict[str, Any]:
+        """Case dict in the runner's format for one run mode.
+
+        Raises:
+            FileNotFoundError: If plan.md, the context or the implementation is missing
+        """
+        context, context_file = self.context(mode)
+        for name, text in (("plan.md", self.plan), (context_file, context), ("impl", self.impl)):
+            if text is None:
+                raise FileNotFoundError(f"No {name} in {self.case_dir}")
+
+        case = {
+            "plan": self.plan,
+            "context": context,
+            "impl": self.impl,
+            "meta": thaw(self.meta),
+            "context_mode": mode,
+            "context_file": context_file,
+            "framework": self.framework,
+            "case_dir": self.case_dir,
+        }
+        if self.diff is not None:
+            case["diff"] = self.diff
+        if self.rubric is not None:
+            case["rubric"] = thaw(self.rubric)
+        return case
+
+
+class DuplicateCaseError(ValueError):
+    """A case_id lookup matched more than one case directory."""
+
+    def __init__(self, case_id: str, case_dirs: list[Path]):
+        self.case_id = case_id
+        self.case_dirs = case_dirs
+        super().__init__(f"Duplicate case_id {case_id}: {', '.join(str(d) for d in case_dirs)}")
+
+
+class CaseCorpus:
+    """Case records under a cases directory, in sorted directory order.
+
+    Records are indexed by case_id, so ``find`` does not scan the corpus.
+    """
+
+    def __init__(self, cases_dir: Path, framework: str | None = None):
+        """Load every case below ``cases_dir``.
+
+        Args:
+            cases_dir: A framework directory (cases/rails) or the cases root
+            framework: Framework for all records (default: each case's parent directory name)
+        """
+        self.cases_dir = Path(cases_dir)
+        self.framework = framework
+        self._lock = threading.Lock()
+        self._by_dir: dict[Path, CaseRecord] = {}
+        self._by_case_id: dict[str, list[CaseRecord]] = {}
+        for meta_file in sorted(self.cases_dir.rglob("meta.json")):
+            record = CaseRecord.load(meta_file.parent, framework)
+            self._by_dir[meta_file.parent.resolve()] = record
+        self._reindex()
+
+    def _reindex(self) -> None:
+        by_case_id: dict[str, list[CaseRecord]] = {}
+        for record in self._by_dir.values():
+            by_case_id.setdefault(record.case_id, []).append(record)
+        self._by_case_id = by_case_id
+
+    def __iter__(self) -> Iterator[CaseRecord]:
+        return iter(list(self._by_dir.values()))
+
+    def __len__(self) -> int:
+        return len(self._by_dir)
+
+    def get(self, case_dir: Path) -> CaseRecord:
+        """Record for a case directory.
+
+        Raises:
+            FileNotFoundError: If the directory is not a case of this corpus
+        """
+        record = self._by_dir.get(Path(case_dir).resolve())
+        if record is None:
+            raise FileNotFoundError(f"No meta.json in {case_dir}")
+        return record
+
+    def find(self, case_id: str, framework: str | None = None) -> CaseRecord | None:
+        """Record with the given case_id, or None.
+
+        Args:
+            case_id: Case ID from meta.json
+            framework: Only consider this framework's cases. Case IDs repeat
+                across frameworks, so omit it only for single-framework corpora.
+
+        Raises:
+            DuplicateCaseError: If more than one case directory matches
+        """
+        matches = [
+            record for record in self._by_case_id.get(case_id, ())
+            if framework is None or record.framework == framework
+        ]
+        if len(matches) > 1:
+            raise DuplicateCaseError(case_id, [record.case_dir for record in matches])
+        return matches[0] if matches else None
+
+    def duplicates(self) -> dict[tuple[str, str], list[Path]]:
+        """Case directories sharing a (framework, case_id)."""
+        found: dict[tuple[str, str], list[Path]] = {}
+        for case_id, records in self._by_case_id.items():
+            by_framework: dict[str, list[Path]] = {}
+            for record in records:
+                by_framework.setdefault(record.framework, []).append(record.case_dir)
+            found.update(
+                ((framework, case_id), case_dirs)
+                for framework, case_dirs in by_framework.items() if len(case_dirs) > 1
+            )
+        return found
+
+    def by_framework(self) -> dict[str, list[CaseRecord]]:
+        """Records grouped by framework."""
+        grouped: dict[str, list[CaseRecord]] = {}
+        for record in self:
+            grouped.setdefault(record.framework, []).append(record)
+        return grouped
+
+    def refresh(self, case_dir: Path) -> CaseRecord:
+        """Re-read one case after its files were changed on disk."""
+        record = CaseRecord.load(Path(case_dir), self.framework)
+        with self._lock:
+            self._by_dir[Path(case_dir).resolve()] = record
+            self._reindex()
+        return record
+
+
+# Process-wide corpora keyed by (resolved cases_dir, framework)
+_corpora: dict[tuple[Path, str | None], CaseCorpus] = {}
+_lock = threading.Lock()
+
+
+def get_corpus(cases_dir: Path, framework: str | None = None) -> CaseCorpus:
+    """Shared corpus for a cases directory, loaded on first use."""
+    key = (Path(cases_dir).resolve(), framework)
+    with _lock:
+        corpus = _corpora.get(key)
+        if corpus is None:
+            corpus = CaseCorpus(cases_dir, framework)
+            _corpora[key] = corpus
+        return corpus
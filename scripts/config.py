@@ -18,6 +18,9 @@ class JudgeConfig:
     output_cost_per_1m: float
     max_tokens: int = 1024
     temperature: float = 0.0
+    # Provider rate limits (None = unlimited). Adjust to your account tier.
+    requests_per_minute: int | None = None
+    tokens_per_minute: int | None = None
 
 
 # Available judge configurations
@@ -28,6 +31,8 @@ JUDGE_CONFIGS: dict[str, JudgeConfig] = {
         provider="anthropic",
         input_cost_per_1m=3.00,
         output_cost_per_1m=15.00,
+        requests_per_minute=1000,
+        tokens_per_minute=450_000,
     ),
     "gemini": JudgeConfig(
         name="gemini",
@@ -35,6 +40,8 @@ JUDGE_CONFIGS: dict[str, JudgeConfig] = {
         provider="google",
         input_cost_per_1m=1.25,
         output_cost_per_1m=10.00,
+        requests_per_minute=150,
+        tokens_per_minute=2_000_000,
     ),
 }
 
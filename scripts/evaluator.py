@@ -6,18 +6,27 @@ Usage:
     python scripts/evaluator.py --run-dir results/20250124_run/
     python scripts/evaluator.py --run-dir results/20250124_run/ --skip-judge  # Judgeなしで集計のみ
     python scripts/evaluator.py --run-dir results/xxx/ --judge-mode=ensemble --judges=claude,gemini
+    python scripts/evaluator.py --run-dir results/xxx/ --follow  # runner.py 実行中に逐次採点
 """
 
 import argparse
+import functools
+import hashlib
+import inspect
 import json
 import re
 import sys
+import threading
 import time
-from dataclasses import dataclass, asdict
+from collections.abc import Callable, Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, asdict, field
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+import numpy as np
+
 # Load .env file if python-dotenv is available
 try:
     from dotenv import load_dotenv
@@ -33,10 +42,47 @@ except ImportError:
     anthropic = None
     ANTHROPIC_AVAILABLE = False
 
+from case_corpus import CaseRecord, get_corpus, thaw
+from config import DEFAULT_JUDGE, estimate_ensemble_cost, get_judge_config
+from metrics import (
+    SEVERITY_CODES,
+    ConfidenceIntervals,
+    EvaluationTable,
+    bootstrap_intervals,
+    group_count,
+    group_sum,
+)
+from providers import (
+    JUDGE_RECORDINGS_FILE,
+    CallStats,
+    ResponseCache,
+    RetryPolicy,
+    configure_judge_cache,
+    configure_judge_provider,
+    configure_retry_policy,
+    configure_simulator,
+    estimate_tokens,
+    get_client_registry,
+    get_judge_cache,
+    get_judge_recorder,
+    get_judge_replay,
+    get_rate_limiter,
+    get_retry_policy,
+    get_simulator,
+    judge_cache_key,
+    parse_provider_spec,
+    record_judge_response,
+)
+
 # Import judges module for ensemble support
 try:
     from judges import EnsembleJudge, ClaudeJudge
-    from metrics import calculate_fp_metrics, calculate_tp_noise_metrics
+    from metrics import (
+        calculate_fp_metrics,
+        calculate_fp_metrics_by_model,
+        calculate_tp_noise_metrics,
+        calculate_tp_noise_metrics_by_model,
+    )
     JUDGES_AVAILABLE = True
 except ImportError:
     JUDGES_AVAILABLE = False
@@ -47,13 +93,69 @@ def get_cases_dir(framework: str) -> Path:
     return Path(__file__).parent.parent / "cases" / framework
 
 
+# Files in a run directory that are not per-model result files
+NON_RESULT_FILES = ("summary.json", "evaluations.json", "report.json", "metrics.json", "ensemble_details.json",
+                    "evaluation_cache.json", "run_status.json")
+
+# Written by runner.py: {"status": "running" | "complete", "run_id": ...}
+RUN_STATUS_FILE = "run_status.json"
+
+
+def find_result_files(run_dir: Path, default_framework: str) -> list[tuple[Path, str, str]]:
+    """Find result files in a run directory.
+
+    Multi-framework runs write ``{model}.{framework}.json``; untagged
+    ``{model}.json`` files belong to ``default_framework``.
+
+    Returns:
+        Sorted list of (result_file, model, framework). ``model`` is the file
+        stem, so each (model, framework) pair is scored separately.
+    """
+    result_files = []
+    for result_file in sorted(run_dir.glob("*.json")):
+        if result_file.name in NON_RESULT_FILES:
+            continue
+        _, _, framework = result_file.stem.partition(".")
+        result_files.append((result_file, result_file.stem, framework or default_framework))
+    return result_files
+
+
+def load_run_summary(run_dir: Path, framework_arg: str | None) -> tuple[dict[str, Any] | None, str]:
+    """Read summary.json (if any) and pick the framework of untagged result files.
+
+    Returns:
+        Tuple of (run summary or None, framework)
+    """
+    # summary.json 読み込み（あれば）
+    summary_file = run_dir / "summary.json"
+    run_summary = None
+    if summary_file.exists():
+        run_summary = json.loads(summary_file.read_text())
+
+    # Determine framework (from argument, summary.json, or default)
+    # Framework-tagged result files ({model}.{framework}.json) override it per file
+    if framework_arg:
+        framework = framework_arg
+    elif run_summary and len(run_summary.get("frameworks", [])) == 1:
+        framework = run_summary["frameworks"][0]
+    elif run_summary and "framework" in run_summary and "frameworks" not in run_summary:
+        framework = run_summary["framework"]
+    else:
+        framework = "rails"
+    return run_summary, framework
+
+
 # Default for backward compatibility
 CASES_DIR = get_cases_dir("rails")
 
+# Judge responses shared by the single-judge path and ensemble judges
+JUDGE_CACHE_DIR = Path(__file__).parent.parent / "results" / ".cache" / "judges"
+
 # Judge モデル設定 (legacy, used when judge-mode=single)
 JUDGE_MODEL = "claude-sonnet-4-20250514"
 JUDGE_INPUT_COST_PER_1M = 3.00
 JUDGE_OUTPUT_COST_PER_1M = 15.00
+JUDGE_MAX_TOKENS = 1024
 
 
 JUDGE_PROMPT_TEMPLATE = """あなたはコードレビューの品質を評価する審査員です。
@@ -212,10 +314,14 @@ class EvaluationResult:
     key_points_missed: list[str] | None = None
     # Dual mode / Fix evaluation fields
     context_mode: str = "explicit"  # "explicit" | "implicit"
+    framework: str | None = None  # Case framework (rails, django, ...)
     fix_score: float = 0.0  # 0.0-1.0 fix suggestion quality
     fix_correct: bool = False  # Whether fix matches expected implementation
     fix_validation_passed: list[str] | None = None  # Which validation rules passed
     fix_validation_failed: list[str] | None = None  # Which validation rules failed
+    # Judge call reliability
+    judge_attempts: int | None = None  # Judge API attempts (None = no judge call)
+    judge_retry_time: float | None = None  # Seconds spent on failed attempts and backoff
 
 
 @dataclass
@@ -297,38 +403,120 @@ def extract_json(text: str) -> dict[str, Any] | None:
     return None
 
 
-def load_meta(case_id: str, cases_dir: Path | None = None) -> dict[str, Any]:
+def find_case(case_id: str, cases_dir: Path | None = None, framework: str | None = None) -> CaseRecord:
+    """Look up a case in the (framework, case_id) index of the case corpus.
+
+    Meta, rubric and expected critique are loaded together, once per cases
+    directory.
+
+    Raises:
+        ValueError: If the case does not exist or its case_id is not unique
+    """
+    record = get_corpus(cases_dir or CASES_DIR).find(case_id, framework)
+    if record is None:
+        raise ValueError(f"Case not found: {case_id}")
+    return record
+
+
+def load_meta(case_id: str, cases_dir: Path | None = None, framework: str | None = None) -> dict[str, Any]:
     """ケースのメタ情報を読み込み"""
-    search_dir = cases_dir or CASES_DIR
-    for meta_file in search_dir.rglob("meta.json"):
-        meta = json.loads(meta_file.read_text())
-        if meta["case_id"] == case_id:
-            return meta
-    raise ValueError(f"Case not found: {case_id}")
+    return thaw(find_case(case_id, cases_dir, framework).meta)
 
 
-def load_rubric(case_id: str, cases_dir: Path | None = None) -> dict[str, Any] | None:
+def load_rubric(case_id: str, cases_dir: Path | None = None, framework: str | None = None) -> dict[str, Any] | None:
     """ケースのルーブリックを読み込み（存在する場合）"""
-    search_dir = cases_dir or CASES_DIR
-    for meta_file in search_dir.rglob("meta.json"):
-        meta = json.loads(meta_file.read_text())
-        if meta["case_id"] == case_id:
-            rubric_file = meta_file.parent / "rubric.json"
-            if rubric_file.exists():
-                return json.loads(rubric_file.read_text())
-    return None
+    record = get_corpus(cases_dir or CASES_DIR).find(case_id, framework)
+    if record is None or record.rubric is None:
+        return None
+    return thaw(record.rubric)
 
 
-def load_expected_critique(case_id: str, cases_dir: Path | None = None) -> str | None:
+def load_expected_critique(case_id: str, cases_dir: Path | None = None, framework: str | None = None) -> str | None:
     """Load the expected critique markdown file for a case."""
-    search_dir = cases_dir or CASES_DIR
-    for meta_file in search_dir.rglob("meta.json"):
-        meta = json.loads(meta_file.read_text())
-        if meta["case_id"] == case_id:
-            critique_file = meta_file.parent / "expected_critique.md"
-            if critique_file.exists():
-                return critique_file.read_text()
-    return None
+    record = get_corpus(cases_dir or CASES_DIR).find(case_id, framework)
+    return record.expected_critique if record else None
+
+
+def call_judge_model(client: Any, prompt: str) -> tuple[str, int, int, float, CallStats]:
+    """Call the single-mode judge model under its rate limiter and the retry policy.
+
+    With ``--provider replay:<run_dir>`` the recorded response is returned
+    instead and with ``--provider simulate`` a synthetic one (``client`` may
+    be None in both cases); with ``--provider record`` the response is
+    appended to the run's judge recordings.
+
+    Args:
+        client: Anthropic client
+        prompt: Fully rendered judge prompt
+
+    Returns:
+        Tuple of (response_text, input_tokens, output_tokens, elapsed_time, call_stats)
+    """
+    replay = get_judge_replay()
+    if replay is not None:
+        entry = replay.replay(JUDGE_MODEL, prompt)
+        return (
+            entry["response"], entry["input_tokens"], entry["output_tokens"], entry["elapsed_time"],
+            CallStats(attempts=1),
+        )
+
+    judge_config = get_judge_config(DEFAULT_JUDGE)
+    cache = get_judge_cache()
+    # No temperature is sent, so it is not part of the key
+    key = judge_cache_key(JUDGE_MODEL, None, JUDGE_MAX_TOKENS, prompt) if cache else None
+    cached = cache.get(key) if cache else None
+    if cached is not None:
+        return (
+            cached["response"], cached["input_tokens"], cached["output_tokens"], cached["elapsed_time"],
+            CallStats(cache_hit=True),
+        )
+
+    limiter = get_rate_limiter(
+        JUDGE_MODEL,
+        requests_per_minute=judge_config.requests_per_minute,
+        tokens_per_minute=judge_config.tokens_per_minute,
+    )
+    simulator = get_simulator()
+
+    def request() -> tuple[str, int, int, float]:
+        with limiter.reserve(estimate_tokens(prompt)) as reservation:
+            if simulator is not None:
+                response = simulator.judge(DEFAULT_JUDGE, prompt)
+            else:
+                start_time = time.time()
+                message = client.messages.create(
+                    model=JUDGE_MODEL,
+                    max_tokens=JUDGE_MAX_TOKENS,
+                    messages=[{"role": "user", "content": prompt}],
+                )
+                response = (
+                    message.content[0].text,
+                    message.usage.input_tokens,
+                    message.usage.output_tokens,
+                    time.time() - start_time,
+                )
+            reservation.actual_tokens = response[1] + response[2]
+        return response
+
+    (response_text, input_tokens, output_tokens, elapsed_time), call_stats = (
+        get_retry_policy().call(request, key=DEFAULT_JUDGE)
+    )
+    if simulator is None:
+        record_judge_response(JUDGE_MODEL, prompt, response_text, input_tokens, output_tokens, elapsed_time)
+    # A response that does not parse would replay as a permanent failed score
+    if cache and extract_json(response_text) is not None:
+        cache.put(key, {
+            "model_id": JUDGE_MODEL,
+            "response": response_text,
+            "input_tokens": input_tokens,
+            "output_tokens": output_tokens,
+            "elapsed_time": elapsed_time,
+            "cost": (
+                input_tokens * JUDGE_INPUT_COST_PER_1M / 1_000_000
+                + output_tokens * JUDGE_OUTPUT_COST_PER_1M / 1_000_000
+            ),
+        })
+    return response_text, input_tokens, output_tokens, elapsed_time, call_stats
 
 
 def evaluate_fix_suggestion(
@@ -547,20 +735,13 @@ def evaluate_with_semantic_judge(
     )
 
     # Call judge model
-    start_time = time.time()
-    message = client.messages.create(
-        model=JUDGE_MODEL,
-        max_tokens=1024,
-        messages=[{"role": "user", "content": prompt}],
-    )
-    elapsed_time = time.time() - start_time
-
-    response_text = message.content[0].text
+    response_text, input_tokens, output_tokens, elapsed_time, call_stats = call_judge_model(client, prompt)
     parsed = extract_json(response_text)
 
-    cost = (
-        message.usage.input_tokens * JUDGE_INPUT_COST_PER_1M / 1_000_000
-        + message.usage.output_tokens * JUDGE_OUTPUT_COST_PER_1M / 1_000_000
+    # A cached response was paid for by an earlier evaluation
+    cost = 0.0 if call_stats.cache_hit else (
+        input_tokens * JUDGE_INPUT_COST_PER_1M / 1_000_000
+        + output_tokens * JUDGE_OUTPUT_COST_PER_1M / 1_000_000
     )
 
     if parsed:
@@ -603,6 +784,8 @@ def evaluate_with_semantic_judge(
             "minor_count": minor_count,
             "judge_cost": cost,
             "judge_time": elapsed_time,
+            "judge_attempts": call_stats.attempts,
+            "judge_retry_time": call_stats.retry_time,
             # Semantic-specific fields
             "evaluation_mode": "semantic",
             "semantic_score": score,
@@ -626,6 +809,8 @@ def evaluate_with_semantic_judge(
             "minor_count": 0,
             "judge_cost": cost,
             "judge_time": elapsed_time,
+            "judge_attempts": call_stats.attempts,
+            "judge_retry_time": call_stats.retry_time,
             "evaluation_mode": "semantic",
             "semantic_score": 1,
             "essential_finding_captured": False,
@@ -657,20 +842,13 @@ def judge_review(
         review_result=review_json,
     )
 
-    start_time = time.time()
-    message = client.messages.create(
-        model=JUDGE_MODEL,
-        max_tokens=1024,
-        messages=[{"role": "user", "content": prompt}],
-    )
-    elapsed_time = time.time() - start_time
-
-    response_text = message.content[0].text
+    response_text, input_tokens, output_tokens, elapsed_time, call_stats = call_judge_model(client, prompt)
     parsed = extract_json(response_text)
 
-    cost = (
-        message.usage.input_tokens * JUDGE_INPUT_COST_PER_1M / 1_000_000
-        + message.usage.output_tokens * JUDGE_OUTPUT_COST_PER_1M / 1_000_000
+    # A cached response was paid for by an earlier evaluation
+    cost = 0.0 if call_stats.cache_hit else (
+        input_tokens * JUDGE_INPUT_COST_PER_1M / 1_000_000
+        + output_tokens * JUDGE_OUTPUT_COST_PER_1M / 1_000_000
     )
 
     if parsed:
@@ -682,6 +860,8 @@ def judge_review(
             "reasoning": parsed.get("reasoning", ""),
             "judge_cost": cost,
             "judge_time": elapsed_time,
+            "judge_attempts": call_stats.attempts,
+            "judge_retry_time": call_stats.retry_time,
         }
     else:
         return {
@@ -692,6 +872,8 @@ def judge_review(
             "reasoning": f"Failed to parse judge response: {response_text[:200]}",
             "judge_cost": cost,
             "judge_time": elapsed_time,
+            "judge_attempts": call_stats.attempts,
+            "judge_retry_time": call_stats.retry_time,
         }
 
 
@@ -786,6 +968,605 @@ def evaluate_without_judge(
     }
 
 
+# Evaluation methods that call a judge model (and spend budget)
+JUDGE_METHODS = ("semantic", "ensemble", "judge")
+
+
+@dataclass
+class EvaluationJob:
+    """One result to score, in report order."""
+    model: str
+    framework: str
+    index: int  # 1-based position in the model's result file
+    total: int
+    result: dict[str, Any]
+    case: CaseRecord
+    method: str  # "semantic" | "ensemble" | "rubric" | "judge" | "severity" | "semantic-skipped"
+    key: str = ""  # evaluation_key within the model
+    fingerprint: str = ""  # evaluation_fingerprint of the job's inputs
+    cached: "JobOutcome | None" = None  # Outcome reused from evaluation_cache.json
+
+
+@dataclass
+class JobOutcome:
+    """Result of an EvaluationJob."""
+    evaluation: EvaluationResult | None
+    judge_cost: float = 0.0
+    ensemble_detail: dict[str, Any] | None = None
+    line: str = ""
+    # Ensemble judges that timed out but are still running; not in judge_cost
+    late_judges: list[Future] = field(default_factory=list)
+
+
+def select_method(result: dict[str, Any], case: CaseRecord, skip_judge: bool, use_ensemble: bool) -> str:
+    """Pick how a result is scored.
+
+    Priority: semantic > rubric > judge > severity.
+    """
+    evaluation_mode = result.get("evaluation_mode", case.meta.get("evaluation_mode", "severity"))
+    if case.expected_critique and evaluation_mode == "semantic":
+        if skip_judge:
+            return "semantic-skipped"
+        return "ensemble" if use_ensemble else "semantic"
+    if case.rubric and evaluation_mode == "rubric":
+        return "rubric"
+    return "severity" if skip_judge else "judge"
+
+
+def estimate_judge_cost(method: str, judge_names: list[str]) -> float:
+    """Up-front cost estimate for one judge evaluation (average-size prompt)."""
+    judges = judge_names if method == "ensemble" else [DEFAULT_JUDGE]
+    return estimate_ensemble_cost(judges, case_count=1)["total"]
+
+
+# Evaluations kept between evaluator runs, in the run directory
+EVALUATION_CACHE_FILE = "evaluation_cache.json"
+EVALUATION_CACHE_VERSION = 2
+
+# Result fields scoring reads. Timing, cost, retry and cache fields written by the
+# runner change on every re-run of the same review and are not fingerprinted.
+FINGERPRINT_RESULT_FIELDS = ("case_id", "context_mode", "evaluation_mode", "raw_response", "parsed_response")
+
+
+def evaluation_key(framework: str, result: dict[str, Any]) -> str:
+    """Identity of a result within a model's results (framework, case_id, context mode)."""
+    return f"{framework}/{result.get('case_id', 'unknown')}/{result.get('context_mode', 'explicit')}"
+
+
+@functools.cache
+def scoring_source_hash(method: str) -> str:
+    """Hash of the judge prompt templates (or rubric scoring code) a method uses.
+
+    Editing a template changes the hash, so evaluations scored with the old
+    one are not reused.
+    """
+    if method == "judge":
+        sources = [JUDGE_PROMPT_TEMPLATE]
+    elif method == "semantic":
+        sources = [SEMANTIC_JUDGE_PROMPT_TEMPLATE, SEMANTIC_JUDGE_FP_PROMPT_TEMPLATE]
+    elif method == "ensemble":
+        from judges import base as judge_base
+        sources = [judge_base.SEMANTIC_JUDGE_PROMPT_TEMPLATE, judge_base.SEMANTIC_JUDGE_FP_PROMPT_TEMPLATE]
+    elif method == "rubric":
+        sources = [inspect.getsource(evaluate_with_rubric), inspect.getsource(matches_keywords)]
+    else:
+        sources = []
+    return hashlib.sha256("\0".join(sources).encode("utf-8")).hexdigest()
+
+
+def evaluation_fingerprint(
+    result: dict[str, Any],
+    case: CaseRecord,
+    method: str,
+    judge_settings: dict[str, Any] | None,
+) -> str:
+    """Hash of everything an evaluation depends on.
+
+    Args:
+        result: Review result as written by the runner (only FINGERPRINT_RESULT_FIELDS count)
+        case: Case the result belongs to (its content_hash covers the case files)
+        method: Scoring method from ``select_method``
+        judge_settings: Judge model/ensemble settings, None for methods without a judge
+    """
+    payload = json.dumps(
+        {
+            "result": {name: result.get(name) for name in FINGERPRINT_RESULT_FIELDS},
+            "case": case.content_hash,
+            "method": method,
+            "scoring": scoring_source_hash(method),
+            "judge": judge_settings,
+        },
+        sort_keys=True,
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def load_evaluation_cache(run_dir: Path) -> dict[str, dict[str, dict[str, Any]]]:
+    """Previous evaluations by model and evaluation_key ({} if none or unreadable)."""
+    try:
+        data = json.loads((run_dir / EVALUATION_CACHE_FILE).read_text())
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+    if data.get("version") != EVALUATION_CACHE_VERSION:
+        return {}
+    return data.get("models", {})
+
+
+def save_evaluation_cache(run_dir: Path, models: dict[str, dict[str, dict[str, Any]]]) -> None:
+    path = run_dir / EVALUATION_CACHE_FILE
+    path.write_text(json.dumps({"version": EVALUATION_CACHE_VERSION, "models": models}, ensure_ascii=False))
+
+
+def cached_outcome(entry: dict[str, Any] | None, fingerprint: str) -> JobOutcome | None:
+    """Stored outcome for a job, or None if the job's inputs changed since."""
+    if entry is None or entry.get("fingerprint") != fingerprint:
+        return None
+    try:
+        evaluation = EvaluationResult(**entry["evaluation"])
+    except (KeyError, TypeError):
+        # Written by an evaluator with different EvaluationResult fields
+        return None
+    return JobOutcome(evaluation=evaluation, ensemble_detail=entry.get("ensemble_detail"), line=entry.get("line", ""))
+
+
+def cache_entry(job: EvaluationJob, outcome: JobOutcome) -> dict[str, Any]:
+    """evaluation_cache.json entry for a scored job."""
+    return {
+        "fingerprint": job.fingerprint,
+        "evaluation": asdict(outcome.evaluation),
+        "ensemble_detail": outcome.ensemble_detail,
+        "line": outcome.line,
+    }
+
+
+def plan_job(
+    model: str,
+    framework: str,
+    index: int,
+    total: int,
+    result: dict[str, Any],
+    skip_judge: bool,
+    use_ensemble: bool,
+    judge_settings: dict[str, Any],
+    previous: dict[str, dict[str, dict[str, Any]]],
+) -> EvaluationJob:
+    """Job for one successful result, carrying the previous outcome if its inputs are unchanged.
+
+    Raises:
+        ValueError: If the result's case is missing or ambiguous
+    """
+    case = find_case(result.get("case_id", "unknown"), get_cases_dir(framework), framework)
+    method = select_method(result, case, skip_judge, use_ensemble)
+    key = evaluation_key(framework, result)
+    fingerprint = evaluation_fingerprint(result, case, method, judge_settings if method in JUDGE_METHODS else None)
+    return EvaluationJob(
+        model, framework, index, total, result, case, method,
+        key=key,
+        fingerprint=fingerprint,
+        cached=cached_outcome(previous.get(model, {}).get(key), fingerprint),
+    )
+
+
+class JudgeBudget:
+    """Thread-safe judge spend accounting for ``--budget``.
+
+    Each judge evaluation reserves its projected cost before it is issued:
+    the most expensive call of the same method seen so far, or the static
+    estimate before any has finished. A reservation that would take spent
+    plus reserved cost past the limit waits for in-flight calls to settle;
+    once it cannot fit even with nothing in flight, the budget is exhausted
+    and no further reservations are granted.
+    """
+
+    def __init__(self, limit: float | None):
+        self.limit = limit
+        self.spent = 0.0
+        self.reserved = 0.0
+        self.in_flight = 0
+        self.exhausted = False
+        self.skipped = 0
+        self.late_cost = 0.0  # Spent on ensemble judges that finished after their timeout
+        self._largest: dict[str, float] = {}
+        self._condition = threading.Condition()
+
+    def reserve(self, method: str, estimate: float) -> float | None:
+        """Reserve cost for one evaluation, waiting for in-flight calls if needed.
+
+        Returns:
+            The reserved amount, or None if the budget does not allow another call
+        """
+        with self._condition:
+            amount = self._largest.get(method, estimate)
+            if self.limit is not None:
+                while not self.exhausted and self.spent + self.reserved + amount > self.limit:
+                    if self.in_flight == 0:
+                        self.exhausted = True
+                        break
+                    self._condition.wait()
+                    amount = self._largest.get(method, estimate)
+                if self.exhausted:
+                    self.skipped += 1
+                    return None
+            self.reserved += amount
+            self.in_flight += 1
+            return amount
+
+    def settle(self, method: str, reserved: float, actual: float, late: list[Future] | None = None) -> None:
+        """Replace a reservation with the actual cost.
+
+        Ensemble judges that timed out (``late``) are still running and will
+        be billed, so the reservation is held until they finish and their
+        cost is added to spent then.
+        """
+        with self._condition:
+            self.spent += actual
+            if late:
+                self._condition.notify_all()
+            else:
+                self._release(method, reserved, actual)
+                return
+
+        remaining = [len(late)]
+        total = [actual]
+
+        def judge_finished(future: Future) -> None:
+            # A judge that failed after its timeout was not billed for an answer
+            cost = 0.0 if future.cancelled() or future.exception() is not None else future.result().judge_cost
+            with self._condition:
+                self.spent += cost
+                self.late_cost += cost
+                total[0] += cost
+                remaining[0] -= 1
+                if remaining[0] == 0:
+                    self._release(method, reserved, total[0])
+
+        for future in late:
+            future.add_done_callback(judge_finished)
+
+    def _release(self, method: str, reserved: float, actual: float) -> None:
+        """Drop a reservation once its whole cost is in spent (caller holds the lock)."""
+        self.reserved -= reserved
+        self.in_flight -= 1
+        self._largest[method] = max(self._largest.get(method, 0.0), actual)
+        self._condition.notify_all()
+
+
+class OrderedOutput:
+    """Console output that stays in plan order while jobs finish out of order.
+
+    Lines are reserved up front and written once every earlier line is filled.
+    """
+
+    def __init__(self):
+        self._lines: list[str | None] = []
+        self._next = 0
+        self._lock = threading.Lock()
+
+    def reserve(self) -> int:
+        with self._lock:
+            self._lines.append(None)
+            return len(self._lines) - 1
+
+    def fill(self, slot: int, text: str) -> None:
+        with self._lock:
+            self._lines[slot] = text
+            ready = []
+            while self._next < len(self._lines) and self._lines[self._next] is not None:
+                ready.append(self._lines[self._next])
+                self._next += 1
+            if ready:
+                sys.stdout.write("".join(line + "\n" for line in ready))
+                sys.stdout.flush()
+
+    def emit(self, text: str) -> None:
+        self.fill(self.reserve(), text)
+
+
+def evaluate_job(
+    job: EvaluationJob,
+    client: Any,
+    ensemble_judge: "EnsembleJudge | None",
+    verbose: bool = False,
+) -> JobOutcome:
+    """Score one result with the method chosen by ``select_method``."""
+    result = job.result
+    meta = thaw(job.case.meta)
+    expected_detection = meta.get("expected_detection", True)
+    ensemble_detail = None
+    late_judges: list[Future] = []
+    note = ""
+
+    if job.method == "semantic-skipped":
+        note = "(semantic requires judge) "
+        judge_result = evaluate_without_judge(result, meta)
+    elif job.method == "ensemble":
+        ensemble_result = ensemble_judge.evaluate_semantic(result, job.case.expected_critique, expected_detection)
+        judge_result = ensemble_result.to_judge_result_dict()
+        ensemble_detail = {"case_id": job.case.case_id, **ensemble_result.to_dict()}
+        late_judges = list(ensemble_result.late_judges.values())
+        consensus_str = "consensus" if ensemble_result.consensus else "split"
+        note = f"(ensemble: mean={ensemble_result.mean_score:.1f}, {consensus_str}) "
+    elif job.method == "semantic":
+        judge_result = evaluate_with_semantic_judge(result, job.case.expected_critique, expected_detection, client)
+        note = "(semantic) "
+    elif job.method == "rubric":
+        judge_result = evaluate_with_rubric(result, thaw(job.case.rubric), expected_detection)
+        note = "(rubric) "
+    elif job.method == "severity":
+        judge_result = evaluate_without_judge(result, meta)
+    else:
+        judge_result = judge_review(result, meta, client)
+
+    # AIのレビュー結果を取得
+    parsed = result.get("parsed_response")
+    review_has_issues = parsed.get("has_issues") if parsed else None
+    review_issue_count = len(parsed.get("issues", [])) if parsed else 0
+
+    # Collect all suggestions from issues for fix suggestion evaluation
+    all_suggestions = ""
+    if parsed and parsed.get("issues"):
+        for issue in parsed["issues"]:
+            suggestion = issue.get("suggestion", "")
+            if suggestion:
+                all_suggestions += suggestion + "\n"
+
+    fix_score, fix_correct, fix_passed, fix_failed = evaluate_fix_suggestion(
+        all_suggestions, meta.get("fix_validation")
+    )
+
+    evaluation = EvaluationResult(
+        case_id=job.case.case_id,
+        category=meta.get("category", "unknown"),
+        difficulty=meta.get("difficulty", "unknown"),
+        model=job.model,
+        expected_detection=expected_detection,
+        detected=judge_result.get("detected", False),
+        detection_score=judge_result.get("detection_score", 0.0),
+        highest_severity=judge_result.get("highest_severity"),
+        accuracy=judge_result.get("accuracy", 0),
+        noise_count=judge_result.get("noise_count", 0),
+        correct_location=judge_result.get("correct_location", False),
+        reasoning=judge_result.get("reasoning", ""),
+        review_has_issues=review_has_issues,
+        review_issue_count=review_issue_count,
+        critical_count=judge_result.get("critical_count", 0),
+        major_count=judge_result.get("major_count", 0),
+        minor_count=judge_result.get("minor_count", 0),
+        # Semantic evaluation fields
+        evaluation_mode=judge_result.get("evaluation_mode", "severity"),
+        semantic_score=judge_result.get("semantic_score"),
+        essential_finding_captured=judge_result.get("essential_finding_captured"),
+        severity_aligned=judge_result.get("severity_aligned"),
+        suggestion_quality=judge_result.get("suggestion_quality"),
+        key_points_matched=judge_result.get("key_points_matched"),
+        key_points_missed=judge_result.get("key_points_missed"),
+        # Dual mode / Fix evaluation fields
+        context_mode=result.get("context_mode", "explicit"),
+        framework=job.framework,
+        fix_score=fix_score,
+        fix_correct=fix_correct,
+        fix_validation_passed=fix_passed if fix_passed else None,
+        fix_validation_failed=fix_failed if fix_failed else None,
+        judge_attempts=judge_result.get("judge_attempts"),
+        judge_retry_time=judge_result.get("judge_retry_time"),
+    )
+
+    severity_str = evaluation.highest_severity or "None"
+    status = "✓" if evaluation.detected else "✗"
+    line = f"{note}{status} [{severity_str}] (score={evaluation.detection_score:.1f})"
+    if verbose and evaluation.reasoning:
+        line += f"\n       Reason: {evaluation.reasoning[:100]}..."
+    return JobOutcome(
+        evaluation=evaluation,
+        judge_cost=judge_result.get("judge_cost", 0) if job.method in JUDGE_METHODS else 0.0,
+        ensemble_detail=ensemble_detail,
+        line=line,
+        late_judges=late_judges,
+    )
+
+
+# --follow: seconds between checks of the run directory
+FOLLOW_POLL_SECONDS = 1.0
+
+
+class CheckpointTail:
+    """Results appended to a runner ``{model}.jsonl`` checkpoint since the last read."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.offset = 0
+        self.lines = 0
+
+    def read(self) -> tuple[list[dict[str, Any]], bool]:
+        """Read complete new lines.
+
+        Returns:
+            Tuple of (new results, truncated). ``truncated`` is True when the
+            file was rewritten from the start (runner restarted without --resume).
+        """
+        try:
+            size = self.path.stat().st_size
+        except FileNotFoundError:
+            return [], False
+        truncated = size < self.offset
+        if truncated:
+            self.offset = 0
+            self.lines = 0
+        with self.path.open("rb") as f:
+            f.seek(self.offset)
+            data = f.read()
+        # A line without its newline is still being written
+        end = data.rfind(b"\n") + 1
+        self.offset += end
+        results = []
+        for line in data[:end].splitlines():
+            try:
+                results.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+        self.lines += len(results)
+        return results, truncated
+
+
+def run_finished(run_dir: Path) -> bool:
+    """Whether the runner has finished the run in ``run_dir``.
+
+    The runner marks the run "running" in RUN_STATUS_FILE as soon as it
+    starts (including ``--resume``) and "complete" after writing
+    summary.json. Run directories without the file (older runners, merged
+    shards) count as finished once summary.json is newer than every
+    checkpoint.
+    """
+    try:
+        return json.loads((run_dir / RUN_STATUS_FILE).read_text()).get("status") == "complete"
+    except FileNotFoundError:
+        pass
+    except (json.JSONDecodeError, AttributeError):
+        return False
+    summary_file = run_dir / "summary.json"
+    if not summary_file.exists():
+        return False
+    written = summary_file.stat().st_mtime
+    return all(path.stat().st_mtime <= written for path in run_dir.glob("*.jsonl"))
+
+
+def live_metrics(evaluations: dict[str, dict[str, EvaluationResult]]) -> str:
+    """Recall, weighted recall and Case-FPR per model over the evaluations so far."""
+    lines = [f"\n--- Live metrics ({datetime.now():%H:%M:%S}) ---"]
+    for model, by_key in sorted(evaluations.items()):
+        evals = list(by_key.values())
+        metrics = calculate_metrics(evals)
+        line = (
+            f"  {model}: {len(evals)} evaluated | Recall {metrics.recall:.1%} "
+            f"({metrics.true_positives}/{metrics.bug_cases}) | Weighted Recall {metrics.weighted_recall:.1%}"
+        )
+        if JUDGES_AVAILABLE:
+            fp_metrics = calculate_fp_metrics(evals)
+            line += f" | Case-FPR {fp_metrics.case_fpr:.1%} ({fp_metrics.fp_cases_with_critical}/{fp_metrics.total_fp_cases})"
+        lines.append(line)
+    if len(lines) == 1:
+        lines.append("  (no evaluations yet)")
+    return "\n".join(lines)
+
+
+def follow_run(
+    run_dir: Path,
+    default_framework: str,
+    plan: Callable[[str, str, int, dict[str, Any]], EvaluationJob],
+    evaluate: Callable[[EvaluationJob], JobOutcome],
+    concurrency: int,
+    metrics_interval: float,
+) -> dict[str, Any]:
+    """Judge results while the runner is still writing them.
+
+    Tails every ``{model}.jsonl`` checkpoint in ``run_dir`` and evaluates each
+    new result as soon as it is appended, printing live metrics every
+    ``metrics_interval`` seconds. Returns when the runner has written
+    summary.json (or on Ctrl-C). New evaluations are merged into
+    evaluation_cache.json, so the regular evaluation that follows reuses them.
+
+    Args:
+        run_dir: Runner output directory
+        default_framework: Framework of untagged ``{model}.jsonl`` checkpoints
+        plan: Builds the job for (model, framework, line number, result);
+            raises ValueError for results that cannot be evaluated
+        evaluate: Scores a job (judge budget included)
+        concurrency: Evaluations in flight at once
+        metrics_interval: Seconds between live metric updates
+
+    Returns:
+        Counts for metrics.json ``_meta.follow``
+    """
+    tails: dict[str, CheckpointTail] = {}
+    evaluations: dict[str, dict[str, EvaluationResult]] = {}
+    latest: dict[str, dict[str, str]] = {}  # model -> evaluation_key -> fingerprint of the newest result
+    entries: dict[str, dict[str, dict[str, Any]]] = {}
+    counts = {"results": 0, "evaluated": 0, "reused": 0}
+    lock = threading.Lock()
+
+    def done(job: EvaluationJob, outcome: JobOutcome) -> None:
+        with lock:
+            if latest.get(job.model, {}).get(job.key) != job.fingerprint:
+                return  # A newer result for the same run arrived meanwhile
+            if outcome.evaluation is not None:
+                evaluations.setdefault(job.model, {})[job.key] = outcome.evaluation
+                if job.cached is None:
+                    entries.setdefault(job.model, {})[job.key] = cache_entry(job, outcome)
+            cached = "(cached) " if job.cached is not None else ""
+            print(f"{job.model} {job.case.case_id} ({job.result.get('context_mode', 'explicit')}) ... "
+                  f"{cached}{outcome.line}", flush=True)
+
+    def run(job: EvaluationJob) -> None:
+        try:
+            outcome = evaluate(job)
+        except Exception as e:
+            outcome = JobOutcome(evaluation=None, line=f"ERROR ({e})")
+        done(job, outcome)
+
+    print(f"Following {run_dir} (Ctrl-C to stop and report)")
+    started = time.time()
+    last_report = started
+    futures = []
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        try:
+            while True:
+                # Checked before reading so lines written just before summary.json are picked up
+                finished = run_finished(run_dir)
+                for path in sorted(run_dir.glob("*.jsonl")):
+                    if path.name == JUDGE_RECORDINGS_FILE:
+                        continue
+                    model = path.stem
+                    tail = tails.setdefault(model, CheckpointTail(path))
+                    results, truncated = tail.read()
+                    if truncated:
+                        with lock:
+                            evaluations.pop(model, None)
+                            latest.pop(model, None)
+                    first_line = tail.lines - len(results) + 1
+                    framework = model.partition(".")[2] or default_framework
+                    for line_number, result in enumerate(results, first_line):
+                        counts["results"] += 1
+                        key = evaluation_key(framework, result)
+                        if not result.get("success", True):
+                            # A failed attempt replaces any earlier result for the run
+                            with lock:
+                                latest.get(model, {}).pop(key, None)
+                                evaluations.get(model, {}).pop(key, None)
+                            continue
+                        try:
+                            job = plan(model, framework, line_number, result)
+                        except ValueError as e:
+                            print(f"{model} {result.get('case_id', 'unknown')} ... SKIPPED ({e})", flush=True)
+                            continue
+                        with lock:
+                            latest.setdefault(model, {})[job.key] = job.fingerprint
+                        if job.cached is not None:
+                            counts["reused"] += 1
+                            done(job, job.cached)
+                        else:
+                            counts["evaluated"] += 1
+                            futures.append(pool.submit(run, job))
+                if finished:
+                    break
+                if time.time() - last_report >= metrics_interval:
+                    with lock:
+                        print(live_metrics(evaluations), flush=True)
+                    last_report = time.time()
+                time.sleep(FOLLOW_POLL_SECONDS)
+        except KeyboardInterrupt:
+            print("\nStopped following; finishing evaluations in flight")
+        for future in futures:
+            future.result()
+
+    print(live_metrics(evaluations), flush=True)
+    previous = load_evaluation_cache(run_dir)
+    for model, model_entries in entries.items():
+        previous.setdefault(model, {}).update(model_entries)
+    save_evaluation_cache(run_dir, previous)
+    return {**counts, "wall_time": time.time() - started}
+
+
 def calculate_metrics(evaluations: list[EvaluationResult]) -> ModelMetrics:
     """全体の評価指標を計算"""
     if not evaluations:
@@ -812,183 +1593,216 @@ def calculate_metrics(evaluations: list[EvaluationResult]) -> ModelMetrics:
             by_category={},
             by_difficulty={},
         )
+    table = EvaluationTable.from_evaluations(evaluations)
+    return model_metrics(table, np.zeros(len(table), dtype=np.int64), [evaluations[0].model])[0]
 
-    model = evaluations[0].model
 
-    # バグありケース（expected_detection=True）
-    bug_evals = [e for e in evaluations if e.expected_detection]
-    true_positives = sum(1 for e in bug_evals if e.detected)
-    false_negatives = len(bug_evals) - true_positives
+def calculate_metrics_by_model(table: EvaluationTable) -> dict[str, ModelMetrics]:
+    """Metrics for every model in a table, computed in one grouped pass."""
+    return dict(zip(table.model_labels, model_metrics(table, table.model, list(table.model_labels))))
+
+
+def model_metrics(table: EvaluationTable, groups: np.ndarray, models: list[str]) -> list[ModelMetrics]:
+    """ModelMetrics for each group of table rows.
+
+    Every count and sum is a grouped reduction over the whole table; only
+    the final ratios are computed per group.
+
+    Args:
+        table: Evaluations in columnar form
+        groups: Group index of each row (0 .. len(models) - 1)
+        models: Model name of each group
+    """
+    n = len(models)
+
+    def count(mask: np.ndarray | None = None) -> np.ndarray:
+        return group_count(groups, n, mask)
+
+    def total(values: np.ndarray, mask: np.ndarray | None = None) -> np.ndarray:
+        return group_sum(groups, n, values, mask)
+
+    def breakdown(codes: np.ndarray, labels: tuple[str, ...]) -> dict[str, np.ndarray]:
+        # Counts and sums per (group, label), shaped (n, len(labels))
+        keys = groups * len(labels) + codes
+        size = n * len(labels)
+        return {
+            "total": np.bincount(keys, minlength=size).reshape(n, -1),
+            "detected": np.bincount(keys[table.detected], minlength=size).reshape(n, -1),
+            "detection_score": np.bincount(keys, weights=table.detection_score, minlength=size).reshape(n, -1),
+            "accuracy": np.bincount(keys, weights=table.accuracy, minlength=size).reshape(n, -1),
+        }
+
+    # バグありケース（expected_detection=True）/ バグなしケース（expected_detection=False）
+    bug = table.expected_detection
+    clean = ~bug
+    detected_bug = bug & table.detected
+    totals = count()
+    bug_cases = count(bug)
+    true_positives = count(detected_bug)
+    clean_cases = count(clean)
+    true_negatives = count(clean & table.detected)  # detected=True means correctly identified as clean
 
     # Severity別検出カウント（バグケースのみ）
-    critical_detections = sum(1 for e in bug_evals if e.highest_severity == "critical")
-    major_detections = sum(1 for e in bug_evals if e.highest_severity == "major")
-    minor_detections = sum(1 for e in bug_evals if e.highest_severity == "minor")
-
-    # 重み付きRecall計算
-    total_detection_score = sum(e.detection_score for e in bug_evals)
-    weighted_recall = total_detection_score / len(bug_evals) if bug_evals else 0.0
-
-    # バグなしケース（expected_detection=False）
-    clean_evals = [e for e in evaluations if not e.expected_detection]
-    true_negatives = sum(1 for e in clean_evals if e.detected)  # detected=True means correctly identified as clean
-    false_positives = len(clean_evals) - true_negatives
-
-    # 指標計算
-    recall = true_positives / len(bug_evals) if bug_evals else 0.0
-    precision = true_positives / (true_positives + false_positives) if (true_positives + false_positives) > 0 else 0.0
-    fpr = false_positives / len(clean_evals) if clean_evals else 0.0
-    f1 = 2 * precision * recall / (precision + recall) if (precision + recall) > 0 else 0.0
-
-    # 平均検出スコア（全ケース）
-    avg_detection_score = sum(e.detection_score for e in evaluations) / len(evaluations)
-
-    # カテゴリ別集計
-    by_category: dict[str, dict[str, Any]] = {}
-    categories = set(e.category for e in evaluations)
-    for cat in categories:
-        cat_evals = [e for e in evaluations if e.category == cat]
-        if cat_evals:
-            by_category[cat] = {
-                "total": len(cat_evals),
-                "detected": sum(1 for e in cat_evals if e.detected),
-                "detection_score_avg": sum(e.detection_score for e in cat_evals) / len(cat_evals),
-                "accuracy_avg": sum(e.accuracy for e in cat_evals) / len(cat_evals),
-            }
+    severity_detections = {
+        severity: count(bug & (table.highest_severity == code)) for severity, code in SEVERITY_CODES.items()
+    }
 
-    # 難易度別集計
-    by_difficulty: dict[str, dict[str, Any]] = {}
-    for diff in ["easy", "medium", "hard"]:
-        diff_evals = [e for e in evaluations if e.difficulty == diff]
-        if diff_evals:
-            by_difficulty[diff] = {
-                "total": len(diff_evals),
-                "detected": sum(1 for e in diff_evals if e.detected),
-                "detection_score_avg": sum(e.detection_score for e in diff_evals) / len(diff_evals),
-                "accuracy_avg": sum(e.accuracy for e in diff_evals) / len(diff_evals),
-            }
+    detection_score_bug = total(table.detection_score, bug)
+    detection_score_all = total(table.detection_score)
+    accuracy_all = total(table.accuracy)
+    noise_all = total(table.noise_count)
 
     # Semantic evaluation metrics
-    semantic_evals = [e for e in evaluations if e.evaluation_mode == "semantic" and e.semantic_score is not None]
-    semantic_cases = len(semantic_evals)
-    avg_semantic_score = (
-        sum(e.semantic_score for e in semantic_evals) / semantic_cases
-        if semantic_cases > 0 else 0.0
-    )
-    essential_finding_rate = (
-        sum(1 for e in semantic_evals if e.essential_finding_captured) / semantic_cases
-        if semantic_cases > 0 else 0.0
-    )
-    severity_alignment_rate = (
-        sum(1 for e in semantic_evals if e.severity_aligned) / semantic_cases
-        if semantic_cases > 0 else 0.0
-    )
+    semantic_cases = count(table.semantic)
+    semantic_score = total(table.semantic_score, table.semantic)
+    essential_found = count(table.semantic & table.essential_finding_captured)
+    severity_aligned = count(table.semantic & table.severity_aligned)
 
     # Fix evaluation metrics
-    detected_evals = [e for e in bug_evals if e.detected]
-    fix_accuracy = (
-        sum(1 for e in detected_evals if e.fix_correct) / len(detected_evals)
-        if detected_evals else 0.0
-    )
-    avg_fix_score = (
-        sum(e.fix_score for e in detected_evals) / len(detected_evals)
-        if detected_evals else 0.0
-    )
+    fix_correct = count(detected_bug & table.fix_correct)
+    fix_score = total(table.fix_score, detected_bug)
+
+    # カテゴリ別 / 難易度別
+    by_category_columns = breakdown(table.category, table.category_labels)
+    by_difficulty_columns = breakdown(table.difficulty, table.difficulty_labels)
 
     # Dual mode metrics (explicit vs implicit comparison)
-    explicit_evals = [e for e in evaluations if e.context_mode == "explicit"]
-    implicit_evals = [e for e in evaluations if e.context_mode == "implicit"]
-
-    explicit_recall: float | None = None
-    implicit_recall: float | None = None
-    inference_gap: float | None = None
-    by_context_mode: dict[str, dict[str, Any]] | None = None
-
-    # Only calculate if both modes have data
-    if explicit_evals and implicit_evals:
-        explicit_bug_evals = [e for e in explicit_evals if e.expected_detection]
-        implicit_bug_evals = [e for e in implicit_evals if e.expected_detection]
-
-        if explicit_bug_evals:
-            explicit_tp = sum(1 for e in explicit_bug_evals if e.detected)
-            explicit_recall = explicit_tp / len(explicit_bug_evals)
-
-        if implicit_bug_evals:
-            implicit_tp = sum(1 for e in implicit_bug_evals if e.detected)
-            implicit_recall = implicit_tp / len(implicit_bug_evals)
-
-        if explicit_recall is not None and implicit_recall is not None:
-            inference_gap = explicit_recall - implicit_recall
-
-        by_context_mode = {
-            "explicit": {
-                "total": len(explicit_evals),
-                "bug_cases": len(explicit_bug_evals),
-                "detected": sum(1 for e in explicit_bug_evals if e.detected) if explicit_bug_evals else 0,
-                "recall": explicit_recall,
-                "fix_accuracy": (
-                    sum(1 for e in explicit_bug_evals if e.detected and e.fix_correct) /
-                    sum(1 for e in explicit_bug_evals if e.detected)
-                    if sum(1 for e in explicit_bug_evals if e.detected) > 0 else 0.0
-                ),
-            },
-            "implicit": {
-                "total": len(implicit_evals),
-                "bug_cases": len(implicit_bug_evals),
-                "detected": sum(1 for e in implicit_bug_evals if e.detected) if implicit_bug_evals else 0,
-                "recall": implicit_recall,
-                "fix_accuracy": (
-                    sum(1 for e in implicit_bug_evals if e.detected and e.fix_correct) /
-                    sum(1 for e in implicit_bug_evals if e.detected)
-                    if sum(1 for e in implicit_bug_evals if e.detected) > 0 else 0.0
-                ),
-            },
+    by_mode = {}
+    for mode in ("explicit", "implicit"):
+        in_mode = table.label_mask("context_mode", mode)
+        by_mode[mode] = {
+            "total": count(in_mode),
+            "bug_cases": count(in_mode & bug),
+            "detected": count(in_mode & detected_bug),
+            "fixed": count(in_mode & detected_bug & table.fix_correct),
         }
 
-    return ModelMetrics(
-        model=model,
-        total_cases=len(evaluations),
-        bug_cases=len(bug_evals),
-        true_positives=true_positives,
-        false_negatives=false_negatives,
-        clean_cases=len(clean_evals),
-        true_negatives=true_negatives,
-        false_positives=false_positives,
-        recall=recall,
-        weighted_recall=weighted_recall,
-        precision=precision,
-        false_positive_rate=fpr,
-        f1_score=f1,
-        average_accuracy=sum(e.accuracy for e in evaluations) / len(evaluations),
-        average_detection_score=avg_detection_score,
-        total_noise=sum(e.noise_count for e in evaluations),
-        critical_detections=critical_detections,
-        major_detections=major_detections,
-        minor_detections=minor_detections,
-        by_category=by_category,
-        by_difficulty=by_difficulty,
-        # Semantic evaluation metrics
-        semantic_cases=semantic_cases,
-        avg_semantic_score=avg_semantic_score,
-        essential_finding_rate=essential_finding_rate,
-        severity_alignment_rate=severity_alignment_rate,
-        # Fix evaluation metrics
-        fix_accuracy=fix_accuracy,
-        avg_fix_score=avg_fix_score,
-        # Dual mode comparison metrics
-        explicit_recall=explicit_recall,
-        implicit_recall=implicit_recall,
-        inference_gap=inference_gap,
-        by_context_mode=by_context_mode,
-    )
+    def group_breakdown(columns: dict[str, np.ndarray], labels: Iterable[str], label_index: dict[str, int], g: int) -> dict[str, dict[str, Any]]:
+        result: dict[str, dict[str, Any]] = {}
+        for label in labels:
+            j = label_index.get(label)
+            if j is None or not columns["total"][g, j]:
+                continue
+            cases = int(columns["total"][g, j])
+            result[label] = {
+                "total": cases,
+                "detected": int(columns["detected"][g, j]),
+                "detection_score_avg": float(columns["detection_score"][g, j]) / cases,
+                "accuracy_avg": float(columns["accuracy"][g, j]) / cases,
+            }
+        return result
+
+    category_index = {label: j for j, label in enumerate(table.category_labels)}
+    difficulty_index = {label: j for j, label in enumerate(table.difficulty_labels)}
+
+    metrics = []
+    for g, model in enumerate(models):
+        cases = int(totals[g])
+        bugs = int(bug_cases[g])
+        cleans = int(clean_cases[g])
+        tp = int(true_positives[g])
+        tn = int(true_negatives[g])
+        fp = cleans - tn
+
+        # 指標計算
+        recall = tp / bugs if bugs else 0.0
+        precision = tp / (tp + fp) if (tp + fp) > 0 else 0.0
+        f1 = 2 * precision * recall / (precision + recall) if (precision + recall) > 0 else 0.0
+        semantic = int(semantic_cases[g])
+
+        explicit_recall: float | None = None
+        implicit_recall: float | None = None
+        inference_gap: float | None = None
+        by_context_mode: dict[str, dict[str, Any]] | None = None
+
+        # Only calculate if both modes have data
+        if by_mode["explicit"]["total"][g] and by_mode["implicit"]["total"][g]:
+            by_context_mode = {}
+            for mode, columns in by_mode.items():
+                mode_bugs = int(columns["bug_cases"][g])
+                mode_detected = int(columns["detected"][g])
+                mode_recall = mode_detected / mode_bugs if mode_bugs else None
+                by_context_mode[mode] = {
+                    "total": int(columns["total"][g]),
+                    "bug_cases": mode_bugs,
+                    "detected": mode_detected,
+                    "recall": mode_recall,
+                    "fix_accuracy": int(columns["fixed"][g]) / mode_detected if mode_detected > 0 else 0.0,
+                }
+            explicit_recall = by_context_mode["explicit"]["recall"]
+            implicit_recall = by_context_mode["implicit"]["recall"]
+            if explicit_recall is not None and implicit_recall is not None:
+                inference_gap = explicit_recall - implicit_recall
+
+        metrics.append(ModelMetrics(
+            model=model,
+            total_cases=cases,
+            bug_cases=bugs,
+            true_positives=tp,
+            false_negatives=bugs - tp,
+            clean_cases=cleans,
+            true_negatives=tn,
+            false_positives=fp,
+            recall=recall,
+            weighted_recall=float(detection_score_bug[g]) / bugs if bugs else 0.0,
+            precision=precision,
+            false_positive_rate=fp / cleans if cleans else 0.0,
+            f1_score=f1,
+            average_accuracy=float(accuracy_all[g]) / cases if cases else 0.0,
+            average_detection_score=float(detection_score_all[g]) / cases if cases else 0.0,
+            total_noise=int(noise_all[g]),
+            critical_detections=int(severity_detections["critical"][g]),
+            major_detections=int(severity_detections["major"][g]),
+            minor_detections=int(severity_detections["minor"][g]),
+            by_category=group_breakdown(by_category_columns, table.category_labels, category_index, g),
+            by_difficulty=group_breakdown(by_difficulty_columns, ("easy", "medium", "hard"), difficulty_index, g),
+            # Semantic evaluation metrics
+            semantic_cases=semantic,
+            avg_semantic_score=float(semantic_score[g]) / semantic if semantic > 0 else 0.0,
+            essential_finding_rate=int(essential_found[g]) / semantic if semantic > 0 else 0.0,
+            severity_alignment_rate=int(severity_aligned[g]) / semantic if semantic > 0 else 0.0,
+            # Fix evaluation metrics
+            fix_accuracy=int(fix_correct[g]) / tp if tp else 0.0,
+            avg_fix_score=float(fix_score[g]) / tp if tp else 0.0,
+            # Dual mode comparison metrics
+            explicit_recall=explicit_recall,
+            implicit_recall=implicit_recall,
+            inference_gap=inference_gap,
+            by_context_mode=by_context_mode,
+        ))
+    return metrics
+
+
+# Metrics with intervals in report.md (the README replacement criteria)
+CI_REPORT_METRICS = (("recall", "Recall"), ("weighted_recall", "Weighted Recall"), ("case_fpr", "Case-FPR"))
+
+
+def format_interval(interval: list[float] | None, points: bool = False) -> str:
+    """[low, high] as percentages, or percentage points for differences."""
+    if interval is None:
+        return "N/A"
+    if points:
+        return f"[{interval[0] * 100:+.1f}, {interval[1] * 100:+.1f}]"
+    return f"[{interval[0]:.1%}, {interval[1]:.1%}]"
 
 
 def generate_report(
     metrics_by_model: dict[str, ModelMetrics],
     output_dir: Path,
     run_summary: dict[str, Any] | None = None,
+    escalation: dict[str, Any] | None = None,
+    confidence: ConfidenceIntervals | None = None,
+    baseline: str | None = None,
 ) -> None:
-    """Markdownレポートを生成"""
+    """Markdownレポートを生成
+
+    Args:
+        escalation: EnsembleJudge.escalation_stats() when judges were escalated
+        confidence: Bootstrap/Wilson intervals; adds a Recall CI column and a
+            Confidence Intervals section
+        baseline: Model the paired differences are taken against
+    """
+    ci_label = f"{confidence.confidence:.0%} CI" if confidence else ""
     lines = [
         "# AI Code Review Benchmark Report",
         "",
@@ -997,29 +1811,101 @@ def generate_report(
     ]
 
     # サマリーテーブル
-    lines.extend([
-        "## Summary",
-        "",
-        "| Model | Recall | Weighted Recall | FPR | Critical | Major | Minor | Cost |",
-        "|-------|--------|-----------------|-----|----------|-------|-------|------|",
-    ])
+    if confidence:
+        lines.extend([
+            "## Summary",
+            "",
+            f"| Model | Recall | Recall {ci_label} | Weighted Recall | FPR | Critical | Major | Minor | Cost |",
+            f"|-------|--------|{'-' * (len(ci_label) + 9)}|-----------------|-----|----------|-------|-------|------|",
+        ])
+    else:
+        lines.extend([
+            "## Summary",
+            "",
+            "| Model | Recall | Weighted Recall | FPR | Critical | Major | Minor | Cost |",
+            "|-------|--------|-----------------|-----|----------|-------|-------|------|",
+        ])
 
     for model, metrics in metrics_by_model.items():
         cost = "N/A"
         if run_summary:
             for m in run_summary.get("models", []):
-                if m.get("model") == model:
+                # Multi-framework runs have one summary per (model, framework)
+                stem = f"{m.get('model')}.{m['framework']}" if m.get("framework") else m.get("model")
+                if stem == model:
                     cost = f"${m.get('total_cost', 0):.4f}"
                     break
 
+        recall_ci = ""
+        if confidence:
+            interval = confidence.for_model(model)["recall"]["bootstrap"] if model in confidence.models else None
+            recall_ci = f" {format_interval(interval)} |"
         lines.append(
-            f"| {model} | {metrics.recall:.1%} | {metrics.weighted_recall:.1%} | "
+            f"| {model} | {metrics.recall:.1%} |{recall_ci} {metrics.weighted_recall:.1%} | "
             f"{metrics.false_positive_rate:.1%} | "
             f"{metrics.critical_detections} | {metrics.major_detections} | {metrics.minor_detections} | {cost} |"
         )
 
     lines.append("")
 
+    if confidence:
+        lines.extend([
+            "## Confidence Intervals",
+            "",
+            f"Percentile bootstrap over cases ({confidence.resamples} resamples) and Wilson score intervals.",
+            "",
+            f"| Model | Metric | Estimate | Bootstrap {ci_label} | Wilson {ci_label} |",
+            "|-------|--------|----------|----------------|-------------|",
+        ])
+        for model in confidence.models:
+            intervals = confidence.for_model(model)
+            for metric, label in CI_REPORT_METRICS:
+                interval = intervals[metric]
+                estimate = f"{interval['estimate']:.1%}" if interval["estimate"] is not None else "N/A"
+                wilson = format_interval(interval["wilson"]) if metric != "weighted_recall" else "—"
+                lines.append(
+                    f"| {model} | {label} | {estimate} | {format_interval(interval['bootstrap'])} | {wilson} |"
+                )
+        lines.append("")
+
+        if baseline:
+            lines.extend([
+                f"### Paired Differences vs {baseline}",
+                "",
+                "Model minus baseline, resampling the same cases for both models.",
+                "",
+                "| Model | " + " | ".join(f"Δ {label} ({ci_label})" for _, label in CI_REPORT_METRICS) + " |",
+                "|-------|" + "|".join("-" * (len(label) + len(ci_label) + 6) for _, label in CI_REPORT_METRICS) + "|",
+            ])
+            for model in confidence.models:
+                if model == baseline:
+                    continue
+                difference = confidence.difference(model, baseline)
+                cells = []
+                for metric, _ in CI_REPORT_METRICS:
+                    estimate = difference[metric]["estimate"]
+                    cells.append(
+                        f"{estimate * 100:+.1f}pp {format_interval(difference[metric]['bootstrap'], points=True)}"
+                        if estimate is not None else "N/A"
+                    )
+                lines.append(f"| {model} | " + " | ".join(cells) + " |")
+            lines.append("")
+
+    if escalation:
+        reasons = ", ".join(f"{kind}: {count}" for kind, count in sorted(escalation["escalation_reasons"].items()))
+        lines.extend([
+            "## Judge Escalation",
+            "",
+            f"- Primary judge: {escalation['primary_judge']} (band: ±{escalation['escalation_band']:g} around 3)",
+            f"- Escalated: {escalation['escalated']}/{escalation['cases']} cases ({escalation['escalation_rate']:.1%})"
+            + (f" — {reasons}" if reasons else ""),
+            (
+                f"- Judge cost: ${escalation['spent_cost']:.4f}; saved ${escalation['saved_cost']:.4f} "
+                f"({escalation['saved_rate']:.1%}) vs. full ensemble"
+            ),
+            "",
+        ])
+
     # モデル別詳細
     for model, metrics in metrics_by_model.items():
         lines.extend([
@@ -1140,6 +2026,25 @@ def main() -> None:
         default="claude,gemini",
         help="Comma-separated list of judges for ensemble mode (default: claude,gemini)",
     )
+    parser.add_argument(
+        "--ensemble-strategy",
+        choices=["all", "escalate"],
+        default="all",
+        help="Ensemble mode: 'all' calls every judge (default); 'escalate' calls the first judge and "
+             "the others only when its score is near the detection threshold or unparseable",
+    )
+    parser.add_argument(
+        "--escalation-band",
+        type=float,
+        default=1.0,
+        help="With --ensemble-strategy escalate, escalate primary scores within this distance of 3 (default: 1 = scores 2-4)",
+    )
+    parser.add_argument(
+        "--judge-timeout",
+        type=float,
+        default=0.0,
+        help="Seconds to wait for each ensemble judge before dropping it from the case (default: 0 = no limit)",
+    )
     parser.add_argument(
         "--dry-run-cost",
         action="store_true",
@@ -1151,41 +2056,155 @@ def main() -> None:
         default=None,
         help="Maximum budget in dollars. Stop if exceeded.",
     )
+    parser.add_argument(
+        "--bootstrap-resamples",
+        type=int,
+        default=10_000,
+        help="Bootstrap resamples for metric confidence intervals (default: 10000, 0 = no intervals)",
+    )
+    parser.add_argument(
+        "--ci-level",
+        type=float,
+        default=0.95,
+        help="Confidence level of the intervals (default: 0.95)",
+    )
+    parser.add_argument(
+        "--ci-baseline",
+        default=None,
+        help="Model the report compares every other model against (default: first model with 'sonnet' in its name)",
+    )
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help=f"Re-evaluate every result instead of reusing unchanged evaluations from {EVALUATION_CACHE_FILE}",
+    )
+    parser.add_argument(
+        "--follow",
+        action="store_true",
+        help="Judge results while runner.py is still writing them to RUN_DIR, then evaluate as usual",
+    )
+    parser.add_argument(
+        "--follow-interval",
+        type=float,
+        default=30.0,
+        help="Seconds between live metric updates with --follow (default: 30)",
+    )
+    parser.add_argument(
+        "--judge-concurrency",
+        type=int,
+        default=1,
+        help="Judge evaluations to run in parallel across cases and models (default: 1). "
+             "With --budget, the projected cost of in-flight calls is reserved before they start",
+    )
+    parser.add_argument(
+        "--provider",
+        default="live",
+        metavar="{live,record,replay:RUN_DIR}",
+        help="live (default), record (save judge responses to RUN_DIR/judge_recordings.jsonl), "
+             "replay:RUN_DIR (serve judge responses recorded in that run without API calls), "
+             "or simulate[:PROFILES_JSON] (synthetic judge with configurable latency and errors)",
+    )
+    parser.add_argument(
+        "--replay-latency",
+        type=float,
+        nargs="?",
+        const=1.0,
+        metavar="SCALE",
+        help="When replaying, sleep for the recorded judge elapsed_time (optionally scaled)",
+    )
+    parser.add_argument(
+        "--max-attempts",
+        type=int,
+        default=3,
+        help="Attempts per judge call; transient errors (429, 5xx, timeouts) are retried with backoff (default: 3)",
+    )
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=120.0,
+        help="Seconds before a single judge attempt is abandoned and retried (default: 120, 0 = no timeout)",
+    )
+    parser.add_argument(
+        "--deadline",
+        type=float,
+        default=600.0,
+        help="Seconds allowed per judge call including retries (default: 600, 0 = no deadline)",
+    )
+    parser.add_argument(
+        "--hedge",
+        action="store_true",
+        help="Send a duplicate judge request when one runs longer than the observed p95 latency",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Disable the judge response cache (results/.cache/judges)",
+    )
+    parser.add_argument(
+        "--refresh-cache",
+        action="store_true",
+        help="Ignore cached judge responses and overwrite them with fresh API results",
+    )
+    parser.add_argument(
+        "--simulate-seed",
+        type=int,
+        default=0,
+        help="Seed for --provider simulate (default: 0)",
+    )
+    parser.add_argument(
+        "--simulate-time-scale",
+        type=float,
+        default=1.0,
+        help="Scale simulated latencies and rate-limit windows, e.g. 0.01 for 100x faster (default: 1.0)",
+    )
 
     args = parser.parse_args()
 
+    if args.follow and not args.run_dir.exists():
+        # The runner creates its output directory when it starts
+        print(f"Waiting for {args.run_dir} ...")
+        while not args.run_dir.exists():
+            time.sleep(FOLLOW_POLL_SECONDS)
     if not args.run_dir.exists():
         print(f"Error: Directory not found: {args.run_dir}", file=sys.stderr)
         sys.exit(1)
 
-    # Parse judge list for ensemble mode
-    judge_names = [j.strip() for j in args.judges.split(",")]
+    try:
+        provider_mode, provider_path = parse_provider_spec(args.provider)
+        if provider_mode == "simulate":
+            configure_simulator(provider_path, seed=args.simulate_seed, time_scale=args.simulate_time_scale)
+        else:
+            configure_judge_provider(provider_mode, provider_path or args.run_dir, args.replay_latency)
+    except (ValueError, FileNotFoundError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    offline = provider_mode in ("replay", "simulate")
+    if not (args.no_cache or offline):
+        configure_judge_cache(ResponseCache(JUDGE_CACHE_DIR, refresh=args.refresh_cache))
 
-    # summary.json 読み込み（あれば）
-    summary_file = args.run_dir / "summary.json"
-    run_summary = None
-    if summary_file.exists():
-        run_summary = json.loads(summary_file.read_text())
+    configure_retry_policy(RetryPolicy(
+        max_attempts=max(1, args.max_attempts),
+        attempt_timeout=args.timeout or None,
+        deadline=args.deadline or None,
+        hedge=args.hedge,
+    ))
 
-    # Determine framework (from argument, summary.json, or default)
-    if args.framework:
-        framework = args.framework
-    elif run_summary and "framework" in run_summary:
-        framework = run_summary["framework"]
-    else:
-        framework = "rails"
+    # Parse judge list for ensemble mode
+    judge_names = [j.strip() for j in args.judges.split(",")]
 
-    cases_dir = get_cases_dir(framework)
-    print(f"Using framework: {framework}, cases_dir: {cases_dir}")
+    run_summary, framework = load_run_summary(args.run_dir, args.framework)
+    result_files = find_result_files(args.run_dir, framework)
+    frameworks = sorted({fw for _, _, fw in result_files}) or [framework]
+    for fw in frameworks:
+        print(f"Using framework: {fw}, cases_dir: {get_cases_dir(fw)}")
 
-    # Count cases for cost estimation
-    result_files = [f for f in args.run_dir.glob("*.json")
-                    if f.name not in ("summary.json", "evaluations.json", "report.json", "metrics.json")]
+    # Count cases for cost estimation (one model, across all of its frameworks)
+    case_count = 0
     if result_files:
-        sample_results = json.loads(result_files[0].read_text())
-        case_count = len(sample_results)
-    else:
-        case_count = 0
+        sample_model = result_files[0][1].partition(".")[0]
+        for result_file, model, _ in result_files:
+            if model.partition(".")[0] == sample_model:
+                case_count += len(json.loads(result_file.read_text()))
 
     # Dry run cost estimation
     if args.dry_run_cost:
@@ -1200,7 +2219,6 @@ def main() -> None:
             print(f"  Total: ${cost_estimate['total']:.4f}")
         else:
             # Single judge estimate
-            from config import estimate_ensemble_cost
             cost_estimate = estimate_ensemble_cost(["claude"], case_count)
             print(f"Cost Estimate for Single Judge (claude):")
             print(f"  Cases: {case_count}")
@@ -1216,204 +2234,271 @@ def main() -> None:
         if use_ensemble:
             print(f"Initializing ensemble judges: {', '.join(judge_names)}")
             try:
-                ensemble_judge = EnsembleJudge(judge_names)
+                ensemble_judge = EnsembleJudge(
+                    judge_names,
+                    judge_timeout=args.judge_timeout or None,
+                    strategy=args.ensemble_strategy,
+                    escalation_band=args.escalation_band,
+                    concurrency=max(1, args.judge_concurrency),
+                )
             except Exception as e:
                 print(f"Warning: Failed to initialize ensemble: {e}")
                 print("Falling back to single judge mode")
                 use_ensemble = False
-                if ANTHROPIC_AVAILABLE:
-                    client = anthropic.Anthropic()
+                if offline:
+                    client = None
+                elif ANTHROPIC_AVAILABLE:
+                    client = get_client_registry().anthropic_client()
                 else:
                     print("Error: anthropic package not available for fallback", file=sys.stderr)
                     sys.exit(1)
         else:
-            if ANTHROPIC_AVAILABLE:
-                client = anthropic.Anthropic()
+            if offline:
+                client = None
+            elif ANTHROPIC_AVAILABLE:
+                client = get_client_registry().anthropic_client()
             else:
                 print("Error: anthropic package not available. Install with: pip install anthropic", file=sys.stderr)
                 sys.exit(1)
 
+    # Results whose inputs have not changed since the last evaluation are not scored again
+    previous = {} if args.full else load_evaluation_cache(args.run_dir)
+    judge_settings = (
+        {"judges": judge_names, "strategy": args.ensemble_strategy, "escalation_band": args.escalation_band}
+        if use_ensemble else {"judge_model": JUDGE_MODEL}
+    )
+    budget = JudgeBudget(args.budget)
+
+    follow_stats = None
+    if args.follow:
+        def evaluate_within_budget(job: EvaluationJob) -> JobOutcome:
+            if job.method not in JUDGE_METHODS:
+                return evaluate_job(job, client, ensemble_judge, args.verbose)
+            reserved = budget.reserve(job.method, estimate_judge_cost(job.method, judge_names))
+            if reserved is None:
+                return JobOutcome(evaluation=None, line="SKIPPED (budget)")
+            outcome = None
+            try:
+                outcome = evaluate_job(job, client, ensemble_judge, args.verbose)
+            finally:
+                if outcome is None:
+                    budget.settle(job.method, reserved, 0.0)
+                else:
+                    budget.settle(job.method, reserved, outcome.judge_cost, outcome.late_judges)
+            return outcome
+
+        follow_stats = follow_run(
+            args.run_dir,
+            framework,
+            lambda model, fw, index, result: plan_job(
+                model, fw, index, 0, result,
+                args.skip_judge, use_ensemble and ensemble_judge is not None, judge_settings, previous,
+            ),
+            evaluate_within_budget,
+            max(1, args.judge_concurrency),
+            args.follow_interval,
+        )
+        # The runner has finished: score its final result files, reusing what was judged while following
+        previous = load_evaluation_cache(args.run_dir)
+        run_summary, framework = load_run_summary(args.run_dir, args.framework)
+        result_files = find_result_files(args.run_dir, framework)
+        frameworks = sorted({fw for _, _, fw in result_files}) or [framework]
+
     # 結果ファイル読み込み
     results_by_model: dict[str, list[EvaluationResult]] = {}
-    total_judge_cost = 0.0
     ensemble_results_by_model: dict[str, list[dict[str, Any]]] = {}  # For storing ensemble details
 
-    result_files = [f for f in args.run_dir.glob("*.json")
-                    if f.name not in ("summary.json", "evaluations.json", "report.json", "metrics.json")]
-
     if not result_files:
         print(f"Error: No result files found in {args.run_dir}", file=sys.stderr)
         sys.exit(1)
 
-    for result_file in sorted(result_files):
-        model = result_file.stem
-        print(f"\n{'='*60}")
-        print(f"Evaluating: {model}")
-        print(f"{'='*60}")
+    for framework in sorted({framework for _, _, framework in result_files}):
+        # Duplicate case_ids within a framework are skipped rather than guessed
+        for (_, case_id), case_dirs in get_corpus(get_cases_dir(framework)).duplicates().items():
+            print(f"Warning: case_id {case_id} is used by {len(case_dirs)} cases in {framework}: "
+                  f"{', '.join(str(d) for d in case_dirs)}", file=sys.stderr)
 
-        results = json.loads(result_file.read_text())
-        evaluations: list[EvaluationResult] = []
+    # Plan every evaluation first; output lines are reserved in plan order
+    output = OrderedOutput()
+    jobs_by_model: dict[str, list[tuple[EvaluationJob, int]]] = {}
+    summary_slots: dict[str, int] = {}
+    for result_file, model, framework in result_files:
+        output.emit(f"\n{'='*60}\nEvaluating: {model}\n{'='*60}")
 
+        results = json.loads(result_file.read_text())
+        jobs = jobs_by_model.setdefault(model, [])
         for i, result in enumerate(results, 1):
             case_id = result.get("case_id", "unknown")
-            print(f"[{i:3d}/{len(results)}] {case_id}", end=" ... ", flush=True)
+            prefix = f"[{i:3d}/{len(results)}] {case_id} ... "
 
             # 実行失敗ケースはスキップ
             if not result.get("success", True):
-                print(f"SKIPPED (run failed)")
+                output.emit(prefix + "SKIPPED (run failed)")
                 continue
 
             try:
-                meta = load_meta(case_id, cases_dir)
+                job = plan_job(
+                    model, framework, i, len(results), result,
+                    args.skip_judge, use_ensemble and ensemble_judge is not None, judge_settings, previous,
+                )
             except ValueError as e:
-                print(f"SKIPPED ({e})")
+                output.emit(prefix + f"SKIPPED ({e})")
                 continue
+            jobs.append((job, output.reserve()))
+        summary_slots[model] = output.reserve()
 
-            # 評価実行
-            # Evaluation mode priority: semantic > rubric > judge > severity
-            expected_critique = load_expected_critique(case_id, cases_dir)
-            rubric = load_rubric(case_id, cases_dir)
-            evaluation_mode = result.get("evaluation_mode", meta.get("evaluation_mode", "severity"))
-
-            # Track ensemble details for this case
-            ensemble_detail = None
-
-            if expected_critique and evaluation_mode == "semantic":
-                # Semantic evaluation requires judge model
-                if args.skip_judge:
-                    print(f"(semantic requires judge)", end=" ")
-                    judge_result = evaluate_without_judge(result, meta)
-                elif use_ensemble and ensemble_judge:
-                    # Ensemble mode
-                    ensemble_result = ensemble_judge.evaluate_semantic(
-                        result,
-                        expected_critique,
-                        meta.get("expected_detection", True),
-                    )
-                    judge_result = ensemble_result.to_judge_result_dict()
-                    ensemble_detail = ensemble_result.to_dict()
-                    total_judge_cost += judge_result.get("judge_cost", 0)
-
-                    # Check budget
-                    if args.budget and total_judge_cost > args.budget:
-                        print(f"\nBudget exceeded: ${total_judge_cost:.4f} > ${args.budget:.2f}")
-                        print("Stopping evaluation.")
-                        break
-
-                    consensus_str = "consensus" if ensemble_result.consensus else "split"
-                    print(f"(ensemble: mean={ensemble_result.mean_score:.1f}, {consensus_str})", end=" ")
-                else:
-                    judge_result = evaluate_with_semantic_judge(
-                        result,
-                        expected_critique,
-                        meta.get("expected_detection", True),
-                        client,
-                    )
-                    total_judge_cost += judge_result.get("judge_cost", 0)
-                    print(f"(semantic)", end=" ")
-            elif rubric and evaluation_mode == "rubric":
-                judge_result = evaluate_with_rubric(
-                    result,
-                    rubric,
-                    meta.get("expected_detection", True),
-                )
-                print(f"(rubric)", end=" ")
-            elif args.skip_judge:
-                judge_result = evaluate_without_judge(result, meta)
-            else:
-                judge_result = judge_review(result, meta, client)
-                total_judge_cost += judge_result.get("judge_cost", 0)
-
-            # AIのレビュー結果を取得
-            parsed = result.get("parsed_response")
-            review_has_issues = parsed.get("has_issues") if parsed else None
-            review_issue_count = len(parsed.get("issues", [])) if parsed else 0
-
-            # Fix suggestion評価
-            fix_validation = meta.get("fix_validation")
-            context_mode = result.get("context_mode", "explicit")
-
-            # Collect all suggestions from issues
-            all_suggestions = ""
-            if parsed and parsed.get("issues"):
-                for issue in parsed["issues"]:
-                    suggestion = issue.get("suggestion", "")
-                    if suggestion:
-                        all_suggestions += suggestion + "\n"
-
-            fix_score, fix_correct, fix_passed, fix_failed = evaluate_fix_suggestion(
-                all_suggestions, fix_validation
-            )
-
-            evaluation = EvaluationResult(
-                case_id=case_id,
-                category=meta.get("category", "unknown"),
-                difficulty=meta.get("difficulty", "unknown"),
-                model=model,
-                expected_detection=meta.get("expected_detection", True),
-                detected=judge_result.get("detected", False),
-                detection_score=judge_result.get("detection_score", 0.0),
-                highest_severity=judge_result.get("highest_severity"),
-                accuracy=judge_result.get("accuracy", 0),
-                noise_count=judge_result.get("noise_count", 0),
-                correct_location=judge_result.get("correct_location", False),
-                reasoning=judge_result.get("reasoning", ""),
-                review_has_issues=review_has_issues,
-                review_issue_count=review_issue_count,
-                critical_count=judge_result.get("critical_count", 0),
-                major_count=judge_result.get("major_count", 0),
-                minor_count=judge_result.get("minor_count", 0),
-                # Semantic evaluation fields
-                evaluation_mode=judge_result.get("evaluation_mode", "severity"),
-                semantic_score=judge_result.get("semantic_score"),
-                essential_finding_captured=judge_result.get("essential_finding_captured"),
-                severity_aligned=judge_result.get("severity_aligned"),
-                suggestion_quality=judge_result.get("suggestion_quality"),
-                key_points_matched=judge_result.get("key_points_matched"),
-                key_points_missed=judge_result.get("key_points_missed"),
-                # Dual mode / Fix evaluation fields
-                context_mode=context_mode,
-                fix_score=fix_score,
-                fix_correct=fix_correct,
-                fix_validation_passed=fix_passed if fix_passed else None,
-                fix_validation_failed=fix_failed if fix_failed else None,
-            )
-            evaluations.append(evaluation)
+    planned = sum(len(jobs) for jobs in jobs_by_model.values())
+    reused = sum(1 for jobs in jobs_by_model.values() for job, _ in jobs if job.cached is not None)
+    if reused:
+        output.emit(f"\nReusing {reused}/{planned} unchanged evaluations from {EVALUATION_CACHE_FILE}")
 
-            # Store ensemble details if available
-            if ensemble_detail:
-                if model not in ensemble_results_by_model:
-                    ensemble_results_by_model[model] = []
-                ensemble_results_by_model[model].append({
-                    "case_id": case_id,
-                    **ensemble_detail,
-                })
+    outcomes: dict[str, list[JobOutcome | None]] = {
+        model: [None] * len(jobs) for model, jobs in jobs_by_model.items()
+    }
+    pending = {model: len(jobs) for model, jobs in jobs_by_model.items()}
+    pending_lock = threading.Lock()
 
-            severity_str = evaluation.highest_severity or "None"
-            status = "✓" if evaluation.detected else "✗"
-            print(f"{status} [{severity_str}] (score={evaluation.detection_score:.1f})")
+    def model_summary(model: str) -> str:
+        evaluations = [outcome.evaluation for outcome in outcomes[model] if outcome and outcome.evaluation]
+        metrics = calculate_metrics(evaluations)
+        return "\n".join([
+            f"\n{model} Results:",
+            f"  Recall: {metrics.recall:.1%} ({metrics.true_positives}/{metrics.bug_cases})",
+            f"  Weighted Recall: {metrics.weighted_recall:.1%}",
+            f"  Detection by severity: critical={metrics.critical_detections}, major={metrics.major_detections}, minor={metrics.minor_detections}",
+            f"  FPR: {metrics.false_positive_rate:.1%} ({metrics.false_positives}/{metrics.clean_cases})",
+        ])
 
-            if args.verbose and evaluation.reasoning:
-                print(f"       Reason: {evaluation.reasoning[:100]}...")
+    def finish(job: EvaluationJob, n: int, slot: int, outcome: JobOutcome) -> None:
+        outcomes[job.model][n] = outcome
+        cached = "(cached) " if job.cached is not None else ""
+        output.fill(slot, f"[{job.index:3d}/{job.total}] {job.case.case_id} ... {cached}{outcome.line}")
+        with pending_lock:
+            pending[job.model] -= 1
+            done = pending[job.model] == 0
+        if done:
+            output.fill(summary_slots[job.model], model_summary(job.model))
 
-        results_by_model[model] = evaluations
+    # Judge failures are reported once the pool has drained and the cache is saved
+    errors: list[tuple[EvaluationJob, Exception]] = []
 
-        # モデルごとのサマリー
-        metrics = calculate_metrics(evaluations)
-        print(f"\n{model} Results:")
-        print(f"  Recall: {metrics.recall:.1%} ({metrics.true_positives}/{metrics.bug_cases})")
-        print(f"  Weighted Recall: {metrics.weighted_recall:.1%}")
-        print(f"  Detection by severity: critical={metrics.critical_detections}, major={metrics.major_detections}, minor={metrics.minor_detections}")
-        print(f"  FPR: {metrics.false_positive_rate:.1%} ({metrics.false_positives}/{metrics.clean_cases})")
+    def run_job(job: EvaluationJob, n: int, slot: int, reserved: float) -> None:
+        try:
+            outcome = evaluate_job(job, client, ensemble_judge, args.verbose)
+        except Exception as e:
+            with pending_lock:
+                errors.append((job, e))
+            outcome = JobOutcome(evaluation=None, line=f"ERROR ({e})")
+        if job.method in JUDGE_METHODS:
+            budget.settle(job.method, reserved, outcome.judge_cost, outcome.late_judges)
+        finish(job, n, slot, outcome)
+
+    for model, jobs in jobs_by_model.items():
+        if not jobs:
+            output.fill(summary_slots[model], model_summary(model))
+
+    # Judge calls run concurrently; at most judge_concurrency evaluations are in flight
+    concurrency = max(1, args.judge_concurrency)
+    slots = threading.Semaphore(concurrency)
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        futures = []
+        for model, jobs in jobs_by_model.items():
+            for n, (job, slot) in enumerate(jobs):
+                if job.cached is not None:
+                    finish(job, n, slot, job.cached)
+                    continue
+                slots.acquire()
+                reserved = 0.0
+                if job.method in JUDGE_METHODS:
+                    was_exhausted = budget.exhausted
+                    reserved = budget.reserve(job.method, estimate_judge_cost(job.method, judge_names))
+                    if reserved is None:
+                        slots.release()
+                        if not was_exhausted:
+                            output.emit(
+                                f"\nBudget reached: ${budget.spent:.4f} spent of ${args.budget:.2f}. "
+                                "No further judge calls."
+                            )
+                        finish(job, n, slot, JobOutcome(evaluation=None, line="SKIPPED (budget)"))
+                        continue
+                future = pool.submit(run_job, job, n, slot, reserved)
+                future.add_done_callback(lambda _: slots.release())
+                futures.append(future)
+        for future in futures:
+            future.result()
+    if ensemble_judge is not None:
+        # Wait for judges that timed out so their cost is in budget.spent
+        ensemble_judge.close()
+
+    for model, model_outcomes in outcomes.items():
+        results_by_model[model] = [outcome.evaluation for outcome in model_outcomes if outcome and outcome.evaluation]
+        details = [outcome.ensemble_detail for outcome in model_outcomes if outcome and outcome.ensemble_detail]
+        if details:
+            ensemble_results_by_model[model] = details
+    total_judge_cost = budget.spent
+
+    # Scored results (new and reused) are the cache for the next run
+    save_evaluation_cache(args.run_dir, {
+        model: {
+            job.key: cache_entry(job, outcome)
+            for (job, _), outcome in zip(jobs_by_model[model], model_outcomes)
+            if outcome and outcome.evaluation
+        }
+        for model, model_outcomes in outcomes.items()
+    })
+
+    # Metrics over a silently shrunken denominator would be wrong, so a failed
+    # evaluation stops the run; the next run reuses everything scored so far
+    if errors:
+        print(f"\nError: {len(errors)} evaluation(s) failed; no report written. "
+              f"Successful evaluations are saved in {EVALUATION_CACHE_FILE}, re-run to retry the failed ones:",
+              file=sys.stderr)
+        for job, e in errors:
+            print(f"  {job.model} {job.case.case_id} ({job.result.get('context_mode', 'explicit')}): {e}",
+                  file=sys.stderr)
+        sys.exit(1)
 
     # 全体メトリクス計算
+    # One columnar table for every model; metrics are grouped reductions over it
+    evaluation_table = EvaluationTable.from_evaluations(
+        [evaluation for evals in results_by_model.values() for evaluation in evals]
+    )
+    grouped_metrics = calculate_metrics_by_model(evaluation_table)
     metrics_by_model = {
-        model: calculate_metrics(evals)
-        for model, evals in results_by_model.items()
+        model: grouped_metrics.get(model) or calculate_metrics([])
+        for model in results_by_model
     }
 
+    escalation = None
+    if use_ensemble and ensemble_judge and ensemble_judge.strategy == "escalate":
+        escalation = ensemble_judge.escalation_stats()
+        print(f"\nEscalated {escalation['escalated']}/{escalation['cases']} ensemble cases "
+              f"({escalation['escalation_rate']:.1%}); saved ${escalation['saved_cost']:.4f} "
+              f"({escalation['saved_rate']:.1%}) vs. calling every judge")
+
+    # Bootstrap / Wilson confidence intervals; model differences are paired over cases
+    confidence = None
+    baseline = None
+    if args.bootstrap_resamples > 0 and len(evaluation_table):
+        confidence = bootstrap_intervals(evaluation_table, args.bootstrap_resamples, args.ci_level)
+        models_with_ci = list(confidence.models)
+        if args.ci_baseline:
+            baseline = args.ci_baseline if args.ci_baseline in models_with_ci else None
+            if baseline is None:
+                print(f"Warning: --ci-baseline {args.ci_baseline} has no evaluations; no paired differences reported",
+                      file=sys.stderr)
+        elif len(models_with_ci) > 1:
+            baseline = next((m for m in models_with_ci if "sonnet" in m), models_with_ci[0])
+        print(f"\n{args.ci_level:.0%} confidence intervals ({args.bootstrap_resamples} bootstrap resamples):")
+        for model in models_with_ci:
+            intervals = confidence.for_model(model)
+            print(f"  {model}: " + ", ".join(
+                f"{label} {format_interval(intervals[metric]['bootstrap'])}"
+                for metric, label in CI_REPORT_METRICS
+            ))
+
     # レポート生成
-    generate_report(metrics_by_model, args.run_dir, run_summary)
+    generate_report(metrics_by_model, args.run_dir, run_summary, escalation, confidence, baseline)
 
     # 詳細評価結果保存
     evaluations_data = {
@@ -1427,10 +2512,11 @@ def main() -> None:
     # Calculate FP metrics for each model
     fp_metrics_by_model: dict[str, dict[str, Any]] = {}
     if JUDGES_AVAILABLE:
-        for model, evals in results_by_model.items():
-            eval_dicts = [asdict(e) for e in evals]
-            fp_metrics = calculate_fp_metrics(eval_dicts)
-            tp_noise = calculate_tp_noise_metrics(eval_dicts)
+        fp_by_model = calculate_fp_metrics_by_model(evaluation_table)
+        tp_noise_by_model = calculate_tp_noise_metrics_by_model(evaluation_table)
+        for model in results_by_model:
+            fp_metrics = fp_by_model.get(model) or calculate_fp_metrics([])
+            tp_noise = tp_noise_by_model.get(model) or calculate_tp_noise_metrics([])
             fp_metrics_by_model[model] = {
                 "fp_metrics": fp_metrics.to_dict(),
                 "tp_noise_metrics": tp_noise.to_dict(),
@@ -1451,6 +2537,10 @@ def main() -> None:
     for model in metrics_data:
         if model in fp_metrics_by_model:
             metrics_data[model]["fp_noise_metrics"] = fp_metrics_by_model[model]
+        if confidence is not None and model in confidence.models:
+            metrics_data[model]["confidence_intervals"] = confidence.for_model(model)
+    if confidence is not None:
+        metrics_data["_comparisons"] = {**confidence.to_dict(), "baseline": baseline}
 
     # Metadata
     judge_info: dict[str, Any] = {}
@@ -1461,6 +2551,9 @@ def main() -> None:
         judge_info["judge_model"] = None
         judge_info["judge_mode"] = "ensemble"
         judge_info["ensemble_judges"] = judge_names
+        judge_info["ensemble_strategy"] = args.ensemble_strategy
+        if escalation is not None:
+            judge_info["escalation"] = escalation
     else:
         judge_info["judge_model"] = JUDGE_MODEL
         judge_info["judge_mode"] = "single"
@@ -1469,7 +2562,23 @@ def main() -> None:
         "timestamp": datetime.now().isoformat(),
         **judge_info,
         "total_judge_cost": total_judge_cost,
+        "judge_concurrency": max(1, args.judge_concurrency),
+        "budget": args.budget,
+        "budget_skipped": budget.skipped,
+        "late_judge_cost": budget.late_cost,
+        "incremental": {"reused": reused, "evaluated": planned - reused, "full": args.full},
+        "follow": follow_stats,
+        "provider": args.provider,
+        "frameworks": frameworks,
     }
+    if get_judge_replay() is not None:
+        metrics_data["_meta"]["replay"] = get_judge_replay().stats()
+    if get_judge_recorder() is not None:
+        metrics_data["_meta"]["recorded_judge_responses"] = get_judge_recorder().count
+    if get_simulator() is not None:
+        metrics_data["_meta"]["simulator"] = get_simulator().stats()
+    if get_judge_cache() is not None:
+        metrics_data["_meta"]["judge_cache"] = get_judge_cache().stats()
     metrics_path = args.run_dir / "metrics.json"
     metrics_path.write_text(json.dumps(metrics_data, indent=2, ensure_ascii=False))
     print(f"Metrics saved to: {metrics_path}")
@@ -1482,6 +2591,12 @@ def main() -> None:
 
     if not args.skip_judge:
         print(f"\nTotal Judge cost: ${total_judge_cost:.4f}")
+        if get_judge_cache() is not None:
+            cache_stats = get_judge_cache().stats()
+            print(
+                f"Judge cache: {cache_stats['hits']} hits, {cache_stats['misses']} misses "
+                f"(${cache_stats['cost_saved']:.4f} saved)"
+            )
 
     print(f"\n{'='*60}")
     print("Evaluation completed!")
@@ -10,11 +10,12 @@ Usage:
 """
 
 import argparse
-import json
 from collections import defaultdict
 from datetime import datetime
 from pathlib import Path
 
+from case_corpus import get_corpus, thaw
+
 
 # Category order for each axis
 SPEC_ALIGNMENT_CATEGORIES = ["CALC", "STOCK", "STATE", "AUTH", "TIME", "NOTIFY"]
@@ -64,24 +65,15 @@ def load_cases(cases_dir: Path) -> dict[str, list[dict]]:
     """
     cases: dict[str, list[dict]] = defaultdict(list)
 
-    for framework_dir in cases_dir.iterdir():
-        if not framework_dir.is_dir():
+    root = cases_dir.resolve()
+    for record in get_corpus(cases_dir):
+        case_dir = record.case_dir.resolve()
+        # Only cases directly under a framework directory
+        if case_dir.parent.parent != root:
             continue
-
-        framework = framework_dir.name
-
-        for case_dir in sorted(framework_dir.iterdir()):
-            if not case_dir.is_dir():
-                continue
-
-            meta_path = case_dir / "meta.json"
-            if not meta_path.exists():
-                continue
-
-            with open(meta_path) as f:
-                meta = json.load(f)
-                meta["_path"] = str(case_dir.relative_to(cases_dir.parent))
-                cases[framework].append(meta)
+        meta = thaw(record.meta)
+        meta["_path"] = str(case_dir.relative_to(root.parent))
+        cases[record.framework].append(meta)
 
     return dict(cases)
 
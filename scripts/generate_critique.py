@@ -39,6 +39,7 @@ try:
 except ImportError:
     anthropic = None
 
+from case_corpus import get_corpus, thaw
 
 CASES_DIR = Path(__file__).parent.parent / "cases" / "rails"
 
@@ -184,17 +185,15 @@ Return ONLY the markdown content for the critique file, starting with "# Expecte
 
 def load_case_files(case_dir: Path) -> dict[str, Any]:
     """Load all files for a test case."""
-    meta_path = case_dir / "meta.json"
-    plan_path = case_dir / "plan.md"
-    impl_path = case_dir / "impl.rb"
-
-    if not meta_path.exists():
+    try:
+        record = get_corpus(case_dir.parent).get(case_dir)
+    except FileNotFoundError:
         return None
 
     result = {
-        "meta": json.loads(meta_path.read_text()),
-        "plan": plan_path.read_text() if plan_path.exists() else "",
-        "impl": impl_path.read_text() if impl_path.exists() else "",
+        "meta": thaw(record.meta),
+        "plan": record.plan or "",
+        "impl": record.impl or "",
     }
 
     return result
@@ -362,6 +361,7 @@ def process_case(
         meta["evaluation_mode"] = "semantic"
         meta["has_expected_critique"] = True
         meta_path.write_text(json.dumps(meta, indent=2, ensure_ascii=False) + "\n")
+        get_corpus(case_dir.parent).refresh(case_dir)
         print(f"  Updated: {meta_path}")
 
     return True
@@ -6,6 +6,7 @@ Defines the interface that all judge implementations must follow.
 
 import json
 import re
+import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from typing import Any
@@ -13,11 +14,33 @@ from typing import Any
 # Handle imports for both package and direct execution
 try:
     from ..config import JudgeConfig
+    from ..providers import (
+        RateLimiter,
+        estimate_tokens,
+        get_judge_cache,
+        get_judge_replay,
+        get_rate_limiter,
+        get_retry_policy,
+        get_simulator,
+        judge_cache_key,
+        record_judge_response,
+    )
 except ImportError:
     import sys
     from pathlib import Path
     sys.path.insert(0, str(Path(__file__).parent.parent))
     from config import JudgeConfig
+    from providers import (
+        RateLimiter,
+        estimate_tokens,
+        get_judge_cache,
+        get_judge_replay,
+        get_rate_limiter,
+        get_retry_policy,
+        get_simulator,
+        judge_cache_key,
+        record_judge_response,
+    )
 
 
 @dataclass
@@ -41,6 +64,10 @@ class JudgeResult:
     judge_cost: float = 0.0
     judge_time: float = 0.0
     judge_name: str = ""
+    judge_attempts: int = 1
+    judge_retry_time: float = 0.0
+    input_tokens: int = 0
+    output_tokens: int = 0
 
     # Evaluation mode
     evaluation_mode: str = "severity"
@@ -58,6 +85,9 @@ class JudgeResult:
     false_critical_count: int = 0
     false_major_count: int = 0
 
+    # True when the judge response had no parseable JSON (score defaults to 1)
+    parse_failed: bool = False
+
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary."""
         return {
@@ -74,6 +104,8 @@ class JudgeResult:
             "judge_cost": self.judge_cost,
             "judge_time": self.judge_time,
             "judge_name": self.judge_name,
+            "judge_attempts": self.judge_attempts,
+            "judge_retry_time": self.judge_retry_time,
             "evaluation_mode": self.evaluation_mode,
             "semantic_score": self.semantic_score,
             "essential_finding_captured": self.essential_finding_captured,
@@ -84,6 +116,7 @@ class JudgeResult:
             "correctly_approved": self.correctly_approved,
             "false_critical_count": self.false_critical_count,
             "false_major_count": self.false_major_count,
+            "parse_failed": self.parse_failed,
         }
 
 
@@ -214,9 +247,24 @@ def extract_json(text: str) -> dict[str, Any] | None:
     return None
 
 
+@dataclass
+class Completion:
+    """Raw output of one judge model call."""
+    text: str
+    input_tokens: int
+    output_tokens: int
+    elapsed_time: float
+    attempts: int = 1
+    retry_time: float = 0.0
+    cached: bool = False
+
+
 class BaseJudge(ABC):
     """Abstract base class for all judges."""
 
+    # Whether _generate sends config.temperature; otherwise it is left out of the cache key
+    sends_temperature: bool = False
+
     def __init__(self, config: JudgeConfig):
         """Initialize judge with configuration.
 
@@ -225,8 +273,17 @@ class BaseJudge(ABC):
         """
         self.config = config
         self.name = config.name
+        self.rate_limiter: RateLimiter = get_rate_limiter(
+            config.model_id,
+            requests_per_minute=config.requests_per_minute,
+            tokens_per_minute=config.tokens_per_minute,
+        )
+
+    @property
+    def offline(self) -> bool:
+        """True when responses come from recordings or the simulator (no API client needed)."""
+        return get_judge_replay() is not None or get_simulator() is not None
 
-    @abstractmethod
     def evaluate_semantic(
         self,
         review_result: dict[str, Any],
@@ -243,8 +300,104 @@ class BaseJudge(ABC):
         Returns:
             JudgeResult with evaluation details
         """
+        prompt = self._build_prompt(review_result, expected_critique, expected_detection)
+
+        completion = self._complete(prompt)
+        # A cached response was paid for by an earlier evaluation
+        cost = 0.0 if completion.cached else self.calculate_cost(completion.input_tokens, completion.output_tokens)
+
+        result = self._parse_response(
+            completion.text,
+            expected_detection,
+            cost,
+            completion.elapsed_time,
+        )
+        result.judge_attempts = completion.attempts
+        result.judge_retry_time = completion.retry_time
+        result.input_tokens = completion.input_tokens
+        result.output_tokens = completion.output_tokens
+        return result
+
+    @abstractmethod
+    def _generate(self, prompt: str) -> tuple[str, int, int]:
+        """Send a prompt to the judge model.
+
+        Args:
+            prompt: Fully rendered judge prompt
+
+        Returns:
+            Tuple of (response_text, input_tokens, output_tokens)
+        """
         pass
 
+    def _complete(self, prompt: str) -> Completion:
+        """Call the judge model under its rate limiter and the retry policy.
+
+        Args:
+            prompt: Fully rendered judge prompt
+
+        Returns:
+            Completion. elapsed_time is that of the successful attempt and
+            excludes time spent waiting for rate-limit capacity. Responses
+            served from the judge cache have ``cached`` set and no attempts.
+        """
+        replay = get_judge_replay()
+        if replay is not None:
+            entry = replay.replay(self.config.model_id, prompt)
+            return Completion(entry["response"], entry["input_tokens"], entry["output_tokens"], entry["elapsed_time"])
+
+        cache = get_judge_cache()
+        key = (
+            judge_cache_key(
+                self.config.model_id,
+                self.config.temperature if self.sends_temperature else None,
+                self.config.max_tokens,
+                prompt,
+            )
+            if cache else None
+        )
+        cached = cache.get(key) if cache else None
+        if cached is not None:
+            return Completion(
+                cached["response"], cached["input_tokens"], cached["output_tokens"], cached["elapsed_time"],
+                attempts=0, cached=True,
+            )
+
+        simulator = get_simulator()
+
+        def request() -> tuple[str, int, int, float]:
+            with self.rate_limiter.reserve(estimate_tokens(prompt)) as reservation:
+                if simulator is not None:
+                    response = simulator.judge(self.name, prompt)
+                else:
+                    start_time = time.time()
+                    response_text, input_tokens, output_tokens = self._generate(prompt)
+                    response = (response_text, input_tokens, output_tokens, time.time() - start_time)
+                reservation.actual_tokens = response[1] + response[2]
+            return response
+
+        (response_text, input_tokens, output_tokens, elapsed_time), call_stats = (
+            get_retry_policy().call(request, key=self.name)
+        )
+        if simulator is None:
+            record_judge_response(
+                self.config.model_id, prompt, response_text, input_tokens, output_tokens, elapsed_time,
+            )
+        # A response that does not parse would replay as a permanent failed score
+        if cache and extract_json(response_text) is not None:
+            cache.put(key, {
+                "model_id": self.config.model_id,
+                "response": response_text,
+                "input_tokens": input_tokens,
+                "output_tokens": output_tokens,
+                "elapsed_time": elapsed_time,
+                "cost": self.calculate_cost(input_tokens, output_tokens),
+            })
+        return Completion(
+            response_text, input_tokens, output_tokens, elapsed_time,
+            attempts=call_stats.attempts, retry_time=call_stats.retry_time,
+        )
+
     def _build_prompt(
         self,
         review_result: dict[str, Any],
@@ -358,6 +511,7 @@ class BaseJudge(ABC):
                 judge_name=self.name,
                 evaluation_mode="semantic",
                 semantic_score=1,
+                parse_failed=True,
             )
 
     def calculate_cost(self, input_tokens: int, output_tokens: int) -> float:
@@ -6,6 +6,10 @@ Aggregates results from multiple judges to provide stable, consensus-based evalu
 
 import statistics
 import sys
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
@@ -23,6 +27,13 @@ except ImportError:
     from judges.gemini_judge import GeminiJudge
     from config import get_judge_config, DEFAULT_ENSEMBLE_JUDGES
 
+# "all": every judge scores every case. "escalate": the primary (first) judge
+# scores first; the others are only asked when its score is near the threshold.
+ENSEMBLE_STRATEGIES = ("all", "escalate")
+
+# semantic_match_score at or above this counts as detected
+DETECTION_THRESHOLD = 3
+
 
 @dataclass
 class EnsembleResult:
@@ -47,6 +58,15 @@ class EnsembleResult:
     total_cost: float = 0.0
     total_time: float = 0.0
 
+    # Escalation strategy (None = every judge was called)
+    escalated: bool | None = None
+    escalation_reason: str | None = None
+    saved_cost: float = 0.0  # Estimated cost of the judges that were not called
+
+    # Judges that timed out but are still running (and will be billed); their
+    # cost is not in total_cost
+    late_judges: dict[str, Future] = field(default_factory=dict, repr=False)
+
     # Semantic fields (aggregated)
     semantic_score: float | None = None
     essential_finding_captured: bool | None = None
@@ -71,6 +91,9 @@ class EnsembleResult:
             "reasoning": self.reasoning,
             "total_cost": self.total_cost,
             "total_time": self.total_time,
+            "escalated": self.escalated,
+            "escalation_reason": self.escalation_reason,
+            "saved_cost": self.saved_cost,
             "semantic_score": self.semantic_score,
             "essential_finding_captured": self.essential_finding_captured,
             "severity_aligned": self.severity_aligned,
@@ -110,6 +133,13 @@ class EnsembleResult:
         }
 
 
+def late_judge_cost(future: Future) -> float:
+    """Cost of a finished judge call that timed out (0.0 if it failed or was cancelled)."""
+    if future.cancelled() or future.exception() is not None:
+        return 0.0
+    return future.result().judge_cost
+
+
 def create_judge(judge_name: str) -> BaseJudge:
     """Factory function to create a judge by name.
 
@@ -135,36 +165,92 @@ def create_judge(judge_name: str) -> BaseJudge:
 class EnsembleJudge:
     """Ensemble of multiple judges for stable evaluation."""
 
-    def __init__(self, judge_names: list[str] | None = None):
+    def __init__(
+        self,
+        judge_names: list[str] | None = None,
+        judge_timeout: float | None = None,
+        strategy: str = "all",
+        escalation_band: float = 1.0,
+        concurrency: int = 1,
+    ):
         """Initialize ensemble with specified judges.
 
         Args:
             judge_names: List of judge names to use. Defaults to claude + gemini.
+                With the escalate strategy the first one is the primary judge.
+            judge_timeout: Seconds to wait for each judge before dropping it
+                from the case's aggregate (None = wait for every judge)
+            strategy: "all" or "escalate" (see ENSEMBLE_STRATEGIES)
+            escalation_band: Escalate when the primary score is within this
+                distance of DETECTION_THRESHOLD (1.0 = scores 2-4)
+            concurrency: Cases evaluated in parallel; sizes the shared judge pool
+
+        Raises:
+            ValueError: If the strategy is unknown
         """
         if judge_names is None:
             judge_names = DEFAULT_ENSEMBLE_JUDGES
+        if strategy not in ENSEMBLE_STRATEGIES:
+            raise ValueError(f"Unknown ensemble strategy: {strategy}")
 
         self.judge_names = judge_names
+        self.judge_timeout = judge_timeout
+        self.strategy = strategy
+        self.escalation_band = escalation_band
+        self.concurrency = max(1, concurrency)
+
+        # Escalation counters (updated from parallel evaluations)
+        self._stats_lock = threading.Lock()
+        self._cases = 0
+        self._escalated = 0
+        self._escalation_reasons: dict[str, int] = {}
+        self._spent_cost = 0.0
+        self._saved_cost = 0.0
+        self.late_calls = 0  # Judge calls that finished after their timeout
+        self.late_cost = 0.0
         self.judges: dict[str, BaseJudge] = {}
+        self._pool: ThreadPoolExecutor | None = None
 
-        # Initialize judges lazily on first use
+        # Initialize judges lazily on first use (evaluations may run in parallel)
         self._initialized = False
+        self._init_lock = threading.Lock()
 
     def _ensure_initialized(self) -> None:
         """Initialize judges if not already done."""
         if self._initialized:
             return
 
-        for name in self.judge_names:
-            try:
-                self.judges[name] = create_judge(name)
-            except (ImportError, ValueError) as e:
-                print(f"Warning: Could not initialize {name} judge: {e}")
+        with self._init_lock:
+            if self._initialized:
+                return
 
-        if not self.judges:
-            raise RuntimeError("No judges could be initialized")
+            for name in self.judge_names:
+                try:
+                    self.judges[name] = create_judge(name)
+                except (ImportError, ValueError) as e:
+                    print(f"Warning: Could not initialize {name} judge: {e}")
 
-        self._initialized = True
+            if not self.judges:
+                raise RuntimeError("No judges could be initialized")
+
+            # One pool for every case. Twice the workers leave room for judges
+            # that timed out and are still finishing.
+            self._pool = ThreadPoolExecutor(
+                max_workers=2 * self.concurrency * len(self.judges), thread_name_prefix="judge",
+            )
+            self._initialized = True
+
+    def close(self) -> None:
+        """Shut down the judge pool, waiting for judges that timed out.
+
+        Their cost is added to ``late_cost`` as they finish, so spend totals
+        are complete once this returns.
+        """
+        with self._init_lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=True)
+                self._pool = None
+            self._initialized = False
 
     def evaluate_semantic(
         self,
@@ -174,7 +260,10 @@ class EnsembleJudge:
     ) -> EnsembleResult:
         """Perform ensemble semantic evaluation.
 
-        Calls all configured judges and aggregates their results.
+        Calls all configured judges concurrently and aggregates their results.
+        A judge that fails or exceeds ``judge_timeout`` is left out of the
+        aggregate and recorded with an error in ``judge_scores``. A timed-out
+        judge keeps running and is billed; it is returned in ``late_judges``.
 
         Args:
             review_result: AI reviewer's output (parsed and raw)
@@ -182,37 +271,164 @@ class EnsembleJudge:
             expected_detection: True for bug cases, False for FP cases
 
         Returns:
-            EnsembleResult with aggregated evaluation
+            EnsembleResult with aggregated evaluation. total_time is the
+            wall-clock time of the fan-out.
         """
         self._ensure_initialized()
 
+        start_time = time.monotonic()
+        judges = list(self.judges.items())
+        if self.strategy == "escalate" and len(judges) > 1:
+            return self._evaluate_escalating(judges, review_result, expected_critique, expected_detection, start_time)
+
+        judge_results, judge_scores, late_judges = self._run_judges(
+            judges, review_result, expected_critique, expected_detection
+        )
+
+        # Aggregate results
+        result = self._aggregate_results(judge_results, judge_scores, expected_detection)
+        result.total_time = time.monotonic() - start_time
+        result.late_judges = late_judges
+        return result
+
+    def _evaluate_escalating(
+        self,
+        judges: list[tuple[str, BaseJudge]],
+        review_result: dict[str, Any],
+        expected_critique: str,
+        expected_detection: bool,
+        start_time: float,
+    ) -> EnsembleResult:
+        """Ask the primary judge, and the remaining judges only if needed."""
+        primary_name = judges[0][0]
+        judge_results, judge_scores, late_judges = self._run_judges(
+            judges[:1], review_result, expected_critique, expected_detection
+        )
+        reason = self._escalation_reason(judge_results.get(primary_name))
+
+        saved_cost = 0.0
+        if reason is not None:
+            more_results, more_scores, more_late = self._run_judges(
+                judges[1:], review_result, expected_critique, expected_detection
+            )
+            judge_results.update(more_results)
+            judge_scores.update(more_scores)
+            late_judges.update(more_late)
+        else:
+            # Price the skipped judges at the primary judge's token counts
+            primary = judge_results[primary_name]
+            saved_cost = sum(
+                judge.calculate_cost(primary.input_tokens, primary.output_tokens)
+                for _, judge in judges[1:]
+            )
+
+        result = self._aggregate_results(judge_results, judge_scores, expected_detection)
+        result.total_time = time.monotonic() - start_time
+        result.escalated = reason is not None
+        result.escalation_reason = reason
+        result.saved_cost = saved_cost
+        result.late_judges = late_judges
+
+        with self._stats_lock:
+            self._cases += 1
+            self._spent_cost += result.total_cost
+            self._saved_cost += saved_cost
+            if reason is not None:
+                self._escalated += 1
+                kind = reason.split(" ")[0]
+                self._escalation_reasons[kind] = self._escalation_reasons.get(kind, 0) + 1
+        return result
+
+    def _escalation_reason(self, primary: JudgeResult | None) -> str | None:
+        """Why the primary judge's verdict needs more judges, or None if it stands."""
+        if primary is None:
+            return "error (primary judge failed)"
+        if primary.parse_failed or primary.semantic_score is None:
+            return "unparsed (primary response)"
+        if abs(primary.semantic_score - DETECTION_THRESHOLD) <= self.escalation_band:
+            return f"band (score {primary.semantic_score})"
+        return None
+
+    def escalation_stats(self) -> dict[str, Any]:
+        """Escalation counters and savings against calling every judge."""
+        with self._stats_lock:
+            full_cost = self._spent_cost + self._saved_cost
+            return {
+                "strategy": self.strategy,
+                "primary_judge": self.judge_names[0] if self.judge_names else None,
+                "escalation_band": self.escalation_band,
+                "cases": self._cases,
+                "escalated": self._escalated,
+                "escalation_rate": self._escalated / self._cases if self._cases else 0.0,
+                "escalation_reasons": dict(self._escalation_reasons),
+                "spent_cost": self._spent_cost,
+                "saved_cost": self._saved_cost,
+                "saved_rate": self._saved_cost / full_cost if full_cost else 0.0,
+            }
+
+    def _run_judges(
+        self,
+        judges: list[tuple[str, BaseJudge]],
+        review_result: dict[str, Any],
+        expected_critique: str,
+        expected_detection: bool,
+    ) -> tuple[dict[str, JudgeResult], dict[str, dict[str, Any]], dict[str, Future]]:
+        """Run judges in parallel on the shared pool, collecting results in configured order.
+
+        Returns:
+            Tuple of (results of judges that answered, score dict per judge,
+            futures of judges that timed out and are still running)
+        """
         judge_results: dict[str, JudgeResult] = {}
         judge_scores: dict[str, dict[str, Any]] = {}
+        late_judges: dict[str, Future] = {}
 
-        # Collect results from all judges
-        for name, judge in self.judges.items():
+        futures = {
+            name: self._pool.submit(judge.evaluate_semantic, review_result, expected_critique, expected_detection)
+            for name, judge in judges
+        }
+        # All judges start together, so one deadline is a per-judge timeout
+        deadline = None if self.judge_timeout is None else time.monotonic() + self.judge_timeout
+        for name, future in futures.items():
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
             try:
-                result = judge.evaluate_semantic(
-                    review_result, expected_critique, expected_detection
-                )
-                judge_results[name] = result
-                judge_scores[name] = {
-                    "semantic_score": result.semantic_score,
-                    "detected": result.detected,
-                    "detection_score": result.detection_score,
-                    "essential_finding_captured": result.essential_finding_captured,
-                    "severity_aligned": result.severity_aligned,
-                    "noise_count": result.noise_count,
-                    "reasoning": result.reasoning,
-                    "cost": result.judge_cost,
-                    "time": result.judge_time,
-                }
+                result = future.result(timeout=remaining)
+            except FutureTimeoutError:
+                print(f"Warning: {name} judge timed out after {self.judge_timeout:.0f}s")
+                judge_scores[name] = {"error": f"Timed out after {self.judge_timeout:.0f}s"}
+                # The request still completes and is billed; record its cost when it does
+                if not future.cancel():
+                    late_judges[name] = future
+                    future.add_done_callback(self._record_late_judge)
+                continue
             except Exception as e:
                 print(f"Warning: {name} judge failed: {e}")
                 judge_scores[name] = {"error": str(e)}
-
-        # Aggregate results
-        return self._aggregate_results(judge_results, judge_scores, expected_detection)
+                continue
+            judge_results[name] = result
+            judge_scores[name] = {
+                "semantic_score": result.semantic_score,
+                "detected": result.detected,
+                "detection_score": result.detection_score,
+                "essential_finding_captured": result.essential_finding_captured,
+                "severity_aligned": result.severity_aligned,
+                "noise_count": result.noise_count,
+                "reasoning": result.reasoning,
+                "cost": result.judge_cost,
+                "time": result.judge_time,
+                "attempts": result.judge_attempts,
+            }
+
+        return judge_results, judge_scores, late_judges
+
+    def _record_late_judge(self, future: Future) -> None:
+        """Add the cost of a judge that finished after its timeout."""
+        cost = late_judge_cost(future)
+        with self._stats_lock:
+            self.late_calls += 1
+            self.late_cost += cost
+            if self.strategy == "escalate":
+                self._spent_cost += cost
 
     def _aggregate_results(
         self,
@@ -291,9 +507,8 @@ class EnsembleJudge:
             if sa_votes else None
         )
 
-        # Total cost and time
+        # Total cost (total_time is set by the caller from wall-clock time)
         total_cost = sum(r.judge_cost for r in judge_results.values())
-        total_time = sum(r.judge_time for r in judge_results.values())
 
         # Build reasoning summary
         reasoning_parts = []
@@ -313,7 +528,6 @@ class EnsembleJudge:
             noise_count=avg_noise,
             reasoning=reasoning,
             total_cost=total_cost,
-            total_time=total_time,
             semantic_score=mean_score,
             essential_finding_captured=essential_finding,
             severity_aligned=severity_aligned,
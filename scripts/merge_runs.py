@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+Merge sharded runner output into a single run directory.
+
+Each shard is a run directory written by ``runner.py --shard i/N``. The
+merged directory has the same layout as an unsharded run: one
+``{model}.json`` (and ``{model}.jsonl`` checkpoint) per model, in case order,
+and a ``summary.json`` whose per-model costs, times and counts are summed
+across shards.
+
+Usage:
+    python scripts/merge_runs.py results/run_1of4 results/run_2of4 results/run_3of4 results/run_4of4 \\
+        --output-dir results/20250124_xxxxxx_run
+"""
+
+import argparse
+import json
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+# Per-model summary fields that add up across shards
+SUMMED_FIELDS = (
+    "total_runs", "successful", "failed", "total_cost", "total_time",
+    "cache_hits", "cached_cost", "explicit_runs", "implicit_runs",
+)
+
+# Top-level summary fields describing a single runner process
+PROCESS_FIELDS = (
+    "run_id", "adaptive_concurrency", "rate_limits", "client_pool", "response_cache", "replay", "simulator",
+)
+
+# Results are written in case order, explicit before implicit
+MODE_ORDER = {"explicit": 0, "implicit": 1}
+
+
+def result_stem(model_summary: dict[str, Any]) -> str:
+    """Result file stem for a per-model summary (``{model}`` or ``{model}.{framework}``)."""
+    if model_summary.get("framework"):
+        return f"{model_summary['model']}.{model_summary['framework']}"
+    return model_summary["model"]
+
+
+def load_shard(run_dir: Path) -> dict[str, Any]:
+    """Load and check a shard's summary.json.
+
+    Raises:
+        ValueError: If the directory is not a shard of a sharded run
+    """
+    summary_file = run_dir / "summary.json"
+    if not summary_file.exists():
+        raise ValueError(f"No summary.json in {run_dir}")
+    summary = json.loads(summary_file.read_text())
+    if not summary.get("shard"):
+        raise ValueError(f"{run_dir} is not a shard (run without --shard)")
+    return summary
+
+
+def check_shards(summaries: list[dict[str, Any]], run_dirs: list[Path]) -> None:
+    """Check that shards belong to the same run and do not overlap.
+
+    Raises:
+        ValueError: If shards disagree on N, mode or frameworks, or repeat an index
+    """
+    counts = {summary["shard"].split("/")[1] for summary in summaries}
+    if len(counts) > 1:
+        raise ValueError(f"Shards were split different ways: {', '.join(sorted(counts))}")
+    for field in ("mode", "framework"):
+        values = {json.dumps(summary.get(field)) for summary in summaries}
+        if len(values) > 1:
+            raise ValueError(f"Shards disagree on {field}: {', '.join(sorted(values))}")
+
+    seen: dict[str, Path] = {}
+    for summary, run_dir in zip(summaries, run_dirs):
+        if summary["shard"] in seen:
+            raise ValueError(f"Shard {summary['shard']} given twice: {seen[summary['shard']]} and {run_dir}")
+        seen[summary["shard"]] = run_dir
+
+    count = int(counts.pop())
+    missing = [f"{i}/{count}" for i in range(1, count + 1) if f"{i}/{count}" not in seen]
+    if missing:
+        print(f"Warning: missing shards {', '.join(missing)}; merged run is incomplete", file=sys.stderr)
+
+
+def merge_results(stem: str, shard_results: list[list[dict[str, Any]]]) -> list[dict[str, Any]]:
+    """Combine one model's results from all shards in unsharded order.
+
+    Raises:
+        ValueError: If the same run appears in more than one shard
+    """
+    merged: dict[tuple[str, str], dict[str, Any]] = {}
+    for results in shard_results:
+        for result in results:
+            key = (result["case_id"], result.get("context_mode", "explicit"))
+            if key in merged:
+                raise ValueError(f"{stem}: {key[0]} ({key[1]}) appears in more than one shard")
+            merged[key] = result
+    return [merged[key] for key in sorted(merged, key=lambda k: (k[0], MODE_ORDER.get(k[1], 2)))]
+
+
+def merge_model_summaries(summaries: list[dict[str, Any]]) -> dict[str, Any]:
+    """Sum one model's per-shard summaries."""
+    merged = {key: value for key, value in summaries[0].items() if key not in ("shard", "adaptive_concurrency")}
+    for field in SUMMED_FIELDS:
+        if field in merged:
+            merged[field] = sum(summary.get(field, 0) for summary in summaries)
+    merged["avg_time_per_run"] = merged["total_time"] / merged["total_runs"] if merged["total_runs"] else 0
+    # Shards run side by side, so the slowest one bounds the wall time
+    merged["wall_time"] = max(summary.get("wall_time", 0.0) for summary in summaries)
+    merged["errors"] = [error for summary in summaries for error in summary.get("errors", [])]
+
+    for group in ("prompt_cache", "retries"):
+        if group in merged:
+            merged[group] = {
+                key: sum(summary.get(group, {}).get(key, 0) for summary in summaries)
+                for key in merged[group]
+            }
+    if "prompt_cache" in merged:
+        prompt_cache = merged["prompt_cache"]
+        input_tokens = prompt_cache.get("input_tokens", 0)
+        prompt_cache["cache_read_rate"] = prompt_cache.get("cache_read_tokens", 0) / input_tokens if input_tokens else 0.0
+    if "batch_ids" in merged:
+        merged["batch_ids"] = sorted({batch_id for summary in summaries for batch_id in summary.get("batch_ids", [])})
+    return merged
+
+
+def merge_runs(run_dirs: list[Path], output_dir: Path) -> dict[str, Any]:
+    """Merge shard directories into ``output_dir``.
+
+    Returns:
+        The merged summary.json contents
+
+    Raises:
+        ValueError: If the shards cannot be merged
+    """
+    summaries = [load_shard(run_dir) for run_dir in run_dirs]
+    check_shards(summaries, run_dirs)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    # Per-model summaries grouped by result file, in the first shard's order
+    by_stem: dict[str, list[tuple[Path, dict[str, Any]]]] = {}
+    for run_dir, summary in zip(run_dirs, summaries):
+        for model_summary in summary["models"]:
+            by_stem.setdefault(result_stem(model_summary), []).append((run_dir, model_summary))
+
+    model_summaries = []
+    for stem, entries in by_stem.items():
+        shard_results = [json.loads((run_dir / f"{stem}.json").read_text()) for run_dir, _ in entries]
+        results = merge_results(stem, shard_results)
+        (output_dir / f"{stem}.json").write_text(json.dumps(results, indent=2, ensure_ascii=False))
+        (output_dir / f"{stem}.jsonl").write_text(
+            "".join(json.dumps(result, ensure_ascii=False) + "\n" for result in results)
+        )
+        model_summaries.append(merge_model_summaries([model_summary for _, model_summary in entries]))
+        print(f"  {stem}: {len(results)} runs from {len(entries)} shards")
+
+    merged = {key: value for key, value in summaries[0].items() if key not in PROCESS_FIELDS}
+    merged["timestamp"] = max(summary["timestamp"] for summary in summaries)
+    merged["shard"] = None
+    merged["models"] = model_summaries
+    merged["merged_from"] = [
+        {
+            "run_dir": str(run_dir),
+            "shard": summary["shard"],
+            "timestamp": summary["timestamp"],
+            **{field: summary.get(field) for field in PROCESS_FIELDS},
+        }
+        for run_dir, summary in zip(run_dirs, summaries)
+    ]
+    (output_dir / "summary.json").write_text(json.dumps(merged, indent=2, ensure_ascii=False))
+    return merged
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Merge sharded runner.py output into one run directory")
+    parser.add_argument(
+        "run_dirs",
+        type=Path,
+        nargs="+",
+        help="Shard run directories (written with runner.py --shard i/N)",
+    )
+    parser.add_argument(
+        "--output-dir",
+        type=Path,
+        help="Merged run directory (default: results/{timestamp}_run/)",
+    )
+    args = parser.parse_args()
+
+    output_dir = args.output_dir
+    if output_dir is None:
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        output_dir = Path(__file__).parent.parent / "results" / f"{timestamp}_run"
+    if output_dir.resolve() in {run_dir.resolve() for run_dir in args.run_dirs}:
+        parser.error("--output-dir must not be one of the shard directories")
+
+    print(f"Merging {len(args.run_dirs)} shards into {output_dir}")
+    try:
+        merged = merge_runs(args.run_dirs, output_dir)
+    except (ValueError, FileNotFoundError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    total_cost = sum(model.get("total_cost", 0) for model in merged["models"])
+    print(f"Merged {len(merged['models'])} result files (total cost: ${total_cost:.4f})")
+
+
+if __name__ == "__main__":
+    main()
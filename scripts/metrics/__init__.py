@@ -4,16 +4,35 @@ Metrics module for AI Review Benchmark.
 Provides detailed metrics calculation including FP analysis.
 """
 
+from .confidence import (
+    HEADLINE_METRICS,
+    ConfidenceIntervals,
+    bootstrap_intervals,
+    wilson_interval,
+)
 from .fp_metrics import (
     FPMetrics,
     TPNoiseMetrics,
     calculate_fp_metrics,
+    calculate_fp_metrics_by_model,
     calculate_tp_noise_metrics,
+    calculate_tp_noise_metrics_by_model,
 )
+from .table import SEVERITY_CODES, EvaluationTable, group_count, group_sum
 
 __all__ = [
+    "HEADLINE_METRICS",
+    "SEVERITY_CODES",
+    "ConfidenceIntervals",
+    "EvaluationTable",
     "FPMetrics",
     "TPNoiseMetrics",
+    "bootstrap_intervals",
     "calculate_fp_metrics",
+    "calculate_fp_metrics_by_model",
     "calculate_tp_noise_metrics",
+    "calculate_tp_noise_metrics_by_model",
+    "group_count",
+    "group_sum",
+    "wilson_interval",
 ]
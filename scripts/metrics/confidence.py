@@ -0,0 +1,220 @@
+"""
+Confidence intervals for headline metrics.
+
+Bootstrap intervals resample cases. Each model's evaluations are summed into
+a (case x model) matrix per metric component, and every resample is a vector
+of case counts applied to all models with one matrix product. Because all
+models share the same resamples, differences between models are paired.
+
+Wilson score intervals are given for the metrics that are proportions of
+case counts (recall, precision, FPR, Case-FPR).
+"""
+
+from dataclasses import dataclass
+from itertools import combinations
+from statistics import NormalDist
+from typing import Any
+
+import numpy as np
+
+from .table import EvaluationTable
+
+# Metrics with intervals, in report order
+HEADLINE_METRICS = ("recall", "weighted_recall", "precision", "false_positive_rate", "f1_score", "case_fpr")
+
+# Metrics that are successes / cases: (successes component, cases component)
+PROPORTIONS = {
+    "recall": ("true_positives", "bug_cases"),
+    "precision": ("true_positives", "flagged"),
+    "false_positive_rate": ("false_positives", "clean_cases"),
+    "case_fpr": ("critical_fp_cases", "clean_cases"),
+}
+
+# Resamples drawn at a time (bounds the counts matrix to RESAMPLE_CHUNK x cases)
+RESAMPLE_CHUNK = 1000
+
+
+def wilson_interval(successes: np.ndarray, n: np.ndarray, confidence: float = 0.95) -> np.ndarray:
+    """Wilson score interval for successes out of n (elementwise).
+
+    Returns:
+        Array of shape ``successes.shape + (2,)``; NaN where n is 0
+    """
+    successes = np.asarray(successes, dtype=np.float64)
+    n = np.asarray(n, dtype=np.float64)
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        p = successes / n
+        denominator = 1 + z**2 / n
+        center = (p + z**2 / (2 * n)) / denominator
+        half_width = z * np.sqrt(p * (1 - p) / n + z**2 / (4 * n**2)) / denominator
+    return np.stack([center - half_width, center + half_width], axis=-1)
+
+
+def case_components(table: EvaluationTable) -> dict[str, np.ndarray]:
+    """Per-case sums of the counts behind each metric, shaped (cases, models)."""
+    n_models = len(table.model_labels)
+    n_cases = len(table.case_labels)
+    keys = table.case * n_models + table.model
+
+    def matrix(values: np.ndarray) -> np.ndarray:
+        return np.bincount(keys, weights=values, minlength=n_cases * n_models).reshape(n_cases, n_models)
+
+    bug = table.expected_detection
+    clean = ~bug
+    false_positive = clean & ~table.detected
+    true_positive = bug & table.detected
+    return {
+        "bug_cases": matrix(bug.astype(np.float64)),
+        "true_positives": matrix(true_positive.astype(np.float64)),
+        "detection_score": matrix(np.where(bug, table.detection_score, 0.0)),
+        "clean_cases": matrix(clean.astype(np.float64)),
+        "false_positives": matrix(false_positive.astype(np.float64)),
+        "flagged": matrix((true_positive | false_positive).astype(np.float64)),
+        "critical_fp_cases": matrix((clean & (table.critical_count > 0)).astype(np.float64)),
+    }
+
+
+def metric_values(sums: dict[str, np.ndarray]) -> dict[str, np.ndarray]:
+    """Headline metrics from summed components (any shape); NaN where undefined."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        recall = sums["true_positives"] / sums["bug_cases"]
+        precision = sums["true_positives"] / sums["flagged"]
+        # Same convention as ModelMetrics: F1 is 0 when precision + recall is 0
+        f1 = np.where(precision + recall > 0, 2 * precision * recall / (precision + recall), 0.0)
+        return {
+            "recall": recall,
+            "weighted_recall": sums["detection_score"] / sums["bug_cases"],
+            "precision": precision,
+            "false_positive_rate": sums["false_positives"] / sums["clean_cases"],
+            "f1_score": np.where(np.isnan(recall) | np.isnan(precision), np.nan, f1),
+            "case_fpr": sums["critical_fp_cases"] / sums["clean_cases"],
+        }
+
+
+def _interval(values: np.ndarray) -> list[float] | None:
+    return None if np.isnan(values).any() else [float(values[0]), float(values[1])]
+
+
+def _value(value: float) -> float | None:
+    return None if np.isnan(value) else float(value)
+
+
+@dataclass
+class ConfidenceIntervals:
+    """Bootstrap and Wilson intervals for every model of an EvaluationTable.
+
+    Arrays are indexed by model position in ``models``; ``differences`` holds
+    the paired-bootstrap interval of ``models[i] - models[j]`` at ``[i, j]``.
+    """
+    models: tuple[str, ...]
+    confidence: float
+    resamples: int
+    estimates: dict[str, np.ndarray]  # metric -> (models,)
+    bootstrap: dict[str, np.ndarray]  # metric -> (models, 2)
+    wilson: dict[str, np.ndarray]  # metric -> (models, 2), proportions only
+    differences: dict[str, np.ndarray]  # metric -> (models, models, 2)
+
+    def for_model(self, model: str) -> dict[str, dict[str, Any]]:
+        """Estimate and intervals per metric for one model (JSON-serializable)."""
+        i = self.models.index(model)
+        return {
+            metric: {
+                "estimate": _value(self.estimates[metric][i]),
+                "bootstrap": _interval(self.bootstrap[metric][i]),
+                "wilson": _interval(self.wilson[metric][i]) if metric in self.wilson else None,
+            }
+            for metric in HEADLINE_METRICS
+        }
+
+    def difference(self, model: str, baseline: str) -> dict[str, dict[str, Any]]:
+        """Paired difference ``model - baseline`` per metric (JSON-serializable)."""
+        i, j = self.models.index(model), self.models.index(baseline)
+        return {
+            metric: {
+                "estimate": _value(self.estimates[metric][i] - self.estimates[metric][j]),
+                "bootstrap": _interval(self.differences[metric][i, j]),
+            }
+            for metric in HEADLINE_METRICS
+        }
+
+    def to_dict(self) -> dict[str, Any]:
+        """Settings and every pairwise difference, for metrics.json."""
+        return {
+            "confidence": self.confidence,
+            "resamples": self.resamples,
+            "differences": {
+                f"{a} - {b}": self.difference(a, b) for a, b in combinations(self.models, 2)
+            },
+        }
+
+
+def bootstrap_intervals(
+    table: EvaluationTable,
+    resamples: int = 10_000,
+    confidence: float = 0.95,
+    seed: int = 0,
+) -> ConfidenceIntervals:
+    """Percentile bootstrap and Wilson intervals for the headline metrics.
+
+    Args:
+        table: Evaluations of every model
+        resamples: Bootstrap resamples of the cases
+        confidence: Interval coverage, e.g. 0.95
+        seed: Random seed (the same seed gives the same intervals)
+    """
+    components = case_components(table)
+    n_cases, n_models = components["bug_cases"].shape
+    stacked = np.concatenate(list(components.values()), axis=1)  # (cases, components * models)
+    rng = np.random.default_rng(seed)
+
+    samples: dict[str, list[np.ndarray]] = {metric: [] for metric in HEADLINE_METRICS}
+    for start in range(0, resamples if n_cases else 0, RESAMPLE_CHUNK):
+        chunk = min(RESAMPLE_CHUNK, resamples - start)
+        # How often each case is drawn in each resample, shaped (chunk, cases)
+        draws = rng.integers(0, n_cases, size=(chunk, n_cases)) + np.arange(chunk)[:, None] * n_cases
+        counts = np.bincount(draws.ravel(), minlength=chunk * n_cases).reshape(chunk, n_cases)
+        sums = counts.astype(np.float64) @ stacked
+        resampled = metric_values({
+            name: sums[:, k * n_models:(k + 1) * n_models] for k, name in enumerate(components)
+        })
+        for metric in HEADLINE_METRICS:
+            samples[metric].append(resampled[metric])
+
+    totals = {name: matrix.sum(axis=0) for name, matrix in components.items()}
+    estimates = metric_values(totals)
+    percentiles = [50 * (1 - confidence), 50 * (1 + confidence)]
+    bootstrap: dict[str, np.ndarray] = {}
+    differences: dict[str, np.ndarray] = {}
+    for metric in HEADLINE_METRICS:
+        if not samples[metric]:
+            bootstrap[metric] = np.full((n_models, 2), np.nan)
+            differences[metric] = np.full((n_models, n_models, 2), np.nan)
+            continue
+        values = np.concatenate(samples[metric])  # (resamples, models)
+        with np.errstate(invalid="ignore"):
+            bootstrap[metric] = _percentiles(values, percentiles)
+            differences[metric] = _percentiles(values[:, :, None] - values[:, None, :], percentiles)
+
+    wilson = {
+        metric: wilson_interval(totals[successes], totals[cases], confidence)
+        for metric, (successes, cases) in PROPORTIONS.items()
+    }
+    return ConfidenceIntervals(
+        models=table.model_labels,
+        confidence=confidence,
+        resamples=resamples,
+        estimates=estimates,
+        bootstrap=bootstrap,
+        wilson=wilson,
+        differences=differences,
+    )
+
+
+def _percentiles(values: np.ndarray, percentiles: list[float]) -> np.ndarray:
+    """Percentiles over resamples (axis 0), ignoring undefined resamples; NaN if all are undefined."""
+    defined = ~np.isnan(values).all(axis=0)
+    result = np.full(values.shape[1:] + (2,), np.nan)
+    if defined.any():
+        result[defined] = np.moveaxis(np.nanpercentile(values[:, defined], percentiles, axis=0), 0, -1)
+    return result
@@ -5,11 +5,19 @@ Provides two-stage FP/noise measurement:
 1. Case-level FPR: How many FP test cases had false positives
 2. Finding-level FPR: Total count of false findings in FP cases
 3. TP Noise Rate: Extra findings in true positive cases
+
+Metrics are computed over an ``EvaluationTable``; the ``*_by_model`` variants
+aggregate every model of a table in one grouped pass.
 """
 
+from collections.abc import Iterable
 from dataclasses import dataclass, field, asdict
 from typing import Any
 
+import numpy as np
+
+from .table import EvaluationTable, group_count, group_sum
+
 
 @dataclass
 class FPMetrics:
@@ -61,141 +69,131 @@ class TPNoiseMetrics:
         return asdict(self)
 
 
-def calculate_fp_metrics(evaluations: list[dict[str, Any]]) -> FPMetrics:
+def _as_table(evaluations: "Iterable[Any] | EvaluationTable") -> EvaluationTable:
+    if isinstance(evaluations, EvaluationTable):
+        return evaluations
+    return EvaluationTable.from_evaluations(evaluations)
+
+
+def _fp_metrics(table: EvaluationTable, groups: np.ndarray, n_groups: int) -> list[FPMetrics]:
+    """FP metrics for each group of rows, computed in one grouped pass."""
+    fp = ~table.expected_detection
+    total_fp_cases = group_count(groups, n_groups, fp)
+    with_critical = group_count(groups, n_groups, fp & (table.critical_count > 0))
+    with_major = group_count(groups, n_groups, fp & (table.major_count > 0))
+    with_any = group_count(groups, n_groups, fp & (table.review_issue_count > 0))
+    total_findings = group_sum(groups, n_groups, table.review_issue_count, fp)
+    critical_findings = group_sum(groups, n_groups, table.critical_count, fp)
+    major_findings = group_sum(groups, n_groups, table.major_count, fp)
+    minor_findings = group_sum(groups, n_groups, table.minor_count, fp)
+
+    metrics = []
+    for g in range(n_groups):
+        cases = int(total_fp_cases[g])
+        if not cases:
+            metrics.append(FPMetrics())
+            continue
+        findings = int(total_findings[g])
+        critical, major, minor = int(critical_findings[g]), int(major_findings[g]), int(minor_findings[g])
+        metrics.append(FPMetrics(
+            total_fp_cases=cases,
+            fp_cases_with_critical=int(with_critical[g]),
+            fp_cases_with_major=int(with_major[g]),
+            fp_cases_with_any=int(with_any[g]),
+            case_fpr=int(with_critical[g]) / cases,
+            total_findings_in_fp=findings,
+            critical_findings_in_fp=critical,
+            major_findings_in_fp=major,
+            minor_findings_in_fp=minor,
+            finding_fpr=findings / cases,
+            fp_breakdown={
+                "critical": critical,
+                "major": major,
+                "minor": minor,
+            },
+        ))
+    return metrics
+
+
+def _tp_noise_metrics(table: EvaluationTable, groups: np.ndarray, n_groups: int) -> list[TPNoiseMetrics]:
+    """TP noise metrics for each group of rows, computed in one grouped pass."""
+    tp = table.expected_detection
+    total_tp_cases = group_count(groups, n_groups, tp)
+    detected_tp_cases = group_count(groups, n_groups, tp & table.detected)
+    total_findings = group_sum(groups, n_groups, table.review_issue_count, tp)
+    critical_findings = group_sum(groups, n_groups, table.critical_count, tp)
+    major_findings = group_sum(groups, n_groups, table.major_count, tp)
+    minor_findings = group_sum(groups, n_groups, table.minor_count, tp)
+
+    metrics = []
+    for g in range(n_groups):
+        if not total_tp_cases[g]:
+            metrics.append(TPNoiseMetrics())
+            continue
+        detected = int(detected_tp_cases[g])
+        findings = int(total_findings[g])
+        critical, major = int(critical_findings[g]), int(major_findings[g])
+
+        # Expected findings = 1 per detected case (the actual bug)
+        noise_findings = max(0, findings - detected)
+
+        # Noise breakdown: findings beyond expected
+        # Approximation: if detected, 1 finding is valid, rest is noise
+        # For more precise tracking, we'd need to match findings to expected bugs
+        metrics.append(TPNoiseMetrics(
+            total_tp_cases=int(total_tp_cases[g]),
+            detected_tp_cases=detected,
+            total_findings_in_tp=findings,
+            expected_findings_in_tp=detected,
+            noise_findings_in_tp=noise_findings,
+            noise_rate_in_tp=noise_findings / findings if findings > 0 else 0.0,
+            noise_breakdown={
+                "critical_noise": max(0, critical - detected),
+                "major_noise": major if critical >= detected else max(0, major - (detected - critical)),
+                "minor_noise": int(minor_findings[g]),
+            },
+        ))
+    return metrics
+
+
+def calculate_fp_metrics(evaluations: "Iterable[Any] | EvaluationTable") -> FPMetrics:
     """Calculate false positive metrics from evaluations.
 
     Args:
-        evaluations: List of evaluation result dictionaries
+        evaluations: Evaluation result dictionaries (or EvaluationResult
+            objects, or an EvaluationTable)
 
     Returns:
         FPMetrics with case-level and finding-level FP analysis
     """
-    # Filter to FP cases (expected_detection=False)
-    fp_evals = [e for e in evaluations if not e.get("expected_detection", True)]
-
-    if not fp_evals:
-        return FPMetrics()
-
-    total_fp_cases = len(fp_evals)
-
-    # Case-level counts
-    fp_cases_with_critical = 0
-    fp_cases_with_major = 0
-    fp_cases_with_any = 0
-
-    # Finding-level counts
-    total_findings = 0
-    critical_findings = 0
-    major_findings = 0
-    minor_findings = 0
-
-    for e in fp_evals:
-        critical = e.get("critical_count", 0)
-        major = e.get("major_count", 0)
-        minor = e.get("minor_count", 0)
-        issue_count = e.get("review_issue_count", critical + major + minor)
-
-        # Case-level
-        if critical > 0:
-            fp_cases_with_critical += 1
-        if major > 0:
-            fp_cases_with_major += 1
-        if issue_count > 0:
-            fp_cases_with_any += 1
-
-        # Finding-level
-        total_findings += issue_count
-        critical_findings += critical
-        major_findings += major
-        minor_findings += minor
-
-    # Calculate rates
-    case_fpr = fp_cases_with_critical / total_fp_cases if total_fp_cases > 0 else 0.0
-    finding_fpr = total_findings / total_fp_cases if total_fp_cases > 0 else 0.0
-
-    return FPMetrics(
-        total_fp_cases=total_fp_cases,
-        fp_cases_with_critical=fp_cases_with_critical,
-        fp_cases_with_major=fp_cases_with_major,
-        fp_cases_with_any=fp_cases_with_any,
-        case_fpr=case_fpr,
-        total_findings_in_fp=total_findings,
-        critical_findings_in_fp=critical_findings,
-        major_findings_in_fp=major_findings,
-        minor_findings_in_fp=minor_findings,
-        finding_fpr=finding_fpr,
-        fp_breakdown={
-            "critical": critical_findings,
-            "major": major_findings,
-            "minor": minor_findings,
-        },
-    )
-
-
-def calculate_tp_noise_metrics(evaluations: list[dict[str, Any]]) -> TPNoiseMetrics:
+    table = _as_table(evaluations)
+    return _fp_metrics(table, np.zeros(len(table), dtype=np.int64), 1)[0]
+
+
+def calculate_tp_noise_metrics(evaluations: "Iterable[Any] | EvaluationTable") -> TPNoiseMetrics:
     """Calculate noise metrics for True Positive cases.
 
     Noise = findings beyond the expected bug detection.
 
     Args:
-        evaluations: List of evaluation result dictionaries
+        evaluations: Evaluation result dictionaries (or EvaluationResult
+            objects, or an EvaluationTable)
 
     Returns:
         TPNoiseMetrics with noise analysis for TP cases
     """
-    # Filter to TP cases (expected_detection=True)
-    tp_evals = [e for e in evaluations if e.get("expected_detection", True)]
+    table = _as_table(evaluations)
+    return _tp_noise_metrics(table, np.zeros(len(table), dtype=np.int64), 1)[0]
 
-    if not tp_evals:
-        return TPNoiseMetrics()
 
-    total_tp_cases = len(tp_evals)
-    detected_tp_cases = sum(1 for e in tp_evals if e.get("detected", False))
+def calculate_fp_metrics_by_model(table: EvaluationTable) -> dict[str, FPMetrics]:
+    """FP metrics for every model in the table."""
+    return dict(zip(table.model_labels, _fp_metrics(table, table.model, len(table.model_labels))))
 
-    # Finding counts
-    total_findings = 0
-    critical_findings = 0
-    major_findings = 0
-    minor_findings = 0
-
-    for e in tp_evals:
-        critical = e.get("critical_count", 0)
-        major = e.get("major_count", 0)
-        minor = e.get("minor_count", 0)
-        issue_count = e.get("review_issue_count", critical + major + minor)
-
-        total_findings += issue_count
-        critical_findings += critical
-        major_findings += major
-        minor_findings += minor
-
-    # Expected findings = 1 per detected case (the actual bug)
-    expected_findings = detected_tp_cases
-    noise_findings = max(0, total_findings - expected_findings)
 
-    # Noise rate
-    noise_rate = noise_findings / total_findings if total_findings > 0 else 0.0
-
-    # Noise breakdown: findings beyond expected
-    # Approximation: if detected, 1 finding is valid, rest is noise
-    # For more precise tracking, we'd need to match findings to expected bugs
-    noise_critical = max(0, critical_findings - detected_tp_cases)
-    noise_major = major_findings if critical_findings >= detected_tp_cases else max(0, major_findings - (detected_tp_cases - critical_findings))
-    noise_minor = minor_findings
-
-    return TPNoiseMetrics(
-        total_tp_cases=total_tp_cases,
-        detected_tp_cases=detected_tp_cases,
-        total_findings_in_tp=total_findings,
-        expected_findings_in_tp=expected_findings,
-        noise_findings_in_tp=noise_findings,
-        noise_rate_in_tp=noise_rate,
-        noise_breakdown={
-            "critical_noise": noise_critical,
-            "major_noise": noise_major,
-            "minor_noise": noise_minor,
-        },
-    )
+def calculate_tp_noise_metrics_by_model(table: EvaluationTable) -> dict[str, TPNoiseMetrics]:
+    """TP noise metrics for every model in the table."""
+    return dict(zip(table.model_labels, _tp_noise_metrics(table, table.model, len(table.model_labels))))
 
 
 def calculate_all_fp_noise_metrics(
@@ -0,0 +1,167 @@
+"""
+Columnar table of evaluation results.
+
+``EvaluationTable`` keeps one NumPy array per evaluation field. Metrics are
+computed with grouped reductions (``np.bincount`` over integer group codes),
+so every model is aggregated in the same pass instead of re-filtering the
+evaluation list once per metric.
+"""
+
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+
+# highest_severity codes
+SEVERITY_CODES = {"minor": 1, "major": 2, "critical": 3}
+
+
+def encode(values: list[str]) -> tuple[np.ndarray, tuple[str, ...]]:
+    """Integer codes for string values and the labels they index (first appearance order)."""
+    index: dict[str, int] = {}
+    codes = np.fromiter((index.setdefault(value, len(index)) for value in values), dtype=np.int64, count=len(values))
+    return codes, tuple(index)
+
+
+def group_count(groups: np.ndarray, n_groups: int, mask: np.ndarray | None = None) -> np.ndarray:
+    """Rows per group, optionally only rows where ``mask`` is set."""
+    return np.bincount(groups if mask is None else groups[mask], minlength=n_groups)
+
+
+def group_sum(groups: np.ndarray, n_groups: int, values: np.ndarray, mask: np.ndarray | None = None) -> np.ndarray:
+    """Sum of ``values`` per group, optionally only over rows where ``mask`` is set.
+
+    Rows are added in table order, so the sums equal a sequential Python sum.
+    """
+    if mask is not None:
+        groups, values = groups[mask], values[mask]
+    return np.bincount(groups, weights=values, minlength=n_groups)
+
+
+def _column(records: list[Any], name: str, default: Any = None) -> list[Any]:
+    if records and isinstance(records[0], Mapping):
+        return [record.get(name, default) for record in records]
+    return [getattr(record, name, default) for record in records]
+
+
+def _numbers(values: list[Any], dtype: type) -> np.ndarray:
+    return np.array([value or 0 for value in values], dtype=dtype)
+
+
+def _flags(values: list[Any]) -> np.ndarray:
+    return np.fromiter((bool(value) for value in values), dtype=bool, count=len(values))
+
+
+@dataclass(frozen=True)
+class EvaluationTable:
+    """Evaluations as parallel arrays, one row per evaluation.
+
+    String fields are integer codes into the matching ``*_labels`` tuple;
+    ``case`` identifies the run (``framework/case_id/context_mode``) across models.
+    ``semantic`` marks semantic-judge rows with a score; ``semantic_score``
+    is 0 elsewhere.
+    """
+    model: np.ndarray
+    model_labels: tuple[str, ...]
+    case: np.ndarray
+    case_labels: tuple[str, ...]
+    category: np.ndarray
+    category_labels: tuple[str, ...]
+    difficulty: np.ndarray
+    difficulty_labels: tuple[str, ...]
+    context_mode: np.ndarray
+    context_mode_labels: tuple[str, ...]
+    expected_detection: np.ndarray
+    detected: np.ndarray
+    detection_score: np.ndarray
+    highest_severity: np.ndarray
+    accuracy: np.ndarray
+    noise_count: np.ndarray
+    semantic: np.ndarray
+    semantic_score: np.ndarray
+    essential_finding_captured: np.ndarray
+    severity_aligned: np.ndarray
+    fix_correct: np.ndarray
+    fix_score: np.ndarray
+    critical_count: np.ndarray
+    major_count: np.ndarray
+    minor_count: np.ndarray
+    review_issue_count: np.ndarray
+
+    @classmethod
+    def from_evaluations(cls, evaluations: Iterable[Any]) -> "EvaluationTable":
+        """Build a table from EvaluationResult objects or their ``asdict`` dicts.
+
+        Missing dict keys take the defaults of the dict-based FP metrics
+        (``expected_detection`` True, ``review_issue_count`` the sum of the
+        severity counts).
+        """
+        records = list(evaluations)
+        model, model_labels = encode(_column(records, "model", ""))
+        case, case_labels = encode([
+            f"{framework or ''}/{case_id}/{context_mode}"
+            for framework, case_id, context_mode in zip(
+                _column(records, "framework"),
+                _column(records, "case_id", ""),
+                _column(records, "context_mode", "explicit"),
+            )
+        ])
+        category, category_labels = encode(_column(records, "category", "unknown"))
+        difficulty, difficulty_labels = encode(_column(records, "difficulty", "unknown"))
+        context_mode, context_mode_labels = encode(_column(records, "context_mode", "explicit"))
+
+        critical_count = _numbers(_column(records, "critical_count", 0), np.int64)
+        major_count = _numbers(_column(records, "major_count", 0), np.int64)
+        minor_count = _numbers(_column(records, "minor_count", 0), np.int64)
+        # Dicts without review_issue_count count their severity findings instead
+        review_issue_count = np.array(_column(records, "review_issue_count"), dtype=np.float64)
+        review_issue_count = np.where(
+            np.isnan(review_issue_count), critical_count + major_count + minor_count, review_issue_count,
+        ).astype(np.int64)
+
+        semantic_scores = _column(records, "semantic_score")
+        semantic = np.array([
+            mode == "semantic" and score is not None
+            for mode, score in zip(_column(records, "evaluation_mode", "severity"), semantic_scores)
+        ], dtype=bool)
+        return cls(
+            model=model,
+            model_labels=model_labels,
+            case=case,
+            case_labels=case_labels,
+            category=category,
+            category_labels=category_labels,
+            difficulty=difficulty,
+            difficulty_labels=difficulty_labels,
+            context_mode=context_mode,
+            context_mode_labels=context_mode_labels,
+            expected_detection=_flags(_column(records, "expected_detection", True)),
+            detected=_flags(_column(records, "detected", False)),
+            detection_score=_numbers(_column(records, "detection_score", 0.0), np.float64),
+            highest_severity=np.array(
+                [SEVERITY_CODES.get(severity, 0) for severity in _column(records, "highest_severity")], dtype=np.int8,
+            ),
+            accuracy=_numbers(_column(records, "accuracy", 0), np.float64),
+            noise_count=_numbers(_column(records, "noise_count", 0), np.int64),
+            semantic=semantic,
+            semantic_score=np.where(semantic, _numbers(semantic_scores, np.float64), 0.0),
+            essential_finding_captured=_flags(_column(records, "essential_finding_captured")),
+            severity_aligned=_flags(_column(records, "severity_aligned")),
+            fix_correct=_flags(_column(records, "fix_correct", False)),
+            fix_score=_numbers(_column(records, "fix_score", 0.0), np.float64),
+            critical_count=critical_count,
+            major_count=major_count,
+            minor_count=minor_count,
+            review_issue_count=review_issue_count,
+        )
+
+    def __len__(self) -> int:
+        return len(self.model)
+
+    def label_mask(self, column: str, label: str) -> np.ndarray:
+        """Rows whose string field ``column`` equals ``label``."""
+        labels: tuple[str, ...] = getattr(self, f"{column}_labels")
+        if label not in labels:
+            return np.zeros(len(self), dtype=bool)
+        return getattr(self, column) == labels.index(label)
@@ -0,0 +1,118 @@
+"""
+Providers module for AI Review Benchmark.
+
+Shared infrastructure for calling LLM provider APIs from the runner and judges.
+"""
+
+from .batch import (
+    AnthropicBatchBackend,
+    BatchBackend,
+    BatchRequest,
+    BatchResponse,
+    LocalBatchBackend,
+    LocalBatchServer,
+    OpenAIBatchBackend,
+)
+from .cache import (
+    ResponseCache,
+    configure_judge_cache,
+    get_judge_cache,
+    judge_cache_key,
+    make_cache_key,
+)
+from .clients import ClientRegistry, get_client_registry
+from .concurrency import (
+    AIMDLimiter,
+    concurrency_stats,
+    configure_adaptive_concurrency,
+    get_concurrency_limiter,
+    is_throttle,
+)
+from .rate_limit import (
+    RateLimiter,
+    TokenBucket,
+    estimate_tokens,
+    get_rate_limiter,
+    rate_limiter_stats,
+)
+from .replay import (
+    JUDGE_RECORDINGS_FILE,
+    ReplayMissError,
+    ReplayStore,
+    ResponseRecorder,
+    configure_judge_provider,
+    get_judge_recorder,
+    get_judge_replay,
+    parse_provider_spec,
+    prompt_hash,
+    record_judge_response,
+)
+from .retry import (
+    AttemptTimeoutError,
+    CallStats,
+    RetryPolicy,
+    configure_retry_policy,
+    get_retry_policy,
+    is_retryable,
+)
+from .simulator import (
+    SimulatedAPIError,
+    SimulatedProvider,
+    SimulatedRateLimitError,
+    SimulatedServerError,
+    SimulationProfile,
+    configure_simulator,
+    get_simulator,
+    load_profiles,
+)
+
+__all__ = [
+    "JUDGE_RECORDINGS_FILE",
+    "AIMDLimiter",
+    "AnthropicBatchBackend",
+    "AttemptTimeoutError",
+    "BatchBackend",
+    "BatchRequest",
+    "BatchResponse",
+    "CallStats",
+    "ClientRegistry",
+    "LocalBatchBackend",
+    "LocalBatchServer",
+    "OpenAIBatchBackend",
+    "RateLimiter",
+    "ReplayMissError",
+    "ReplayStore",
+    "ResponseCache",
+    "ResponseRecorder",
+    "RetryPolicy",
+    "SimulatedAPIError",
+    "SimulatedProvider",
+    "SimulatedRateLimitError",
+    "SimulatedServerError",
+    "SimulationProfile",
+    "TokenBucket",
+    "concurrency_stats",
+    "configure_adaptive_concurrency",
+    "configure_judge_cache",
+    "configure_judge_provider",
+    "configure_retry_policy",
+    "configure_simulator",
+    "estimate_tokens",
+    "get_client_registry",
+    "get_concurrency_limiter",
+    "get_judge_cache",
+    "get_judge_recorder",
+    "get_judge_replay",
+    "get_rate_limiter",
+    "get_retry_policy",
+    "get_simulator",
+    "is_retryable",
+    "is_throttle",
+    "judge_cache_key",
+    "load_profiles",
+    "make_cache_key",
+    "parse_provider_spec",
+    "prompt_hash",
+    "rate_limiter_stats",
+    "record_judge_response",
+]
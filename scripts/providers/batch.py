@@ -0,0 +1,378 @@
+"""
+Asynchronous batch execution through provider Batch APIs.
+
+Backends share one protocol: ``submit`` a list of requests, ``poll`` until
+the batch has ended, then fetch ``results`` keyed by custom_id.
+
+- AnthropicBatchBackend: Anthropic Message Batches
+- OpenAIBatchBackend: OpenAI Batch API (JSONL file upload)
+- LocalBatchBackend: file-based stand-in that speaks the OpenAI JSONL
+  format, served by LocalBatchServer, for offline runs and tests
+
+Usage (stand-alone local server):
+    python scripts/providers/batch.py serve --root results/batches
+"""
+
+import argparse
+import json
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+# Terminal batch states (normalized)
+BATCH_ENDED = "ended"
+BATCH_IN_PROGRESS = "in_progress"
+
+# Batch API calls are not wrapped by RetryPolicy, so they keep SDK retries and
+# the SDK default timeout instead of the pooled clients' per-attempt settings
+BATCH_SDK_MAX_RETRIES = 2
+BATCH_SDK_TIMEOUT = 600.0
+
+# OpenAI batch statuses that mean no further progress will happen
+_OPENAI_TERMINAL_STATUSES = ("completed", "failed", "expired", "cancelled")
+
+
+@dataclass
+class BatchRequest:
+    """A single prompt submitted as part of a batch."""
+    custom_id: str
+    model_id: str
+    prompt: str
+    max_tokens: int
+
+
+@dataclass
+class BatchResponse:
+    """Outcome of a single batch request."""
+    custom_id: str
+    text: str | None = None
+    input_tokens: int = 0
+    output_tokens: int = 0
+    error: str | None = None
+
+
+class BatchBackend(ABC):
+    """Submit/poll/results protocol shared by all batch backends."""
+
+    name: str = ""
+
+    @abstractmethod
+    def submit(self, requests: list[BatchRequest]) -> str:
+        """Submit requests and return the batch ID."""
+
+    @abstractmethod
+    def poll(self, batch_id: str) -> str:
+        """Return BATCH_ENDED or BATCH_IN_PROGRESS."""
+
+    @abstractmethod
+    def results(self, batch_id: str) -> dict[str, BatchResponse]:
+        """Fetch results of an ended batch keyed by custom_id."""
+
+    def wait(
+        self,
+        batch_id: str,
+        poll_interval: float,
+        on_poll: Callable[[str, float], None] | None = None,
+    ) -> dict[str, BatchResponse]:
+        """Poll until the batch ends and return its results.
+
+        Args:
+            batch_id: Batch to wait for
+            poll_interval: Seconds between polls
+            on_poll: Optional progress callback receiving (status, elapsed seconds)
+        """
+        start = time.time()
+        while True:
+            status = self.poll(batch_id)
+            if on_poll:
+                on_poll(status, time.time() - start)
+            if status == BATCH_ENDED:
+                return self.results(batch_id)
+            time.sleep(poll_interval)
+
+
+class AnthropicBatchBackend(BatchBackend):
+    """Anthropic Message Batches API."""
+
+    name = "anthropic"
+
+    def __init__(self, client: Any):
+        """Initialize with an ``anthropic.Anthropic`` client."""
+        self.client = client.with_options(max_retries=BATCH_SDK_MAX_RETRIES, timeout=BATCH_SDK_TIMEOUT)
+
+    def submit(self, requests: list[BatchRequest]) -> str:
+        batch = self.client.messages.batches.create(
+            requests=[
+                {
+                    "custom_id": r.custom_id,
+                    "params": {
+                        "model": r.model_id,
+                        "max_tokens": r.max_tokens,
+                        "messages": [{"role": "user", "content": r.prompt}],
+                    },
+                }
+                for r in requests
+            ],
+        )
+        return batch.id
+
+    def poll(self, batch_id: str) -> str:
+        batch = self.client.messages.batches.retrieve(batch_id)
+        return BATCH_ENDED if batch.processing_status == "ended" else BATCH_IN_PROGRESS
+
+    def results(self, batch_id: str) -> dict[str, BatchResponse]:
+        responses: dict[str, BatchResponse] = {}
+        for entry in self.client.messages.batches.results(batch_id):
+            if entry.result.type == "succeeded":
+                message = entry.result.message
+                responses[entry.custom_id] = BatchResponse(
+                    custom_id=entry.custom_id,
+                    text=message.content[0].text,
+                    input_tokens=message.usage.input_tokens,
+                    output_tokens=message.usage.output_tokens,
+                )
+            else:
+                error = getattr(entry.result, "error", None)
+                responses[entry.custom_id] = BatchResponse(
+                    custom_id=entry.custom_id,
+                    error=f"{entry.result.type}: {error}" if error else entry.result.type,
+                )
+        return responses
+
+
+def _openai_request_line(request: BatchRequest) -> dict[str, Any]:
+    """One line of an OpenAI batch input file."""
+    return {
+        "custom_id": request.custom_id,
+        "method": "POST",
+        "url": "/v1/chat/completions",
+        "body": {
+            "model": request.model_id,
+            "max_tokens": request.max_tokens,
+            "messages": [{"role": "user", "content": request.prompt}],
+        },
+    }
+
+
+def _parse_openai_output_line(line: dict[str, Any]) -> BatchResponse:
+    """Convert one line of an OpenAI batch output/error file."""
+    custom_id = line["custom_id"]
+    if line.get("error"):
+        return BatchResponse(custom_id=custom_id, error=str(line["error"]))
+
+    response = line.get("response") or {}
+    body = response.get("body") or {}
+    if response.get("status_code") != 200:
+        return BatchResponse(custom_id=custom_id, error=f"HTTP {response.get('status_code')}: {body}")
+
+    usage = body.get("usage") or {}
+    return BatchResponse(
+        custom_id=custom_id,
+        text=body["choices"][0]["message"].get("content") or "",
+        input_tokens=usage.get("prompt_tokens", 0),
+        output_tokens=usage.get("completion_tokens", 0),
+    )
+
+
+class OpenAIBatchBackend(BatchBackend):
+    """OpenAI Batch API (chat completions endpoint)."""
+
+    name = "openai"
+
+    def __init__(self, client: Any):
+        """Initialize with an ``openai.OpenAI`` client."""
+        self.client = client.with_options(max_retries=BATCH_SDK_MAX_RETRIES, timeout=BATCH_SDK_TIMEOUT)
+
+    def submit(self, requests: list[BatchRequest]) -> str:
+        payload = "\n".join(
+            json.dumps(_openai_request_line(r), ensure_ascii=False) for r in requests
+        )
+        input_file = self.client.files.create(
+            file=("batch_input.jsonl", payload.encode("utf-8")),
+            purpose="batch",
+        )
+        batch = self.client.batches.create(
+            input_file_id=input_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h",
+        )
+        return batch.id
+
+    def poll(self, batch_id: str) -> str:
+        batch = self.client.batches.retrieve(batch_id)
+        return BATCH_ENDED if batch.status in _OPENAI_TERMINAL_STATUSES else BATCH_IN_PROGRESS
+
+    def results(self, batch_id: str) -> dict[str, BatchResponse]:
+        batch = self.client.batches.retrieve(batch_id)
+        responses: dict[str, BatchResponse] = {}
+        for file_id in (batch.output_file_id, batch.error_file_id):
+            if not file_id:
+                continue
+            content = self.client.files.content(file_id).text
+            for raw_line in content.splitlines():
+                if raw_line.strip():
+                    response = _parse_openai_output_line(json.loads(raw_line))
+                    responses[response.custom_id] = response
+        return responses
+
+
+def canned_review_response(request: BatchRequest) -> tuple[str, int, int]:
+    """Default LocalBatchServer responder: a well-formed LGTM review."""
+    text = json.dumps(
+        {"has_issues": False, "issues": [], "summary": "No issues found (local batch stand-in)."},
+        ensure_ascii=False,
+    )
+    return text, max(1, len(request.prompt.encode("utf-8")) // 4), max(1, len(text) // 4)
+
+
+class LocalBatchServer:
+    """File-based stand-in for a provider batch service.
+
+    Layout under ``root``::
+
+        <batch_id>/input.jsonl    OpenAI-format request lines
+        <batch_id>/status.json    {"status": "validating" | "in_progress" | "completed"}
+        <batch_id>/output.jsonl   OpenAI-format response lines
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        responder: Callable[[BatchRequest], tuple[str, int, int]] = canned_review_response,
+    ):
+        """Initialize server.
+
+        Args:
+            root: Directory shared with LocalBatchBackend
+            responder: Produces (text, input_tokens, output_tokens) for a request
+        """
+        self.root = Path(root)
+        self.responder = responder
+
+    def process_pending(self) -> int:
+        """Complete every batch still waiting to be processed.
+
+        Returns:
+            Number of batches processed
+        """
+        processed = 0
+        for status_file in sorted(self.root.glob("*/status.json")):
+            status = json.loads(status_file.read_text())
+            if status["status"] != "validating":
+                continue
+            batch_dir = status_file.parent
+            _write_json(status_file, {"status": "in_progress"})
+
+            lines = []
+            for raw_line in (batch_dir / "input.jsonl").read_text().splitlines():
+                if not raw_line.strip():
+                    continue
+                request_line = json.loads(raw_line)
+                body = request_line["body"]
+                request = BatchRequest(
+                    custom_id=request_line["custom_id"],
+                    model_id=body["model"],
+                    prompt=body["messages"][0]["content"],
+                    max_tokens=body["max_tokens"],
+                )
+                try:
+                    text, input_tokens, output_tokens = self.responder(request)
+                    lines.append({
+                        "custom_id": request.custom_id,
+                        "response": {
+                            "status_code": 200,
+                            "body": {
+                                "model": request.model_id,
+                                "choices": [{"message": {"role": "assistant", "content": text}}],
+                                "usage": {"prompt_tokens": input_tokens, "completion_tokens": output_tokens},
+                            },
+                        },
+                        "error": None,
+                    })
+                except Exception as e:
+                    lines.append({"custom_id": request.custom_id, "response": None, "error": str(e)})
+
+            (batch_dir / "output.jsonl").write_text(
+                "\n".join(json.dumps(line, ensure_ascii=False) for line in lines)
+            )
+            _write_json(status_file, {"status": "completed"})
+            processed += 1
+        return processed
+
+    def serve_forever(self, poll_interval: float = 1.0, stop: threading.Event | None = None) -> None:
+        """Process batches until ``stop`` is set."""
+        self.root.mkdir(parents=True, exist_ok=True)
+        while stop is None or not stop.is_set():
+            self.process_pending()
+            time.sleep(poll_interval)
+
+    def start_in_background(self, poll_interval: float = 0.2) -> threading.Event:
+        """Serve from a daemon thread. Set the returned event to stop."""
+        stop = threading.Event()
+        thread = threading.Thread(target=self.serve_forever, args=(poll_interval, stop), daemon=True)
+        thread.start()
+        return stop
+
+
+class LocalBatchBackend(BatchBackend):
+    """Client side of the LocalBatchServer file protocol."""
+
+    name = "local"
+
+    def __init__(self, root: Path):
+        """Initialize with the directory shared with a LocalBatchServer."""
+        self.root = Path(root)
+
+    def submit(self, requests: list[BatchRequest]) -> str:
+        batch_id = f"batch_{uuid.uuid4().hex[:16]}"
+        batch_dir = self.root / batch_id
+        batch_dir.mkdir(parents=True)
+        (batch_dir / "input.jsonl").write_text(
+            "\n".join(json.dumps(_openai_request_line(r), ensure_ascii=False) for r in requests)
+        )
+        _write_json(batch_dir / "status.json", {"status": "validating"})
+        return batch_id
+
+    def poll(self, batch_id: str) -> str:
+        status = json.loads((self.root / batch_id / "status.json").read_text())
+        return BATCH_ENDED if status["status"] in _OPENAI_TERMINAL_STATUSES else BATCH_IN_PROGRESS
+
+    def results(self, batch_id: str) -> dict[str, BatchResponse]:
+        responses: dict[str, BatchResponse] = {}
+        output_file = self.root / batch_id / "output.jsonl"
+        for raw_line in output_file.read_text().splitlines():
+            if raw_line.strip():
+                response = _parse_openai_output_line(json.loads(raw_line))
+                responses[response.custom_id] = response
+        return responses
+
+
+def _write_json(path: Path, data: dict[str, Any]) -> None:
+    """Write JSON atomically so pollers never see a partial file."""
+    tmp_path = path.with_suffix(".tmp")
+    tmp_path.write_text(json.dumps(data))
+    tmp_path.replace(path)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Local batch stand-in server")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    serve_parser = subparsers.add_parser("serve", help="Process submitted batches until interrupted")
+    serve_parser.add_argument("--root", type=Path, required=True, help="Batch directory shared with the runner")
+    serve_parser.add_argument("--poll-interval", type=float, default=1.0, help="Seconds between scans")
+    args = parser.parse_args()
+
+    print(f"Serving local batches from {args.root}")
+    try:
+        LocalBatchServer(args.root).serve_forever(args.poll_interval)
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
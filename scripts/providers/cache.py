@@ -0,0 +1,122 @@
+"""
+Content-addressed on-disk cache for provider responses.
+
+Entries are stored as JSON files named by the SHA-256 of the request
+parameters (provider, model_id, max_tokens, temperature, prompt, ...), so a
+request that has not changed is served from disk instead of the API.
+Writes are atomic, which makes the cache safe to share between threads and
+between concurrent runs.
+
+The evaluator keeps a second, process-wide cache for judge responses
+(``configure_judge_cache``), keyed by judge model_id, max_tokens, temperature
+(when the request sends one) and the hash of the rendered judge prompt. The single-judge path and every ensemble
+judge read and write the same entries, so re-scoring an unchanged run makes
+no judge calls.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any
+
+from .replay import prompt_hash
+
+
+def make_cache_key(**fields: Any) -> str:
+    """Hash request parameters into a stable cache key."""
+    payload = json.dumps(fields, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """Directory of cached responses keyed by request hash."""
+
+    def __init__(self, cache_dir: Path, refresh: bool = False):
+        """Initialize cache.
+
+        Args:
+            cache_dir: Directory holding cache entries (created on first write)
+            refresh: Ignore existing entries but still write new responses
+        """
+        self.cache_dir = Path(cache_dir)
+        self.refresh = refresh
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.cost_saved = 0.0
+        self._lock = threading.Lock()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """Return the cached entry for ``key``, or None on a miss."""
+        entry = None
+        if not self.refresh:
+            path = self._path(key)
+            try:
+                entry = json.loads(path.read_text())
+            except (FileNotFoundError, json.JSONDecodeError):
+                entry = None
+
+        with self._lock:
+            if entry is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self.cost_saved += entry.get("cost", 0.0)
+        return entry
+
+    def put(self, key: str, entry: dict[str, Any]) -> None:
+        """Store ``entry`` under ``key`` (atomic replace)."""
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump(entry, f, ensure_ascii=False)
+        os.replace(tmp_name, path)
+        with self._lock:
+            self.writes += 1
+
+    def stats(self) -> dict[str, Any]:
+        """Hit/miss counters for summaries."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "cache_dir": str(self.cache_dir),
+                "refresh": self.refresh,
+                "hits": self.hits,
+                "misses": self.misses,
+                "writes": self.writes,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "cost_saved": self.cost_saved,
+            }
+
+
+# Process-wide judge response cache (None = disabled)
+_judge_cache: ResponseCache | None = None
+
+
+def judge_cache_key(model_id: str, temperature: float | None, max_tokens: int, prompt: str) -> str:
+    """Cache key for a judge request.
+
+    ``max_tokens`` is part of the key so a response truncated under a smaller
+    limit is not reused for a larger one. Pass ``temperature=None`` when the
+    request does not send a temperature.
+    """
+    return make_cache_key(
+        model_id=model_id, temperature=temperature, max_tokens=max_tokens, prompt_hash=prompt_hash(prompt),
+    )
+
+
+def configure_judge_cache(cache: ResponseCache | None) -> None:
+    """Set (or with None, disable) the judge response cache for this process."""
+    global _judge_cache
+    _judge_cache = cache
+
+
+def get_judge_cache() -> ResponseCache | None:
+    return _judge_cache
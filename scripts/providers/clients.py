@@ -0,0 +1,207 @@
+"""
+Long-lived, connection-pooled provider clients.
+
+Building an SDK client per request throws away its HTTP connection pool, so
+every call pays a fresh TCP + TLS handshake. The registry creates one client
+per provider/base_url (one GenerativeModel per Gemini model) and hands the
+same instance to every caller. Anthropic and OpenAI clients are thread-safe,
+so they can be shared by worker threads and tasks dispatched via
+``asyncio.to_thread``.
+"""
+
+import os
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from .retry import get_retry_policy
+
+# Connection pool sizing for SDKs built on httpx
+DEFAULT_MAX_CONNECTIONS = 64
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 32
+DEFAULT_KEEPALIVE_EXPIRY = 60.0
+
+
+@dataclass
+class ClientStats:
+    """Usage counters for a single pooled client.
+
+    ``repeat_requests`` counts requests served by an already-built client
+    object. Whether httpx reused an open HTTP connection for them is not
+    measured, and the summary says so under ``connection_reuse``.
+    """
+    created: int = 0
+    requests: int = 0
+    first_request_time: float | None = None
+    repeat_request_time: float = 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        repeats = max(0, self.requests - 1)
+        return {
+            "clients_created": self.created,
+            "requests": self.requests,
+            "repeat_requests": repeats,
+            "repeat_request_rate": repeats / self.requests if self.requests else 0.0,
+            "first_request_time": self.first_request_time,
+            "avg_repeat_request_time": self.repeat_request_time / repeats if repeats else None,
+            "connection_reuse": "not measured",
+        }
+
+
+class ClientRegistry:
+    """Thread-safe registry of provider clients keyed by provider/base_url."""
+
+    def __init__(
+        self,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: int = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+    ):
+        """Initialize an empty registry.
+
+        Args:
+            max_connections: Connection pool size per httpx-based client
+            max_keepalive_connections: Idle connections kept open per client
+        """
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self._clients: dict[str, Any] = {}
+        self._keys_by_client: dict[int, str] = {}
+        self._stats: dict[str, ClientStats] = {}
+        self._lock = threading.Lock()
+        self._gemini_configured = False
+        self._gemini_lock = threading.Lock()
+        self._creation_locks: dict[str, threading.Lock] = {}
+
+    def get_or_create(self, key: str, factory: Callable[[], Any]) -> Any:
+        """Return the client registered under ``key``, building it once with ``factory``.
+
+        ``factory`` runs outside the registry lock, so building one client
+        (SDK import, HTTP pool setup) does not block lookups of the others;
+        only callers of the same key wait on its creation lock.
+        """
+        with self._lock:
+            client = self._clients.get(key)
+            if client is not None:
+                return client
+            creation_lock = self._creation_locks.setdefault(key, threading.Lock())
+
+        with creation_lock:
+            with self._lock:
+                client = self._clients.get(key)
+            if client is not None:
+                return client
+            built = factory()
+            with self._lock:
+                client = self._clients.setdefault(key, built)
+                if client is built:
+                    self._keys_by_client[id(client)] = key
+                    self._stats.setdefault(key, ClientStats()).created += 1
+            return client
+
+    def record_request(self, client: Any, elapsed_time: float) -> None:
+        """Record one completed request made with a registry client."""
+        with self._lock:
+            key = self._keys_by_client.get(id(client))
+            if key is None:
+                return
+            stats = self._stats[key]
+            stats.requests += 1
+            if stats.first_request_time is None:
+                stats.first_request_time = elapsed_time
+            else:
+                stats.repeat_request_time += elapsed_time
+
+    def _http_client(self, sdk: Any) -> Any | None:
+        """Build a pooled httpx client for an SDK, or None to use the SDK default."""
+        try:
+            import httpx
+        except ImportError:
+            return None
+        factory = getattr(sdk, "DefaultHttpxClient", httpx.Client)
+        return factory(
+            limits=httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_keepalive_connections,
+                keepalive_expiry=DEFAULT_KEEPALIVE_EXPIRY,
+            ),
+        )
+
+    def _sdk_options(self) -> dict[str, Any]:
+        """Retry and timeout options that leave retries to the process RetryPolicy.
+
+        SDK retries would run inside each RetryPolicy attempt, multiplying its
+        retries and hiding them from ``attempts``/``retry_time``. The SDK
+        timeout matches the policy's per-attempt timeout (or its deadline), so
+        an abandoned attempt does not keep a request in flight past it.
+        """
+        policy = get_retry_policy()
+        options: dict[str, Any] = {"max_retries": 0}
+        timeout = policy.attempt_timeout if policy.attempt_timeout is not None else policy.deadline
+        if timeout is not None:
+            options["timeout"] = timeout
+        return options
+
+    def anthropic_client(self, api_key: str | None = None) -> Any:
+        """Shared Anthropic client (no SDK retries; see ``_sdk_options``)."""
+        def factory() -> Any:
+            import anthropic
+            kwargs: dict[str, Any] = {
+                "api_key": api_key or os.environ.get("ANTHROPIC_API_KEY"),
+                **self._sdk_options(),
+            }
+            http_client = self._http_client(anthropic)
+            if http_client is not None:
+                kwargs["http_client"] = http_client
+            return anthropic.Anthropic(**kwargs)
+
+        return self.get_or_create("anthropic", factory)
+
+    def openai_client(self, api_key: str | None, base_url: str | None = None) -> Any:
+        """Shared OpenAI-compatible client for ``base_url`` (None = api.openai.com), without SDK retries."""
+        def factory() -> Any:
+            import openai
+            kwargs: dict[str, Any] = {"api_key": api_key, **self._sdk_options()}
+            if base_url:
+                kwargs["base_url"] = base_url
+            http_client = self._http_client(openai)
+            if http_client is not None:
+                kwargs["http_client"] = http_client
+            return openai.OpenAI(**kwargs)
+
+        return self.get_or_create(f"openai:{base_url or 'default'}", factory)
+
+    def _configure_gemini(self, genai: Any, api_key: str | None) -> None:
+        """Run ``genai.configure`` once per process."""
+        with self._gemini_lock:
+            if not self._gemini_configured:
+                genai.configure(api_key=api_key or os.environ.get("GOOGLE_API_KEY"))
+                self._gemini_configured = True
+
+    def gemini_model(self, model_id: str, api_key: str | None = None) -> Any:
+        """Shared Gemini GenerativeModel; ``genai.configure`` runs only once."""
+        def factory() -> Any:
+            import google.generativeai as genai
+            self._configure_gemini(genai, api_key)
+            return genai.GenerativeModel(model_id)
+
+        return self.get_or_create(f"gemini:{model_id}", factory)
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """Snapshot of per-client usage statistics for summaries."""
+        with self._lock:
+            return {key: stats.to_dict() for key, stats in self._stats.items()}
+
+
+_default_registry: ClientRegistry | None = None
+_default_registry_lock = threading.Lock()
+
+
+def get_client_registry() -> ClientRegistry:
+    """Get the process-wide client registry."""
+    global _default_registry
+    with _default_registry_lock:
+        if _default_registry is None:
+            _default_registry = ClientRegistry()
+        return _default_registry
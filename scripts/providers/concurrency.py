@@ -0,0 +1,215 @@
+"""
+Adaptive (AIMD) concurrency control per provider.
+
+Every provider attempt holds a slot of its provider's AIMDLimiter. The
+limit grows by one after each window of successful requests whose p95
+latency stays within ``latency_tolerance`` of the best p95 seen so far, and
+is multiplied by ``decrease_factor`` when the provider throttles (429 or
+overloaded). Decreases are spaced by a cooldown so one burst of 429s from
+the same cohort of in-flight requests only halves the limit once.
+"""
+
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any
+
+from .retry import status_code_of
+
+# Statuses meaning "slow down" (529 = Anthropic overloaded)
+THROTTLE_STATUS_CODES = frozenset({429, 529})
+
+
+def is_throttle(error: BaseException) -> bool:
+    """Whether an error signals provider throttling."""
+    return status_code_of(error) in THROTTLE_STATUS_CODES
+
+
+@dataclass
+class ConcurrencyStats:
+    """Counters for one adaptive limiter."""
+    throttle_events: int = 0
+    increases: int = 0
+    decreases: int = 0
+    completed: int = 0
+    min_limit_reached: int = 0
+    max_limit_reached: int = 0
+
+
+class AIMDLimiter:
+    """Thread-safe adaptive concurrency limit."""
+
+    def __init__(
+        self,
+        name: str,
+        initial: int = 4,
+        min_limit: int = 1,
+        max_limit: int = 64,
+        decrease_factor: float = 0.5,
+        latency_tolerance: float = 1.5,
+        on_change: Callable[[str, int, int, str], None] | None = None,
+    ):
+        """Initialize limiter.
+
+        Args:
+            name: Provider name (for reporting)
+            initial: Starting limit
+            min_limit: Lower bound for the limit
+            max_limit: Upper bound for the limit
+            decrease_factor: Multiplier applied on throttling
+            latency_tolerance: Allowed p95 growth over the best p95 before
+                additive increases stop
+            on_change: Callback receiving (name, old_limit, new_limit, reason)
+        """
+        self.name = name
+        self.min_limit = max(1, min_limit)
+        self.max_limit = max(self.min_limit, max_limit)
+        self.decrease_factor = decrease_factor
+        self.latency_tolerance = latency_tolerance
+        self.on_change = on_change
+
+        self._limit = float(min(self.max_limit, max(self.min_limit, initial)))
+        self._in_flight = 0
+        self._window: deque[float] = deque()
+        self._best_p95: float | None = None
+        self._last_decrease = 0.0
+        self._condition = threading.Condition()
+        self.stats = ConcurrencyStats(
+            min_limit_reached=int(self._limit),
+            max_limit_reached=int(self._limit),
+        )
+
+    @property
+    def limit(self) -> int:
+        """Current number of requests allowed in flight."""
+        with self._condition:
+            return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        with self._condition:
+            return self._in_flight
+
+    @contextmanager
+    def slot(self) -> Iterator[None]:
+        """Hold one in-flight slot for a provider request.
+
+        Successful requests feed the latency window; throttling errors
+        shrink the limit. Other errors only release the slot.
+        """
+        with self._condition:
+            while self._in_flight >= int(self._limit):
+                self._condition.wait()
+            self._in_flight += 1
+        start = time.monotonic()
+        try:
+            yield
+        except Exception as e:
+            self._release(None, throttled=is_throttle(e))
+            raise
+        else:
+            self._release(time.monotonic() - start, throttled=False)
+
+    def _release(self, latency: float | None, throttled: bool) -> None:
+        change = None
+        with self._condition:
+            self._in_flight -= 1
+            old = int(self._limit)
+            if throttled:
+                change = self._on_throttle(old)
+            elif latency is not None:
+                change = self._on_success(old, latency)
+            self._condition.notify_all()
+        if change and self.on_change:
+            self.on_change(self.name, *change)
+
+    def _on_throttle(self, old: int) -> tuple[int, int, str] | None:
+        self.stats.throttle_events += 1
+        now = time.monotonic()
+        cooldown = self._best_p95 or 1.0
+        if now - self._last_decrease < cooldown:
+            return None
+        self._last_decrease = now
+        self._limit = max(float(self.min_limit), self._limit * self.decrease_factor)
+        self._window.clear()
+        self.stats.decreases += 1
+        new = int(self._limit)
+        self.stats.min_limit_reached = min(self.stats.min_limit_reached, new)
+        return (old, new, "throttled") if new != old else None
+
+    def _on_success(self, old: int, latency: float) -> tuple[int, int, str] | None:
+        self.stats.completed += 1
+        self._window.append(latency)
+        # One window = one "round trip" of the current limit
+        if len(self._window) < max(old, 4):
+            return None
+
+        samples = sorted(self._window)
+        p95 = samples[min(len(samples) - 1, int(0.95 * len(samples)))]
+        self._window.clear()
+        if self._best_p95 is None or p95 < self._best_p95:
+            self._best_p95 = p95
+        if p95 > self._best_p95 * self.latency_tolerance or self._limit >= self.max_limit:
+            return None
+
+        self._limit = min(float(self.max_limit), self._limit + 1)
+        self.stats.increases += 1
+        new = int(self._limit)
+        self.stats.max_limit_reached = max(self.stats.max_limit_reached, new)
+        return (old, new, f"p95 {p95:.1f}s") if new != old else None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Snapshot for summaries."""
+        with self._condition:
+            return {
+                "limit": int(self._limit),
+                "min_limit": self.min_limit,
+                "max_limit": self.max_limit,
+                "lowest_limit": self.stats.min_limit_reached,
+                "highest_limit": self.stats.max_limit_reached,
+                "throttle_events": self.stats.throttle_events,
+                "increases": self.stats.increases,
+                "decreases": self.stats.decreases,
+                "completed": self.stats.completed,
+                "best_p95": self._best_p95,
+            }
+
+
+# Process-wide limiters keyed by provider (None = adaptive control disabled)
+_limiters: dict[str, AIMDLimiter] = {}
+_settings: dict[str, Any] | None = None
+_lock = threading.Lock()
+
+
+def configure_adaptive_concurrency(
+    initial: int = 4,
+    max_limit: int = 64,
+    on_change: Callable[[str, int, int, str], None] | None = None,
+) -> None:
+    """Enable adaptive concurrency for this process."""
+    global _settings
+    with _lock:
+        _settings = {"initial": initial, "max_limit": max_limit, "on_change": on_change}
+        _limiters.clear()
+
+
+def get_concurrency_limiter(provider: str) -> AIMDLimiter | None:
+    """Adaptive limiter for a provider, or None when adaptive control is off."""
+    with _lock:
+        if _settings is None:
+            return None
+        limiter = _limiters.get(provider)
+        if limiter is None:
+            limiter = AIMDLimiter(provider, **_settings)
+            _limiters[provider] = limiter
+        return limiter
+
+
+def concurrency_stats() -> dict[str, dict[str, Any]]:
+    """Snapshot of all adaptive limiters."""
+    with _lock:
+        limiters = dict(_limiters)
+    return {name: limiter.to_dict() for name, limiter in limiters.items()}
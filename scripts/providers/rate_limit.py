@@ -0,0 +1,206 @@
+"""
+Token-bucket rate limiting for provider API calls.
+
+Each limiter enforces a requests-per-minute and a tokens-per-minute budget.
+Estimated input tokens are charged before a request is sent and the charge
+is settled against the provider-reported usage once the response arrives.
+Limiters are thread-safe so they can be shared by worker threads.
+"""
+
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any
+
+
+class TokenBucket:
+    """Thread-safe token bucket refilled continuously at a fixed rate."""
+
+    def __init__(self, capacity: float, refill_per_second: float):
+        """Initialize a full bucket.
+
+        Args:
+            capacity: Maximum number of tokens the bucket can hold
+            refill_per_second: Tokens added per second
+        """
+        self.capacity = float(capacity)
+        self.refill_per_second = float(refill_per_second)
+        self._level = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._level = min(self.capacity, self._level + (now - self._updated) * self.refill_per_second)
+        self._updated = now
+
+    def acquire(self, amount: float) -> float:
+        """Take ``amount`` tokens, blocking until they are available.
+
+        Requests larger than the bucket capacity are clamped to the capacity
+        so they can never block forever.
+
+        Returns:
+            Seconds spent waiting
+        """
+        amount = min(float(amount), self.capacity)
+        waited = 0.0
+        while True:
+            with self._lock:
+                self._refill()
+                if self._level >= amount:
+                    self._level -= amount
+                    return waited
+                delay = (amount - self._level) / self.refill_per_second
+            time.sleep(delay)
+            waited += delay
+
+    def adjust(self, amount: float) -> None:
+        """Charge (positive) or refund (negative) tokens without blocking.
+
+        Charges may drive the level below zero; the debt delays later callers.
+        """
+        with self._lock:
+            self._refill()
+            self._level = min(self.capacity, self._level - amount)
+
+
+@dataclass
+class RateLimiterStats:
+    """Counters for a single rate limiter."""
+    requests: int = 0
+    estimated_tokens: int = 0
+    actual_tokens: int = 0
+    wait_time: float = 0.0
+
+
+@dataclass
+class Reservation:
+    """Capacity reserved for a single request."""
+    estimated_tokens: int
+    actual_tokens: int | None = None
+    wait_time: float = 0.0
+
+
+class RateLimiter:
+    """Requests-per-minute and tokens-per-minute limiter for one model."""
+
+    def __init__(
+        self,
+        name: str,
+        requests_per_minute: int | None = None,
+        tokens_per_minute: int | None = None,
+    ):
+        """Initialize limiter.
+
+        Args:
+            name: Limiter key (usually the provider model_id)
+            requests_per_minute: RPM ceiling, or None for unlimited
+            tokens_per_minute: TPM ceiling, or None for unlimited
+        """
+        self.name = name
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.request_bucket = (
+            TokenBucket(requests_per_minute, requests_per_minute / 60.0)
+            if requests_per_minute else None
+        )
+        self.token_bucket = (
+            TokenBucket(tokens_per_minute, tokens_per_minute / 60.0)
+            if tokens_per_minute else None
+        )
+        self.stats = RateLimiterStats()
+        self._lock = threading.Lock()
+
+    def acquire(self, estimated_tokens: int) -> float:
+        """Block until one request and ``estimated_tokens`` tokens are available.
+
+        Returns:
+            Seconds spent waiting
+        """
+        waited = 0.0
+        if self.request_bucket:
+            waited += self.request_bucket.acquire(1)
+        if self.token_bucket:
+            waited += self.token_bucket.acquire(estimated_tokens)
+        with self._lock:
+            self.stats.requests += 1
+            self.stats.estimated_tokens += estimated_tokens
+            self.stats.wait_time += waited
+        return waited
+
+    def settle(self, estimated_tokens: int, actual_tokens: int) -> None:
+        """Correct the token charge once actual usage is known."""
+        if self.token_bucket:
+            self.token_bucket.adjust(actual_tokens - estimated_tokens)
+        with self._lock:
+            self.stats.actual_tokens += actual_tokens
+
+    @contextmanager
+    def reserve(self, estimated_tokens: int) -> Iterator[Reservation]:
+        """Acquire capacity for one request and settle it on exit.
+
+        Usage:
+            with limiter.reserve(estimate_tokens(prompt)) as reservation:
+                response = client.create(...)
+                reservation.actual_tokens = usage.input_tokens + usage.output_tokens
+
+        If the block raises before ``actual_tokens`` is set, the estimate stands.
+        """
+        reservation = Reservation(estimated_tokens=estimated_tokens)
+        reservation.wait_time = self.acquire(estimated_tokens)
+        try:
+            yield reservation
+        finally:
+            actual = reservation.actual_tokens
+            self.settle(estimated_tokens, estimated_tokens if actual is None else actual)
+
+
+def estimate_tokens(text: str) -> int:
+    """Roughly estimate the token count of ``text``.
+
+    Uses UTF-8 bytes / 4, which slightly over-estimates English and is close
+    for Japanese prompts, so pre-charges err on the safe side.
+    """
+    return max(1, len(text.encode("utf-8")) // 4)
+
+
+_registry: dict[str, RateLimiter] = {}
+_registry_lock = threading.Lock()
+
+
+def get_rate_limiter(
+    name: str,
+    requests_per_minute: int | None = None,
+    tokens_per_minute: int | None = None,
+) -> RateLimiter:
+    """Get the process-wide limiter for ``name``, creating it on first use.
+
+    Limits passed on later calls for an existing name are ignored, so the
+    runner and the judges share a limiter when they use the same model_id.
+    """
+    with _registry_lock:
+        limiter = _registry.get(name)
+        if limiter is None:
+            limiter = RateLimiter(name, requests_per_minute, tokens_per_minute)
+            _registry[name] = limiter
+        return limiter
+
+
+def rate_limiter_stats() -> dict[str, dict[str, Any]]:
+    """Snapshot of all registered limiters for summaries."""
+    with _registry_lock:
+        limiters = list(_registry.values())
+    return {
+        limiter.name: {
+            "requests_per_minute": limiter.requests_per_minute,
+            "tokens_per_minute": limiter.tokens_per_minute,
+            "requests": limiter.stats.requests,
+            "estimated_tokens": limiter.stats.estimated_tokens,
+            "actual_tokens": limiter.stats.actual_tokens,
+            "wait_time": limiter.stats.wait_time,
+        }
+        for limiter in limiters
+    }
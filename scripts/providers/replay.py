@@ -0,0 +1,269 @@
+"""
+Record/replay of provider responses for offline, deterministic runs.
+
+- Reviewer responses are recorded in the runner's own output format
+  (``{model}.json``); ``--provider record`` adds a ``prompt_hash`` to each
+  result so later runs can match on the exact prompt.
+- Judge responses are recorded to ``judge_recordings.jsonl`` in the run
+  directory being evaluated.
+
+A ReplayStore serves those recordings back, matched on the prompt hash or,
+for reviews recorded without one, on (framework, case_id, context_mode). It can
+optionally sleep for the recorded ``elapsed_time`` so that scheduler and
+concurrency changes can be measured without calling any API.
+"""
+
+import hashlib
+import json
+import threading
+import time
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+# Judge recordings written next to the run being evaluated
+JUDGE_RECORDINGS_FILE = "judge_recordings.jsonl"
+
+# Files in a run directory that are not per-model result files
+NON_RESULT_FILES = ("summary.json", "evaluations.json", "report.json", "metrics.json")
+
+
+class ReplayMissError(LookupError):
+    """Raised when no recorded response matches a request."""
+
+
+def prompt_hash(prompt: str) -> str:
+    """Stable hash of a fully rendered prompt."""
+    return hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+
+
+def parse_provider_spec(spec: str) -> tuple[str, Path | None]:
+    """Parse a ``--provider`` value.
+
+    Args:
+        spec: ``live``, ``record``, ``replay:<run_dir>`` or
+            ``simulate[:<profiles.json>]``
+
+    Returns:
+        Tuple of (mode, path); path is the run directory for replay and the
+        optional simulation profile file for simulate
+
+    Raises:
+        ValueError: If the spec is not recognized
+    """
+    if spec in ("live", "record", "simulate"):
+        return spec, None
+    if spec.startswith("replay:") and len(spec) > len("replay:"):
+        return "replay", Path(spec[len("replay:"):])
+    if spec.startswith("simulate:") and len(spec) > len("simulate:"):
+        return "simulate", Path(spec[len("simulate:"):])
+    raise ValueError(
+        f"Invalid provider '{spec}'. Expected one of: live, record, replay:<run_dir>, simulate[:<profiles.json>]"
+    )
+
+
+class ReplayStore:
+    """Recorded responses indexed by prompt hash and by case."""
+
+    def __init__(self, entries: Iterable[dict[str, Any]], latency_scale: float | None = None):
+        """Initialize store.
+
+        Args:
+            entries: Recorded responses. Each needs ``model`` and either
+                ``prompt_hash`` or ``case_id``/``context_mode``
+            latency_scale: If set, sleep ``elapsed_time * latency_scale``
+                before returning a response (None = return immediately)
+        """
+        self.latency_scale = latency_scale
+        self._entries = list(entries)
+        self._by_hash: dict[tuple[str, str], dict[str, Any]] = {}
+        self._by_case: dict[tuple[str, str | None, str, str], dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.replayed_latency = 0.0
+
+        for entry in self._entries:
+            model = entry["model"]
+            if entry.get("prompt_hash"):
+                self._by_hash[(model, entry["prompt_hash"])] = entry
+            if entry.get("case_id"):
+                key = (model, entry.get("framework"), entry["case_id"], entry.get("context_mode", "explicit"))
+                self._by_case[key] = entry
+
+    @classmethod
+    def from_run_dir(cls, run_dir: Path, latency_scale: float | None = None) -> "ReplayStore":
+        """Load successful reviews from every ``{model}.json`` in a run directory.
+
+        Multi-framework runs write ``{model}.{framework}.json``; the tag is kept
+        as the entry's ``framework`` so cases with the same id do not collide.
+        """
+        entries = []
+        for result_file in sorted(Path(run_dir).glob("*.json")):
+            if result_file.name in NON_RESULT_FILES:
+                continue
+            results = json.loads(result_file.read_text())
+            if not isinstance(results, list):
+                continue
+            model, _, framework = result_file.stem.partition(".")
+            for result in results:
+                if result.get("success", True) and result.get("raw_response") is not None:
+                    entries.append({**result, "model": model, "framework": framework or None})
+        return cls(entries, latency_scale)
+
+    @classmethod
+    def from_judge_recordings(cls, run_dir: Path, latency_scale: float | None = None) -> "ReplayStore":
+        """Load judge responses from ``judge_recordings.jsonl`` in a run directory."""
+        recordings_file = Path(run_dir) / JUDGE_RECORDINGS_FILE
+        if not recordings_file.exists():
+            raise FileNotFoundError(f"No judge recordings found: {recordings_file}")
+        entries = [
+            json.loads(line)
+            for line in recordings_file.read_text().splitlines()
+            if line.strip()
+        ]
+        return cls(entries, latency_scale)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def find(
+        self,
+        model: str,
+        prompt: str,
+        case_id: str | None = None,
+        context_mode: str | None = None,
+        framework: str | None = None,
+    ) -> dict[str, Any] | None:
+        """Look up a recording by prompt hash, then by case.
+
+        Case lookups try the framework-tagged recording first, then one from
+        a single-framework run (recorded without a tag).
+        """
+        entry = self._by_hash.get((model, prompt_hash(prompt)))
+        if entry is None and case_id is not None:
+            mode = context_mode or "explicit"
+            entry = self._by_case.get((model, framework, case_id, mode))
+            if entry is None and framework is not None:
+                entry = self._by_case.get((model, None, case_id, mode))
+        return entry
+
+    def replay(
+        self,
+        model: str,
+        prompt: str,
+        case_id: str | None = None,
+        context_mode: str | None = None,
+        framework: str | None = None,
+    ) -> dict[str, Any]:
+        """Return a copy of the matching recording, reproducing its latency if configured.
+
+        Raises:
+            ReplayMissError: If nothing was recorded for this request
+        """
+        entry = self.find(model, prompt, case_id, context_mode, framework)
+        with self._lock:
+            if entry is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        if entry is None:
+            target = f"{case_id} ({context_mode or 'explicit'})" if case_id else f"prompt {prompt_hash(prompt)[:12]}"
+            raise ReplayMissError(f"No recorded response for {model}: {target}")
+
+        if self.latency_scale:
+            delay = entry.get("elapsed_time", 0.0) * self.latency_scale
+            time.sleep(delay)
+            with self._lock:
+                self.replayed_latency += delay
+        return dict(entry)
+
+    def stats(self) -> dict[str, Any]:
+        """Replay statistics for summaries."""
+        with self._lock:
+            return {
+                "recordings": len(self),
+                "hits": self.hits,
+                "misses": self.misses,
+                "latency_scale": self.latency_scale,
+                "replayed_latency": self.replayed_latency,
+            }
+
+
+class ResponseRecorder:
+    """Thread-safe append-only JSONL recorder."""
+
+    def __init__(self, path: Path):
+        """Initialize recorder; the file is created on the first record."""
+        self.path = Path(path)
+        self.count = 0
+        self._lock = threading.Lock()
+
+    def record(self, entry: dict[str, Any]) -> None:
+        """Append one recorded response."""
+        line = json.dumps(entry, ensure_ascii=False) + "\n"
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self.path.open("a") as f:
+                f.write(line)
+            self.count += 1
+
+
+# Process-wide judge provider mode (set once by the evaluator)
+_judge_replay: ReplayStore | None = None
+_judge_recorder: ResponseRecorder | None = None
+
+
+def configure_judge_provider(
+    mode: str,
+    run_dir: Path,
+    latency_scale: float | None = None,
+) -> None:
+    """Set how judges reach their models for this process.
+
+    Args:
+        mode: ``live``, ``record`` or ``replay``
+        run_dir: For record, the run being evaluated (recordings are written
+            there); for replay, the run whose recordings are served
+        latency_scale: Replay latency multiplier (None = no delay)
+    """
+    global _judge_replay, _judge_recorder
+    _judge_replay = None
+    _judge_recorder = None
+    if mode == "record":
+        _judge_recorder = ResponseRecorder(Path(run_dir) / JUDGE_RECORDINGS_FILE)
+    elif mode == "replay":
+        _judge_replay = ReplayStore.from_judge_recordings(run_dir, latency_scale)
+    elif mode != "live":
+        raise ValueError(f"Unknown provider mode: {mode}")
+
+
+def get_judge_replay() -> ReplayStore | None:
+    """Replay store for judge calls, or None when judges call live APIs."""
+    return _judge_replay
+
+
+def get_judge_recorder() -> ResponseRecorder | None:
+    """Recorder for judge calls, or None when not recording."""
+    return _judge_recorder
+
+
+def record_judge_response(
+    model_id: str,
+    prompt: str,
+    response_text: str,
+    input_tokens: int,
+    output_tokens: int,
+    elapsed_time: float,
+) -> None:
+    """Record a judge response if recording is enabled."""
+    if _judge_recorder is None:
+        return
+    _judge_recorder.record({
+        "model": model_id,
+        "prompt_hash": prompt_hash(prompt),
+        "response": response_text,
+        "input_tokens": input_tokens,
+        "output_tokens": output_tokens,
+        "elapsed_time": elapsed_time,
+    })
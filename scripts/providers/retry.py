@@ -0,0 +1,280 @@
+"""
+Retry, timeout and hedged-request policy for provider calls.
+
+A RetryPolicy wraps a zero-argument callable (one provider request):
+
+- Each attempt may have a timeout and the whole call a deadline. SDK calls
+  cannot be interrupted, so a timed-out attempt is abandoned and left to
+  finish in the background; its result is discarded.
+- Retryable failures (429, 408/409, 5xx, connection errors, timeouts) are
+  retried with exponential backoff and full jitter. A Retry-After hint from
+  the provider is honoured as a lower bound on the delay.
+- Optionally a duplicate (hedged) request is sent when an attempt has not
+  finished after the p95 latency observed for the same key; the first
+  success wins. The losing request is still billed by the provider.
+
+Per-call statistics (attempts, time spent before the final attempt,
+hedging) are returned alongside the result.
+"""
+
+import random
+import threading
+import time
+from collections import defaultdict, deque
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+# HTTP statuses worth retrying (529 = Anthropic overloaded)
+RETRYABLE_STATUS_CODES = frozenset({408, 409, 429, 500, 502, 503, 504, 529})
+
+# SDK exception class names for transport-level failures
+RETRYABLE_ERROR_NAMES = frozenset({
+    "APIConnectionError",
+    "APITimeoutError",
+    "ConnectError",
+    "ReadTimeout",
+    "RemoteDisconnected",
+    "DeadlineExceeded",
+    "ServiceUnavailable",
+    "ResourceExhausted",
+    "InternalServerError",
+})
+
+
+class AttemptTimeoutError(TimeoutError):
+    """An attempt did not finish within its timeout."""
+
+
+def status_code_of(error: BaseException) -> int | None:
+    """HTTP status of an SDK error (Anthropic/OpenAI ``status_code``, Google ``code``)."""
+    for attr in ("status_code", "code"):
+        value = getattr(error, attr, None)
+        if isinstance(value, int):
+            return value
+    return None
+
+
+def retry_after_of(error: BaseException) -> float | None:
+    """Retry-After hint in seconds, if the provider sent one."""
+    value = getattr(error, "retry_after", None)
+    if value is None:
+        response = getattr(error, "response", None)
+        headers = getattr(response, "headers", None)
+        if headers is not None:
+            value = headers.get("retry-after")
+    try:
+        return float(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def is_retryable(error: BaseException) -> bool:
+    """Whether a failed attempt should be retried."""
+    if isinstance(error, TimeoutError):
+        return True
+    status = status_code_of(error)
+    if status is not None:
+        return status in RETRYABLE_STATUS_CODES
+    return any(cls.__name__ in RETRYABLE_ERROR_NAMES for cls in type(error).__mro__)
+
+
+class LatencyTracker:
+    """Rolling window of successful attempt latencies per key."""
+
+    def __init__(self, window: int = 200):
+        self.window = window
+        self._samples: dict[str, deque[float]] = defaultdict(lambda: deque(maxlen=self.window))
+        self._lock = threading.Lock()
+
+    def record(self, key: str, latency: float) -> None:
+        with self._lock:
+            self._samples[key].append(latency)
+
+    def quantile(self, key: str, q: float, min_samples: int = 1) -> float | None:
+        """Latency quantile for ``key``, or None with fewer than ``min_samples`` samples."""
+        with self._lock:
+            samples = sorted(self._samples.get(key, ()))
+        if len(samples) < max(1, min_samples):
+            return None
+        index = min(len(samples) - 1, int(q * len(samples)))
+        return samples[index]
+
+
+@dataclass
+class CallStats:
+    """What it took to complete one call."""
+    attempts: int = 0
+    retry_time: float = 0.0  # Seconds from the first attempt to the start of the final one
+    hedged: bool = False  # A duplicate request was sent
+    hedge_won: bool = False  # The duplicate finished first
+    errors: list[str] = field(default_factory=list)
+    cache_hit: bool = False  # Served from a response cache (no request, no cost)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Fields recorded on each result."""
+        return {
+            "attempts": self.attempts,
+            "retry_time": self.retry_time,
+            "hedged": self.hedged,
+            "hedge_won": self.hedge_won,
+            "retry_errors": self.errors,
+        }
+
+
+@dataclass
+class RetryPolicy:
+    """Retry/timeout/hedging settings.
+
+    Attributes:
+        max_attempts: Attempts per call (1 = no retries)
+        base_delay: Backoff base in seconds (doubles per retry)
+        max_delay: Backoff cap in seconds
+        attempt_timeout: Seconds before an attempt is abandoned (None = wait forever)
+        deadline: Seconds for the whole call including retries (None = no deadline)
+        hedge: Send a duplicate request after the hedge quantile latency
+        hedge_quantile: Latency quantile used as the hedging delay
+        hedge_min_samples: Successful attempts needed before hedging starts
+    """
+    max_attempts: int = 1
+    base_delay: float = 1.0
+    max_delay: float = 60.0
+    attempt_timeout: float | None = None
+    deadline: float | None = None
+    hedge: bool = False
+    hedge_quantile: float = 0.95
+    hedge_min_samples: int = 20
+    latencies: LatencyTracker = field(default_factory=LatencyTracker, repr=False)
+    _rng: random.Random = field(default_factory=random.Random, init=False, repr=False)
+
+    @property
+    def needs_worker_thread(self) -> bool:
+        """Timeouts and hedging need the attempt to run off the calling thread."""
+        return self.attempt_timeout is not None or self.deadline is not None or self.hedge
+
+    def backoff(self, retry_number: int, retry_after: float | None = None) -> float:
+        """Delay before retry ``retry_number`` (1-based): full jitter, at least Retry-After."""
+        cap = min(self.max_delay, self.base_delay * (2 ** (retry_number - 1)))
+        delay = self._rng.uniform(0, cap)
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        return delay
+
+    def call(self, fn: Callable[[], T], key: str = "default") -> tuple[T, CallStats]:
+        """Run ``fn`` under the policy.
+
+        Args:
+            fn: One provider request
+            key: Latency-tracking key for hedging (e.g. model name)
+
+        Returns:
+            Tuple of (result, CallStats)
+
+        Raises:
+            The last error when attempts or the deadline are exhausted, or
+            immediately for non-retryable errors.
+        """
+        stats = CallStats()
+        start = time.monotonic()
+        deadline = start + self.deadline if self.deadline is not None else None
+
+        while True:
+            stats.attempts += 1
+            attempt_start = time.monotonic()
+            stats.retry_time = attempt_start - start
+            try:
+                return self._attempt(fn, key, deadline, stats), stats
+            except Exception as e:
+                stats.errors.append(f"{type(e).__name__}: {e}"[:200])
+                if not is_retryable(e) or stats.attempts >= self.max_attempts:
+                    raise
+                delay = self.backoff(stats.attempts, retry_after_of(e))
+                if deadline is not None and time.monotonic() + delay >= deadline:
+                    raise
+                time.sleep(delay)
+
+    def _attempt(self, fn: Callable[[], T], key: str, deadline: float | None, stats: CallStats) -> T:
+        """One attempt, possibly hedged, bounded by the attempt timeout and deadline."""
+        if not self.needs_worker_thread:
+            attempt_start = time.monotonic()
+            result = fn()
+            self.latencies.record(key, time.monotonic() - attempt_start)
+            return result
+
+        attempt_start = time.monotonic()
+        timeout_at = attempt_start + self.attempt_timeout if self.attempt_timeout is not None else None
+        if deadline is not None:
+            timeout_at = deadline if timeout_at is None else min(timeout_at, deadline)
+        hedge_delay = (
+            self.latencies.quantile(key, self.hedge_quantile, self.hedge_min_samples)
+            if self.hedge else None
+        )
+
+        primary = _submit(fn)
+        pending: list[Future] = [primary]
+        hedge_sent = False
+        last_error: BaseException | None = None
+
+        while pending:
+            now = time.monotonic()
+            waits = []
+            if timeout_at is not None:
+                waits.append(timeout_at - now)
+            if hedge_delay is not None and not hedge_sent:
+                waits.append(attempt_start + hedge_delay - now)
+            wait_for = max(0.0, min(waits)) if waits else None
+
+            done, _ = wait(pending, timeout=wait_for, return_when=FIRST_COMPLETED)
+            for future in done:
+                pending.remove(future)
+                error = future.exception()
+                if error is None:
+                    self.latencies.record(key, time.monotonic() - attempt_start)
+                    stats.hedge_won = future is not primary
+                    return future.result()
+                last_error = error
+
+            now = time.monotonic()
+            if pending and timeout_at is not None and now >= timeout_at:
+                raise AttemptTimeoutError(f"attempt exceeded {timeout_at - attempt_start:.1f}s")
+            if pending and hedge_delay is not None and not hedge_sent and now >= attempt_start + hedge_delay:
+                pending.append(_submit(fn))
+                hedge_sent = True
+                stats.hedged = True
+
+        assert last_error is not None
+        raise last_error
+
+
+# Attempts run here when a policy needs timeouts or hedging. Threads are
+# created on demand; abandoned attempts keep a worker until they return.
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
+
+def _submit(fn: Callable[[], T]) -> Future:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=256, thread_name_prefix="provider-attempt")
+    return _executor.submit(fn)
+
+
+# Process-wide policy (set once by the runner/evaluator)
+_policy = RetryPolicy()
+_policy_lock = threading.Lock()
+
+
+def configure_retry_policy(policy: RetryPolicy) -> None:
+    """Set the retry policy used for provider calls in this process."""
+    global _policy
+    with _policy_lock:
+        _policy = policy
+
+
+def get_retry_policy() -> RetryPolicy:
+    """The process-wide retry policy (default: single attempt, no timeout)."""
+    return _policy
@@ -0,0 +1,343 @@
+"""
+Synthetic provider for load-testing the runner and evaluator offline.
+
+Each model name maps to a SimulationProfile describing its latency
+distribution (lognormal time-to-first-token with an occasional heavy-tail
+stall, plus output tokens at a fixed tokens-per-second rate), server-side
+rate-limit thresholds and injected 429/5xx error rates. Reviews are built
+from the case's ``expected_critique.md`` (or a canned LGTM) and judge
+responses are canned JSON, so every downstream parser sees well-formed
+output.
+
+Randomness is derived from (seed, model, prompt, attempt number), so a run
+is repeatable regardless of how requests are scheduled; only server-side
+rate limiting depends on timing.
+"""
+
+import json
+import math
+import random
+import re
+import threading
+import time
+from collections import defaultdict, deque
+from dataclasses import dataclass, fields, replace
+from pathlib import Path
+from typing import Any
+
+from .rate_limit import estimate_tokens
+from .replay import prompt_hash
+
+
+class SimulatedAPIError(Exception):
+    """Error returned by the simulated provider (mirrors SDK status errors)."""
+
+    def __init__(self, message: str, status_code: int, retry_after: float | None = None):
+        super().__init__(message)
+        self.status_code = status_code
+        self.retry_after = retry_after
+
+
+class SimulatedRateLimitError(SimulatedAPIError):
+    """HTTP 429 from the simulated provider."""
+
+    def __init__(self, message: str, retry_after: float | None = None):
+        super().__init__(message, status_code=429, retry_after=retry_after)
+
+
+class SimulatedServerError(SimulatedAPIError):
+    """HTTP 5xx from the simulated provider."""
+
+    def __init__(self, message: str, status_code: int = 503):
+        super().__init__(message, status_code=status_code)
+
+
+@dataclass(frozen=True)
+class SimulationProfile:
+    """Simulated behaviour of one model."""
+    # Time to first token: lognormal with this median (seconds) and shape
+    ttft_median: float = 1.0
+    ttft_sigma: float = 0.5
+    # Heavy tail: with this probability the TTFT is multiplied by tail_multiplier
+    tail_probability: float = 0.02
+    tail_multiplier: float = 8.0
+    # Generation speed
+    output_tokens_per_second: float = 60.0
+    # Server-side limits over a sliding 60s window (None = unlimited)
+    requests_per_minute: int | None = None
+    tokens_per_minute: int | None = None
+    # Injected failures per request
+    rate_limit_error_rate: float = 0.0
+    server_error_rate: float = 0.01
+    # Review behaviour: chance of reporting the expected bug / a spurious issue
+    detection_rate: float = 0.7
+    false_positive_rate: float = 0.2
+
+    def sample_latency(self, rng: random.Random, output_tokens: int) -> float:
+        """Sample the total latency of a request producing ``output_tokens``."""
+        ttft = rng.lognormvariate(math.log(self.ttft_median), self.ttft_sigma)
+        if rng.random() < self.tail_probability:
+            ttft *= self.tail_multiplier
+        return ttft + output_tokens / self.output_tokens_per_second
+
+
+# Defaults are rough public figures; override per model with a JSON profile file
+DEFAULT_PROFILES: dict[str, SimulationProfile] = {
+    "default": SimulationProfile(),
+    # Reviewers (runner.py MODEL_CONFIG names)
+    "claude-opus": SimulationProfile(ttft_median=2.0, output_tokens_per_second=35.0, detection_rate=0.8),
+    "claude-sonnet": SimulationProfile(ttft_median=1.2, output_tokens_per_second=60.0, detection_rate=0.75),
+    "claude-haiku": SimulationProfile(ttft_median=0.6, output_tokens_per_second=120.0, detection_rate=0.55),
+    "gpt-4o": SimulationProfile(ttft_median=0.8, output_tokens_per_second=80.0, detection_rate=0.6),
+    "gpt-5": SimulationProfile(ttft_median=6.0, ttft_sigma=0.8, output_tokens_per_second=50.0, detection_rate=0.75),
+    "deepseek-v3": SimulationProfile(ttft_median=1.5, output_tokens_per_second=30.0, server_error_rate=0.03, detection_rate=0.55),
+    "deepseek-r1": SimulationProfile(ttft_median=12.0, ttft_sigma=0.8, output_tokens_per_second=25.0, server_error_rate=0.03, detection_rate=0.65),
+    "gemini-pro": SimulationProfile(ttft_median=3.0, output_tokens_per_second=70.0, detection_rate=0.65),
+    "gemini-3-pro": SimulationProfile(ttft_median=4.0, output_tokens_per_second=60.0, detection_rate=0.75),
+    "gemini-3-flash": SimulationProfile(ttft_median=0.8, output_tokens_per_second=150.0, detection_rate=0.6),
+    # Judges (config.py JUDGE_CONFIGS names)
+    "claude": SimulationProfile(ttft_median=1.2, output_tokens_per_second=60.0),
+    "gemini": SimulationProfile(ttft_median=3.0, output_tokens_per_second=70.0),
+}
+
+# meta.json severity -> review issue severity
+_SEVERITY_MAP = {"critical": "critical", "high": "critical", "medium": "major", "low": "minor"}
+
+
+def load_profiles(path: Path | None = None) -> dict[str, SimulationProfile]:
+    """Default profiles, optionally overridden by a JSON file.
+
+    The file maps model names to partial profiles, e.g.
+    ``{"claude-sonnet": {"requests_per_minute": 50, "server_error_rate": 0.05}}``.
+    Fields not given keep the model's default (or the ``default`` profile).
+    """
+    profiles = dict(DEFAULT_PROFILES)
+    if path is None:
+        return profiles
+
+    known = {f.name for f in fields(SimulationProfile)}
+    overrides = json.loads(Path(path).read_text())
+    for name, values in overrides.items():
+        unknown = set(values) - known
+        if unknown:
+            raise ValueError(f"Unknown simulation profile fields for {name}: {', '.join(sorted(unknown))}")
+        base = profiles.get(name, profiles["default"])
+        profiles[name] = replace(base, **values)
+    return profiles
+
+
+def _section(markdown: str, heading: str) -> str:
+    """Text of a ``## heading`` section of a critique file (empty if absent)."""
+    match = re.search(rf"^##\s+{re.escape(heading)}\s*$(.*?)(?=^##\s|\Z)", markdown, re.MULTILINE | re.DOTALL)
+    return match.group(1).strip() if match else ""
+
+
+def simulated_review_payload(
+    case: dict[str, Any],
+    rng: random.Random,
+    detection_rate: float,
+    false_positive_rate: float,
+) -> dict[str, Any]:
+    """Review JSON for a case, sampled from its expected critique.
+
+    Bug cases report the expected finding with probability ``detection_rate``;
+    any case may additionally get a spurious minor issue with probability
+    ``false_positive_rate``. Without an expected critique the finding falls
+    back to ``bug_description`` from meta.json.
+    """
+    meta = case.get("meta", {})
+    critique = ""
+    case_dir = case.get("case_dir")
+    if case_dir:
+        critique_file = Path(case_dir) / "expected_critique.md"
+        if critique_file.exists():
+            critique = critique_file.read_text()
+
+    issues = []
+    if meta.get("expected_detection", True) and rng.random() < detection_rate:
+        finding = _section(critique, "Essential Finding") or meta.get("bug_description", "Implementation does not match the specification.")
+        issues.append({
+            "severity": _SEVERITY_MAP.get(meta.get("severity", "medium"), "major"),
+            "type": "plan_mismatch" if meta.get("axis") == "spec_alignment" else "logic_bug",
+            "location": meta.get("bug_anchor", "impl"),
+            "description": finding,
+            "suggestion": meta.get("correct_implementation", "Align the implementation with the specification."),
+        })
+    if rng.random() < false_positive_rate:
+        issues.append({
+            "severity": "minor",
+            "type": "performance",
+            "location": "impl",
+            "description": "Consider extracting this logic into a smaller method for readability.",
+            "suggestion": "Refactor into a helper method.",
+        })
+
+    return {
+        "has_issues": bool(issues),
+        "issues": issues,
+        "summary": "Simulated review." if issues else "No issues found (simulated review).",
+    }
+
+
+def simulated_judge_response(prompt: str, rng: random.Random) -> str:
+    """Judge JSON accepted by both the semantic and the legacy judge parsers."""
+    is_fp_case = "FALSE POSITIVE test case" in prompt
+    review_has_issues = re.search(r'"has_issues":\s*true', prompt) is not None
+
+    if is_fp_case:
+        score = rng.choice([1, 2, 3]) if review_has_issues else 5
+    else:
+        score = rng.choice([3, 4, 4, 5]) if review_has_issues else 1
+
+    return json.dumps({
+        "semantic_match_score": score,
+        "essential_finding_captured": not is_fp_case and score >= 3,
+        "severity_aligned": score >= 4,
+        "suggestion_quality": "good" if score >= 4 else "partial" if score == 3 else "poor",
+        "key_points_matched": [],
+        "key_points_missed": [],
+        "noise_issues_count": 0,
+        "correctly_approved": is_fp_case and not review_has_issues,
+        "false_critical_count": 0,
+        "false_major_count": 0,
+        # Legacy (non-semantic) judge fields
+        "detected": review_has_issues,
+        "accuracy": score * 20,
+        "noise_count": 0,
+        "correct_location": score >= 4,
+        "reasoning": f"Simulated judge score {score}.",
+    })
+
+
+class SimulatedProvider:
+    """Thread-safe synthetic provider shared by all callers in a process."""
+
+    def __init__(
+        self,
+        profiles: dict[str, SimulationProfile] | None = None,
+        seed: int = 0,
+        time_scale: float = 1.0,
+    ):
+        """Initialize simulator.
+
+        Args:
+            profiles: Profiles by model name (must include ``default``)
+            seed: Base seed for all sampled latencies, errors and responses
+            time_scale: Multiplier applied to sleeps and rate-limit windows
+                (e.g. 0.01 runs 100x faster than real time)
+        """
+        self.profiles = profiles or dict(DEFAULT_PROFILES)
+        self.seed = seed
+        self.time_scale = time_scale
+        self._lock = threading.Lock()
+        self._attempts: dict[tuple[str, str], int] = defaultdict(int)
+        self._request_times: dict[str, deque[float]] = defaultdict(deque)
+        self._token_usage: dict[str, deque[tuple[float, int]]] = defaultdict(deque)
+        self._stats: dict[str, dict[str, int]] = defaultdict(lambda: defaultdict(int))
+
+    def profile(self, model: str) -> SimulationProfile:
+        """Profile for a model name, falling back to ``default``."""
+        return self.profiles.get(model, self.profiles["default"])
+
+    def _now(self) -> float:
+        """Simulated clock (seconds)."""
+        return time.monotonic() / self.time_scale
+
+    def _rng(self, model: str, prompt: str) -> random.Random:
+        """Per-request RNG: identical prompts get a fresh stream on each retry."""
+        digest = prompt_hash(prompt)
+        with self._lock:
+            attempt = self._attempts[(model, digest)]
+            self._attempts[(model, digest)] += 1
+        return random.Random(f"{self.seed}:{model}:{digest}:{attempt}")
+
+    def _check_rate_limits(self, model: str, profile: SimulationProfile, tokens: int) -> None:
+        """Apply server-side sliding-window limits, raising 429 when exceeded."""
+        with self._lock:
+            now = self._now()
+            requests = self._request_times[model]
+            usage = self._token_usage[model]
+            while requests and requests[0] <= now - 60:
+                requests.popleft()
+            while usage and usage[0][0] <= now - 60:
+                usage.popleft()
+
+            if profile.requests_per_minute is not None and len(requests) >= profile.requests_per_minute:
+                retry_after = (requests[0] + 60 - now) * self.time_scale
+                raise SimulatedRateLimitError(f"{model}: requests per minute exceeded", retry_after)
+            used_tokens = sum(t for _, t in usage)
+            if profile.tokens_per_minute is not None and used_tokens + tokens > profile.tokens_per_minute:
+                retry_after = ((usage[0][0] + 60 - now) if usage else 60.0) * self.time_scale
+                raise SimulatedRateLimitError(f"{model}: tokens per minute exceeded", retry_after)
+
+            requests.append(now)
+            usage.append((now, tokens))
+
+    def _complete(self, model: str, prompt: str, rng: random.Random, text: str) -> tuple[str, int, int, float]:
+        profile = self.profile(model)
+        input_tokens = estimate_tokens(prompt)
+        output_tokens = max(1, estimate_tokens(text))
+
+        try:
+            self._check_rate_limits(model, profile, input_tokens + output_tokens)
+            if rng.random() < profile.rate_limit_error_rate:
+                raise SimulatedRateLimitError(f"{model}: simulated overload", retry_after=1.0 * self.time_scale)
+            if rng.random() < profile.server_error_rate:
+                # Fail after a short delay, like a real gateway error
+                time.sleep(rng.uniform(0.1, 1.0) * self.time_scale)
+                raise SimulatedServerError(f"{model}: simulated server error", rng.choice([500, 502, 503, 529]))
+        except SimulatedAPIError as e:
+            with self._lock:
+                self._stats[model][f"http_{e.status_code}"] += 1
+            raise
+
+        latency = profile.sample_latency(rng, output_tokens)
+        time.sleep(latency * self.time_scale)
+        with self._lock:
+            self._stats[model]["requests"] += 1
+        return text, input_tokens, output_tokens, latency
+
+    def review(self, model: str, prompt: str, case: dict[str, Any]) -> tuple[str, int, int, float]:
+        """Simulate a review call.
+
+        Returns:
+            Tuple of (response_text, input_tokens, output_tokens, simulated_latency)
+
+        Raises:
+            SimulatedAPIError: On injected or rate-limit failures
+        """
+        rng = self._rng(model, prompt)
+        profile = self.profile(model)
+        payload = simulated_review_payload(case, rng, profile.detection_rate, profile.false_positive_rate)
+        text = "```json\n" + json.dumps(payload, indent=2, ensure_ascii=False) + "\n```"
+        return self._complete(model, prompt, rng, text)
+
+    def judge(self, model: str, prompt: str) -> tuple[str, int, int, float]:
+        """Simulate a judge call (same return value and errors as ``review``)."""
+        rng = self._rng(model, prompt)
+        return self._complete(model, prompt, rng, simulated_judge_response(prompt, rng))
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        """Per-model request and error counts."""
+        with self._lock:
+            return {model: dict(counts) for model, counts in self._stats.items()}
+
+
+# Process-wide simulator (set once by the runner/evaluator)
+_simulator: SimulatedProvider | None = None
+
+
+def configure_simulator(
+    profiles_path: Path | None = None,
+    seed: int = 0,
+    time_scale: float = 1.0,
+) -> SimulatedProvider:
+    """Enable the simulated provider for this process."""
+    global _simulator
+    _simulator = SimulatedProvider(load_profiles(profiles_path), seed=seed, time_scale=time_scale)
+    return _simulator
+
+
+def get_simulator() -> SimulatedProvider | None:
+    """The process-wide simulator, or None when calling real providers."""
+    return _simulator
@@ -6,14 +6,23 @@ Usage:
     python scripts/runner.py --model claude-sonnet --cases cases/rails/
     python scripts/runner.py --model deepseek-v3 --cases cases/rails/plan_mismatch/
     python scripts/runner.py --model all --cases cases/rails/
+    python scripts/runner.py --model all --cases cases/rails/ --concurrency 8
+    python scripts/runner.py --model all --mode dual --resume results/20250124_run/
 """
 
 import argparse
+import asyncio
+import hashlib
 import json
 import os
 import re
+import socket
+import subprocess
 import sys
+import threading
 import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Literal
@@ -23,17 +32,54 @@ from dotenv import load_dotenv
 # Load .env file from project root
 load_dotenv(Path(__file__).parent.parent / ".env")
 
-import anthropic
-import google.generativeai as genai
-import openai
+from case_corpus import get_corpus
+from providers import (
+    AIMDLimiter,
+    AnthropicBatchBackend,
+    BatchBackend,
+    BatchRequest,
+    LocalBatchBackend,
+    LocalBatchServer,
+    OpenAIBatchBackend,
+    RateLimiter,
+    ReplayStore,
+    ResponseCache,
+    RetryPolicy,
+    SimulatedProvider,
+    concurrency_stats,
+    configure_adaptive_concurrency,
+    configure_retry_policy,
+    configure_simulator,
+    estimate_tokens,
+    get_client_registry,
+    get_concurrency_limiter,
+    get_rate_limiter,
+    get_retry_policy,
+    get_simulator,
+    make_cache_key,
+    parse_provider_spec,
+    prompt_hash,
+    rate_limiter_stats,
+)
+from work_queue import Task, WorkQueue
 
 ModelName = Literal["claude-opus", "claude-sonnet", "claude-haiku", "gpt-4o", "gpt-5", "deepseek-v3", "deepseek-r1", "gemini-pro", "gemini-3-pro", "gemini-3-flash"]
 ALL_MODELS: list[ModelName] = ["claude-opus", "claude-sonnet", "claude-haiku", "gpt-4o", "gpt-5", "deepseek-v3", "deepseek-r1", "gemini-pro", "gemini-3-pro", "gemini-3-flash"]
 
 RunMode = Literal["explicit", "implicit", "dual"]
 FrameworkName = Literal["rails", "django", "laravel", "springboot-java", "springboot-kotlin"]
+ALL_FRAMEWORKS: list[FrameworkName] = ["rails", "django", "laravel", "springboot-java", "springboot-kotlin"]
 
 RESULTS_DIR = Path(__file__).parent.parent / "results"
+REVIEW_CACHE_DIR = RESULTS_DIR / ".cache" / "reviews"
+
+# Run state for `evaluator.py --follow`: "running" from start-up (also when
+# resuming) until summary.json has been written, then "complete"
+RUN_STATUS_FILE = "run_status.json"
+
+# Request parameters shared by all reviewer calls (temperature None = provider default)
+REVIEW_MAX_TOKENS = 4096
+REVIEW_TEMPERATURE: float | None = None
 
 # Framework configuration
 FRAMEWORK_CONFIG = {
@@ -70,62 +116,144 @@ def get_cases_dir(framework: str) -> Path:
     return Path(__file__).parent.parent / "cases" / framework
 
 
+def parse_frameworks(value: str) -> list[FrameworkName]:
+    """Parse ``--framework``: a single framework, a comma-separated list, or ``all``.
+
+    Raises:
+        ValueError: If a framework is not recognized
+    """
+    if value == "all":
+        return list(ALL_FRAMEWORKS)
+    frameworks = []
+    for name in (part.strip() for part in value.split(",")):
+        if name not in ALL_FRAMEWORKS:
+            raise ValueError(f"Unknown framework '{name}'. Expected 'all' or a comma-separated list of: {', '.join(ALL_FRAMEWORKS)}")
+        if name not in frameworks:
+            frameworks.append(name)
+    return frameworks
+
+
+def result_stem(model: str, framework: str, tagged: bool) -> str:
+    """Result file stem: ``{model}`` or, in multi-framework runs, ``{model}.{framework}``."""
+    return f"{model}.{framework}" if tagged else model
+
+
 # Default for backward compatibility
 CASES_DIR = get_cases_dir("rails")
 
 # モデル設定
+# requests_per_minute / tokens_per_minute: provider rate limits (None = unlimited).
+# Defaults assume Anthropic/OpenAI usage tier 2 and Gemini tier 1; adjust to your account.
+# batch_discount: price multiplier for the provider Batch API (--batch)
+# cache_read/cache_write_cost_per_1m: prompt-prefix cache pricing (reads are discounted;
+# Anthropic charges a premium for cache writes, other providers bill writes as input)
 MODEL_CONFIG = {
     "claude-opus": {
+        "provider": "anthropic",
         "model_id": "claude-opus-4-5-20251101",
         "input_cost_per_1m": 5.00,
         "output_cost_per_1m": 25.00,
+        "cache_read_cost_per_1m": 0.5,
+        "cache_write_cost_per_1m": 6.25,
+        "batch_discount": 0.5,
+        "requests_per_minute": 1000,
+        "tokens_per_minute": 450_000,
     },
     "claude-sonnet": {
+        "provider": "anthropic",
         "model_id": "claude-sonnet-4-20250514",
         "input_cost_per_1m": 3.00,
         "output_cost_per_1m": 15.00,
+        "cache_read_cost_per_1m": 0.3,
+        "cache_write_cost_per_1m": 3.75,
+        "batch_discount": 0.5,
+        "requests_per_minute": 1000,
+        "tokens_per_minute": 450_000,
     },
     "claude-haiku": {
+        "provider": "anthropic",
         "model_id": "claude-haiku-4-5-20251001",
         "input_cost_per_1m": 1.00,
         "output_cost_per_1m": 5.00,
+        "cache_read_cost_per_1m": 0.1,
+        "cache_write_cost_per_1m": 1.25,
+        "batch_discount": 0.5,
+        "requests_per_minute": 1000,
+        "tokens_per_minute": 450_000,
     },
     "gpt-4o": {
+        "provider": "openai",
         "model_id": "gpt-4o",
         "input_cost_per_1m": 2.50,
         "output_cost_per_1m": 10.00,
+        "cache_read_cost_per_1m": 1.25,
+        "cache_write_cost_per_1m": 2.5,
+        "batch_discount": 0.5,
+        "requests_per_minute": 5000,
+        "tokens_per_minute": 450_000,
     },
     "gpt-5": {
+        "provider": "openai",
         "model_id": "gpt-5",
         "input_cost_per_1m": 1.25,
         "output_cost_per_1m": 10.00,
+        "cache_read_cost_per_1m": 0.125,
+        "cache_write_cost_per_1m": 1.25,
+        "batch_discount": 0.5,
+        "requests_per_minute": 5000,
+        "tokens_per_minute": 1_000_000,
     },
     "deepseek-v3": {
+        "provider": "deepseek",
         "model_id": "deepseek-chat",
         "base_url": "https://api.deepseek.com",
         "input_cost_per_1m": 0.14,
         "output_cost_per_1m": 0.28,
+        "cache_read_cost_per_1m": 0.014,
+        "cache_write_cost_per_1m": 0.14,
+        "requests_per_minute": None,
+        "tokens_per_minute": None,
     },
     "deepseek-r1": {
+        "provider": "deepseek",
         "model_id": "deepseek-reasoner",
         "base_url": "https://api.deepseek.com",
         "input_cost_per_1m": 0.55,
         "output_cost_per_1m": 2.19,
+        "cache_read_cost_per_1m": 0.14,
+        "cache_write_cost_per_1m": 0.55,
+        "requests_per_minute": None,
+        "tokens_per_minute": None,
     },
     "gemini-pro": {
+        "provider": "google",
         "model_id": "gemini-2.5-pro",
         "input_cost_per_1m": 1.25,
         "output_cost_per_1m": 5.00,
+        "cache_read_cost_per_1m": 0.3125,
+        "cache_write_cost_per_1m": 1.25,
+        "requests_per_minute": 150,
+        "tokens_per_minute": 2_000_000,
     },
     "gemini-3-pro": {
+        "provider": "google",
         "model_id": "gemini-3-pro-preview",
         "input_cost_per_1m": 1.25,
         "output_cost_per_1m": 10.00,
+        "cache_read_cost_per_1m": 0.3125,
+        "cache_write_cost_per_1m": 1.25,
+        "requests_per_minute": 50,
+        "tokens_per_minute": 1_000_000,
     },
     "gemini-3-flash": {
+        "provider": "google",
         "model_id": "gemini-3-flash-preview",
         "input_cost_per_1m": 0.10,
         "output_cost_per_1m": 0.40,
+        "cache_read_cost_per_1m": 0.025,
+        "cache_write_cost_per_1m": 0.1,
+        "requests_per_minute": 1000,
+        "tokens_per_minute": 1_000_000,
     },
 }
 
@@ -565,50 +693,8 @@ def load_case(case_dir: Path, mode: RunMode = "explicit", framework: str = "rail
     Returns:
         ケースデータの辞書
     """
-    meta = json.loads((case_dir / "meta.json").read_text())
-
-    # モードに応じたcontextファイルを選択
-    context_file = case_dir / "context.md"  # デフォルト
-
-    if mode == "implicit":
-        # implicit モードでは context_base.md を使用（なければ context.md にフォールバック）
-        context_base_file = case_dir / "context_base.md"
-        if context_base_file.exists():
-            context_file = context_base_file
-
-    # Determine implementation file based on framework
-    framework_cfg = FRAMEWORK_CONFIG.get(framework, FRAMEWORK_CONFIG["rails"])
-    impl_ext = framework_cfg["impl_ext"]
-    impl_file = case_dir / f"impl{impl_ext}"
-
-    # Fallback: try both extensions if primary doesn't exist
-    if not impl_file.exists():
-        alt_ext = ".py" if impl_ext == ".rb" else ".rb"
-        alt_impl_file = case_dir / f"impl{alt_ext}"
-        if alt_impl_file.exists():
-            impl_file = alt_impl_file
-
-    case_data = {
-        "plan": (case_dir / "plan.md").read_text(),
-        "context": context_file.read_text(),
-        "impl": impl_file.read_text(),
-        "meta": meta,
-        "context_mode": mode,
-        "context_file": context_file.name,
-        "framework": framework,
-    }
-
-    # オプション: diff があれば読み込み
-    diff_file = case_dir / "pr.diff"
-    if diff_file.exists():
-        case_data["diff"] = diff_file.read_text()
-
-    # オプション: rubric があれば読み込み
-    rubric_file = case_dir / "rubric.json"
-    if rubric_file.exists():
-        case_data["rubric"] = json.loads(rubric_file.read_text())
-
-    return case_data
+    # ケースはコーパスから一度だけ読み込む（implicit は context_base.md、なければ context.md）
+    return get_corpus(case_dir.parent, framework).get(case_dir).to_case(mode)
 
 
 def build_prompt(case: dict[str, Any]) -> str:
@@ -683,18 +769,76 @@ def extract_json(text: str) -> dict[str, Any] | None:
     return None
 
 
+def calculate_cost(
+    config: dict[str, Any],
+    input_tokens: int,
+    output_tokens: int,
+    cache_read_tokens: int = 0,
+    cache_write_tokens: int = 0,
+) -> float:
+    """Calculate API cost in dollars from a MODEL_CONFIG entry.
+
+    Args:
+        config: MODEL_CONFIG entry
+        input_tokens: Total input tokens, including cache reads and writes
+        output_tokens: Output tokens
+        cache_read_tokens: Input tokens served from the prompt cache
+        cache_write_tokens: Input tokens written to the prompt cache
+    """
+    uncached_tokens = input_tokens - cache_read_tokens - cache_write_tokens
+    return (
+        uncached_tokens * config["input_cost_per_1m"] / 1_000_000
+        + cache_read_tokens * config.get("cache_read_cost_per_1m", config["input_cost_per_1m"]) / 1_000_000
+        + cache_write_tokens * config.get("cache_write_cost_per_1m", config["input_cost_per_1m"]) / 1_000_000
+        + output_tokens * config["output_cost_per_1m"] / 1_000_000
+    )
+
+
+def prompt_cache_savings(config: dict[str, Any], cache_read_tokens: int, cache_write_tokens: int) -> float:
+    """Input cost avoided by prompt caching (net of any cache-write premium)."""
+    input_cost = config["input_cost_per_1m"]
+    return (
+        cache_read_tokens * (input_cost - config.get("cache_read_cost_per_1m", input_cost))
+        - cache_write_tokens * (config.get("cache_write_cost_per_1m", input_cost) - input_cost)
+    ) / 1_000_000
+
+
+def get_model_rate_limiter(model_name: str) -> RateLimiter:
+    """Get the shared rate limiter for a reviewer model from MODEL_CONFIG."""
+    config = MODEL_CONFIG[model_name]
+    return get_rate_limiter(
+        config["model_id"],
+        requests_per_minute=config.get("requests_per_minute"),
+        tokens_per_minute=config.get("tokens_per_minute"),
+    )
+
+
+def get_model_concurrency_limiter(model_name: str) -> AIMDLimiter | None:
+    """Get the adaptive concurrency limiter for a reviewer model's provider (None when disabled)."""
+    return get_concurrency_limiter(MODEL_CONFIG[model_name]["provider"])
+
+
 def call_claude(prompt: str, model_name: Literal["claude-opus", "claude-sonnet", "claude-haiku"]) -> dict[str, Any]:
     """Claude APIを呼び出し"""
-    client = anthropic.Anthropic()
+    client = get_client_registry().anthropic_client()
     config = MODEL_CONFIG[model_name]
 
-    start_time = time.time()
-    message = client.messages.create(
-        model=config["model_id"],
-        max_tokens=4096,
-        messages=[{"role": "user", "content": prompt}],
-    )
-    elapsed_time = time.time() - start_time
+    with get_model_rate_limiter(model_name).reserve(estimate_tokens(prompt)) as reservation:
+        start_time = time.time()
+        message = client.messages.create(
+            model=config["model_id"],
+            max_tokens=REVIEW_MAX_TOKENS,
+            messages=[{"role": "user", "content": prompt}],
+        )
+        elapsed_time = time.time() - start_time
+
+        # input_tokens excludes cache reads/writes; record the total like other providers
+        cache_read_tokens = getattr(message.usage, "cache_read_input_tokens", None) or 0
+        cache_write_tokens = getattr(message.usage, "cache_creation_input_tokens", None) or 0
+        input_tokens = message.usage.input_tokens + cache_read_tokens + cache_write_tokens
+        output_tokens = message.usage.output_tokens
+        reservation.actual_tokens = input_tokens + output_tokens
+    get_client_registry().record_request(client, elapsed_time)
 
     raw_response = message.content[0].text
     parsed = extract_json(raw_response)
@@ -702,13 +846,13 @@ def call_claude(prompt: str, model_name: Literal["claude-opus", "claude-sonnet",
     return {
         "raw_response": raw_response,
         "parsed_response": parsed,
-        "input_tokens": message.usage.input_tokens,
-        "output_tokens": message.usage.output_tokens,
+        "input_tokens": input_tokens,
+        "output_tokens": output_tokens,
+        "cache_read_tokens": cache_read_tokens,
+        "cache_write_tokens": cache_write_tokens,
         "elapsed_time": elapsed_time,
-        "cost": (
-            message.usage.input_tokens * config["input_cost_per_1m"] / 1_000_000
-            + message.usage.output_tokens * config["output_cost_per_1m"] / 1_000_000
-        ),
+        "rate_limit_wait": reservation.wait_time,
+        "cost": calculate_cost(config, input_tokens, output_tokens, cache_read_tokens, cache_write_tokens),
     }
 
 
@@ -716,34 +860,38 @@ def call_openai(prompt: str, model_name: Literal["gpt-4o", "gpt-5"]) -> dict[str
     """OpenAI APIを呼び出し"""
     config = MODEL_CONFIG[model_name]
 
-    client = openai.OpenAI(
-        api_key=os.environ.get("OPENAI_API_KEY"),
-    )
+    client = get_client_registry().openai_client(os.environ.get("OPENAI_API_KEY"))
 
-    start_time = time.time()
-    response = client.chat.completions.create(
-        model=config["model_id"],
-        max_tokens=4096,
-        messages=[{"role": "user", "content": prompt}],
-    )
-    elapsed_time = time.time() - start_time
+    with get_model_rate_limiter(model_name).reserve(estimate_tokens(prompt)) as reservation:
+        start_time = time.time()
+        response = client.chat.completions.create(
+            model=config["model_id"],
+            max_tokens=REVIEW_MAX_TOKENS,
+            messages=[{"role": "user", "content": prompt}],
+        )
+        elapsed_time = time.time() - start_time
+
+        input_tokens = response.usage.prompt_tokens if response.usage else 0
+        output_tokens = response.usage.completion_tokens if response.usage else 0
+        # Prefix caching is automatic; cached tokens are reported in prompt_tokens_details
+        details = getattr(response.usage, "prompt_tokens_details", None) if response.usage else None
+        cache_read_tokens = (getattr(details, "cached_tokens", None) or 0) if details else 0
+        reservation.actual_tokens = input_tokens + output_tokens
+    get_client_registry().record_request(client, elapsed_time)
 
     raw_response = response.choices[0].message.content or ""
     parsed = extract_json(raw_response)
 
-    input_tokens = response.usage.prompt_tokens if response.usage else 0
-    output_tokens = response.usage.completion_tokens if response.usage else 0
-
     return {
         "raw_response": raw_response,
         "parsed_response": parsed,
         "input_tokens": input_tokens,
         "output_tokens": output_tokens,
+        "cache_read_tokens": cache_read_tokens,
+        "cache_write_tokens": 0,
         "elapsed_time": elapsed_time,
-        "cost": (
-            input_tokens * config["input_cost_per_1m"] / 1_000_000
-            + output_tokens * config["output_cost_per_1m"] / 1_000_000
-        ),
+        "rate_limit_wait": reservation.wait_time,
+        "cost": calculate_cost(config, input_tokens, output_tokens, cache_read_tokens),
     }
 
 
@@ -751,35 +899,40 @@ def call_deepseek(prompt: str, model_name: Literal["deepseek-v3", "deepseek-r1"]
     """DeepSeek APIを呼び出し（OpenAI互換）"""
     config = MODEL_CONFIG[model_name]
 
-    client = openai.OpenAI(
-        api_key=os.environ.get("DEEPSEEK_API_KEY"),
+    client = get_client_registry().openai_client(
+        os.environ.get("DEEPSEEK_API_KEY"),
         base_url=config["base_url"],
     )
 
-    start_time = time.time()
-    response = client.chat.completions.create(
-        model=config["model_id"],
-        max_tokens=4096,
-        messages=[{"role": "user", "content": prompt}],
-    )
-    elapsed_time = time.time() - start_time
+    with get_model_rate_limiter(model_name).reserve(estimate_tokens(prompt)) as reservation:
+        start_time = time.time()
+        response = client.chat.completions.create(
+            model=config["model_id"],
+            max_tokens=REVIEW_MAX_TOKENS,
+            messages=[{"role": "user", "content": prompt}],
+        )
+        elapsed_time = time.time() - start_time
+
+        input_tokens = response.usage.prompt_tokens if response.usage else 0
+        output_tokens = response.usage.completion_tokens if response.usage else 0
+        # DeepSeek context caching is automatic and reports hits separately
+        cache_read_tokens = (getattr(response.usage, "prompt_cache_hit_tokens", None) or 0) if response.usage else 0
+        reservation.actual_tokens = input_tokens + output_tokens
+    get_client_registry().record_request(client, elapsed_time)
 
     raw_response = response.choices[0].message.content or ""
     parsed = extract_json(raw_response)
 
-    input_tokens = response.usage.prompt_tokens if response.usage else 0
-    output_tokens = response.usage.completion_tokens if response.usage else 0
-
     return {
         "raw_response": raw_response,
         "parsed_response": parsed,
         "input_tokens": input_tokens,
         "output_tokens": output_tokens,
+        "cache_read_tokens": cache_read_tokens,
+        "cache_write_tokens": 0,
         "elapsed_time": elapsed_time,
-        "cost": (
-            input_tokens * config["input_cost_per_1m"] / 1_000_000
-            + output_tokens * config["output_cost_per_1m"] / 1_000_000
-        ),
+        "rate_limit_wait": reservation.wait_time,
+        "cost": calculate_cost(config, input_tokens, output_tokens, cache_read_tokens),
     }
 
 
@@ -796,38 +949,42 @@ def call_deepseek_r1(prompt: str) -> dict[str, Any]:
 def call_gemini(prompt: str, model_name: str = "gemini-pro") -> dict[str, Any]:
     """Gemini APIを呼び出し"""
     config = MODEL_CONFIG[model_name]
+    registry = get_client_registry()
+    api_key = os.environ.get("GOOGLE_API_KEY")
+
+    model = registry.gemini_model(config["model_id"], api_key)
 
-    genai.configure(api_key=os.environ.get("GOOGLE_API_KEY"))
-    model = genai.GenerativeModel(config["model_id"])
+    with get_model_rate_limiter(model_name).reserve(estimate_tokens(prompt)) as reservation:
+        start_time = time.time()
+        response = model.generate_content(prompt)
+        elapsed_time = time.time() - start_time
 
-    start_time = time.time()
-    response = model.generate_content(prompt)
-    elapsed_time = time.time() - start_time
+        # Gemini のトークン数取得（prompt_token_count はキャッシュ分を含む）
+        usage = response.usage_metadata
+        input_tokens = usage.prompt_token_count if usage else 0
+        output_tokens = usage.candidates_token_count if usage else 0
+        cache_read_tokens = (getattr(usage, "cached_content_token_count", None) or 0) if usage else 0
+        reservation.actual_tokens = input_tokens + output_tokens
+    registry.record_request(model, elapsed_time)
 
     raw_response = response.text
     parsed = extract_json(raw_response)
 
-    # Gemini のトークン数取得
-    input_tokens = response.usage_metadata.prompt_token_count if response.usage_metadata else 0
-    output_tokens = response.usage_metadata.candidates_token_count if response.usage_metadata else 0
-
     return {
         "raw_response": raw_response,
         "parsed_response": parsed,
         "input_tokens": input_tokens,
         "output_tokens": output_tokens,
+        "cache_read_tokens": cache_read_tokens,
+        "cache_write_tokens": 0,
         "elapsed_time": elapsed_time,
-        "cost": (
-            input_tokens * config["input_cost_per_1m"] / 1_000_000
-            + output_tokens * config["output_cost_per_1m"] / 1_000_000
-        ),
+        "rate_limit_wait": reservation.wait_time,
+        "cost": calculate_cost(config, input_tokens, output_tokens, cache_read_tokens),
     }
 
 
-def run_review(model: ModelName, case: dict[str, Any]) -> dict[str, Any]:
-    """モデルでレビューを実行"""
-    prompt = build_prompt(case)
-
+def call_model(model: ModelName, prompt: str) -> dict[str, Any]:
+    """プロンプトをモデルに送信"""
     if model in ("claude-opus", "claude-sonnet", "claude-haiku"):
         return call_claude(prompt, model)
     elif model in ("gpt-4o", "gpt-5"):
@@ -842,6 +999,161 @@ def run_review(model: ModelName, case: dict[str, Any]) -> dict[str, Any]:
         raise ValueError(f"Unknown model: {model}")
 
 
+def review_cache_key(model: ModelName, prompt: str) -> str:
+    """Cache key for a review request."""
+    config = MODEL_CONFIG[model]
+    return make_cache_key(
+        provider=config["provider"],
+        model_id=config["model_id"],
+        max_tokens=REVIEW_MAX_TOKENS,
+        temperature=REVIEW_TEMPERATURE,
+        prompt=prompt,
+    )
+
+
+def result_from_cache(cached: dict[str, Any]) -> dict[str, Any]:
+    """Rebuild a review result from a cache entry (the response is re-parsed)."""
+    return {
+        "raw_response": cached["raw_response"],
+        "parsed_response": extract_json(cached["raw_response"]),
+        "input_tokens": cached["input_tokens"],
+        "output_tokens": cached["output_tokens"],
+        "cache_read_tokens": cached.get("cache_read_tokens", 0),
+        "cache_write_tokens": cached.get("cache_write_tokens", 0),
+        "elapsed_time": cached["elapsed_time"],
+        "cost": cached["cost"],
+        "cache_hit": True,
+    }
+
+
+def store_in_cache(cache: ResponseCache, key: str, model: ModelName, result: dict[str, Any]) -> None:
+    """Store the replayable parts of a review result."""
+    cache.put(key, {
+        "model": model,
+        "model_id": MODEL_CONFIG[model]["model_id"],
+        "raw_response": result["raw_response"],
+        "input_tokens": result["input_tokens"],
+        "output_tokens": result["output_tokens"],
+        "cache_read_tokens": result.get("cache_read_tokens", 0),
+        "cache_write_tokens": result.get("cache_write_tokens", 0),
+        "elapsed_time": result["elapsed_time"],
+        "cost": result["cost"],
+    })
+
+
+def replay_review(
+    model: ModelName,
+    prompt: str,
+    case: dict[str, Any],
+    replay: ReplayStore,
+) -> dict[str, Any]:
+    """Serve a review from a recorded run instead of calling the provider."""
+    with get_model_rate_limiter(model).reserve(estimate_tokens(prompt)) as reservation:
+        recorded = replay.replay(
+            model, prompt, case["meta"]["case_id"], case.get("context_mode"), case.get("framework"),
+        )
+        reservation.actual_tokens = recorded.get("input_tokens", 0) + recorded.get("output_tokens", 0)
+
+    return {
+        "raw_response": recorded["raw_response"],
+        "parsed_response": extract_json(recorded["raw_response"]),
+        "input_tokens": recorded.get("input_tokens", 0),
+        "output_tokens": recorded.get("output_tokens", 0),
+        "cache_read_tokens": recorded.get("cache_read_tokens", 0),
+        "cache_write_tokens": recorded.get("cache_write_tokens", 0),
+        "elapsed_time": recorded.get("elapsed_time", 0.0),
+        "rate_limit_wait": reservation.wait_time,
+        "cost": recorded.get("cost", 0.0),
+        "replayed": True,
+    }
+
+
+def simulate_review(
+    model: ModelName,
+    prompt: str,
+    case: dict[str, Any],
+    simulator: SimulatedProvider,
+) -> dict[str, Any]:
+    """Review with the synthetic provider (``--provider simulate``)."""
+    with get_model_rate_limiter(model).reserve(estimate_tokens(prompt)) as reservation:
+        raw_response, input_tokens, output_tokens, elapsed_time = simulator.review(model, prompt, case)
+        reservation.actual_tokens = input_tokens + output_tokens
+
+    return {
+        "raw_response": raw_response,
+        "parsed_response": extract_json(raw_response),
+        "input_tokens": input_tokens,
+        "output_tokens": output_tokens,
+        "elapsed_time": elapsed_time,
+        "rate_limit_wait": reservation.wait_time,
+        "cost": calculate_cost(MODEL_CONFIG[model], input_tokens, output_tokens),
+        "simulated": True,
+    }
+
+
+def run_review(
+    model: ModelName,
+    case: dict[str, Any],
+    cache: ResponseCache | None = None,
+    replay: ReplayStore | None = None,
+    record: bool = False,
+) -> dict[str, Any]:
+    """モデルでレビューを実行
+
+    Args:
+        model: モデル名
+        case: load_case で読み込んだケースデータ
+        cache: レスポンスキャッシュ（None でキャッシュ無効）
+        replay: 記録済みレスポンス（指定時は API を呼ばない）
+        record: 結果に prompt_hash を付与してリプレイ可能にする
+
+    configure_simulator() 済みの場合はシミュレータで応答を生成する。
+    API 呼び出しは get_retry_policy() のリトライ/タイムアウト/ヘッジ設定に従う。
+    適応的同時実行数が有効な場合、各試行はプロバイダの AIMD リミッタの枠を確保する。
+
+    Returns:
+        レビュー結果の辞書。キャッシュ有効時は cache_hit を含む
+    """
+    prompt = build_prompt(case)
+
+    simulator = get_simulator()
+    limiter = get_model_concurrency_limiter(model)
+
+    def attempt() -> dict[str, Any]:
+        if replay is not None:
+            return replay_review(model, prompt, case, replay)
+        if simulator is not None:
+            return simulate_review(model, prompt, case, simulator)
+        return call_model(model, prompt)
+
+    def request() -> dict[str, Any]:
+        if limiter is None:
+            return attempt()
+        with limiter.slot():
+            return attempt()
+
+    def request_with_policy() -> dict[str, Any]:
+        response, call_stats = get_retry_policy().call(request, key=model)
+        response.update(call_stats.to_dict())
+        return response
+
+    if cache is None or replay is not None or simulator is not None:
+        result = request_with_policy()
+    else:
+        key = review_cache_key(model, prompt)
+        cached = cache.get(key)
+        if cached is not None:
+            result = result_from_cache(cached)
+        else:
+            result = request_with_policy()
+            store_in_cache(cache, key, model, result)
+            result["cache_hit"] = False
+
+    if record:
+        result["prompt_hash"] = prompt_hash(prompt)
+    return result
+
+
 def discover_cases(cases_path: Path) -> list[Path]:
     """ケースディレクトリを探索"""
     case_dirs = []
@@ -856,6 +1168,9 @@ def run_single_case(
     mode: RunMode,
     verbose: bool = False,
     framework: str = "rails",
+    cache: ResponseCache | None = None,
+    replay: ReplayStore | None = None,
+    record: bool = False,
 ) -> dict[str, Any]:
     """単一ケースを実行
 
@@ -865,13 +1180,20 @@ def run_single_case(
         mode: 実行モード（explicit/implicit）
         verbose: 詳細出力
         framework: フレームワーク（rails または django）
+        cache: レスポンスキャッシュ（None でキャッシュ無効）
+        replay: 記録済みレスポンス（指定時は API を呼ばない）
+        record: 結果に prompt_hash を付与する
 
     Returns:
         実行結果の辞書
     """
     case = load_case(case_dir, mode=mode, framework=framework)
-    result = run_review(model, case)
+    result = run_review(model, case, cache=cache, replay=replay, record=record)
+    return annotate_result(result, case, mode)
 
+
+def annotate_result(result: dict[str, Any], case: dict[str, Any], mode: RunMode) -> dict[str, Any]:
+    """レビュー結果にケース情報を付与"""
     result["case_id"] = case["meta"]["case_id"]
     result["category"] = case["meta"]["category"]
     result["expected_detection"] = case["meta"]["expected_detection"]
@@ -886,69 +1208,373 @@ def run_single_case(
     return result
 
 
-def run_benchmark(
-    model: ModelName,
-    case_dirs: list[Path],
-    output_dir: Path,
-    mode: RunMode = "explicit",
-    verbose: bool = False,
-    framework: str = "rails",
-) -> dict[str, Any]:
-    """単一モデルでベンチマークを実行
+def get_batch_backend(model: ModelName, backend_name: str, batch_dir: Path) -> BatchBackend | None:
+    """Batch backend for a model, or None when its provider has no batch support here.
 
     Args:
         model: モデル名
-        case_dirs: ケースディレクトリのリスト
-        output_dir: 結果出力ディレクトリ
-        mode: 実行モード
-            - "explicit": ガイドライン有りでレビュー
-            - "implicit": ガイドライン無しでレビュー
-            - "dual": 両方実行して比較用データを生成
-        verbose: 詳細出力
-        framework: フレームワーク（rails または django）
+        backend_name: "api" (provider Batch API) or "local" (LocalBatchServer stand-in)
+        batch_dir: Directory shared with the local stand-in server
     """
-    results = []
-    total_cost = 0.0
-    total_time = 0.0
-    errors = []
+    if backend_name == "local":
+        return LocalBatchBackend(batch_dir)
+
+    provider = MODEL_CONFIG[model]["provider"]
+    if provider == "anthropic":
+        return AnthropicBatchBackend(get_client_registry().anthropic_client())
+    if provider == "openai":
+        return OpenAIBatchBackend(get_client_registry().openai_client(os.environ.get("OPENAI_API_KEY")))
+    return None
 
-    mode_suffix = f" [{mode}]" if mode != "explicit" else ""
-    print(f"\n{'='*60}")
-    print(f"Running: {model}{mode_suffix}")
-    print(f"{'='*60}")
 
+def run_batch_reviews(
+    model: ModelName,
+    runs: list[tuple[int, Path, RunMode]],
+    framework: str,
+    backend: BatchBackend,
+    cache: ResponseCache | None = None,
+    poll_interval: float = 30.0,
+    record: bool = False,
+) -> list[dict[str, Any]]:
+    """Review all runs through one provider batch.
+
+    Cached prompts are answered locally; the rest are submitted together,
+    polled until the batch ends and priced with the model's batch_discount.
+
+    Returns:
+        Results in the same order as ``runs``
+    """
+    config = MODEL_CONFIG[model]
+    results: list[dict[str, Any] | None] = [None] * len(runs)
+    pending: dict[str, tuple[int, dict[str, Any], RunMode, str | None, str | None]] = {}
+    requests: list[BatchRequest] = []
+
+    for n, (_, case_dir, run_mode) in enumerate(runs):
+        try:
+            case = load_case(case_dir, mode=run_mode, framework=framework)
+        except Exception as e:
+            results[n] = {
+                "case_id": case_dir.name,
+                "category": case_dir.parent.name,
+                "context_mode": run_mode,
+                "success": False,
+                "error": str(e),
+            }
+            continue
+
+        prompt = build_prompt(case)
+        key = review_cache_key(model, prompt) if cache else None
+        cached = cache.get(key) if cache and key else None
+        if cached is not None:
+            result = result_from_cache(cached)
+            if record:
+                result["prompt_hash"] = prompt_hash(prompt)
+            results[n] = annotate_result(result, case, run_mode)
+            continue
+
+        custom_id = f"run-{n:05d}"
+        requests.append(BatchRequest(custom_id, config["model_id"], prompt, REVIEW_MAX_TOKENS))
+        pending[custom_id] = (n, case, run_mode, key, prompt_hash(prompt) if record else None)
+
+    if requests:
+        batch_id = backend.submit(requests)
+        print(f"  Submitted batch {batch_id} ({len(requests)} requests, backend: {backend.name})", flush=True)
+
+        def on_poll(status: str, elapsed: float) -> None:
+            print(f"  Batch {batch_id}: {status} ({elapsed:.0f}s)", flush=True)
+
+        submitted_at = time.time()
+        responses = backend.wait(batch_id, poll_interval, on_poll=on_poll)
+        turnaround = time.time() - submitted_at
+
+        for custom_id, (n, case, run_mode, key, recorded_hash) in pending.items():
+            response = responses.get(custom_id)
+            if response is None or response.error:
+                results[n] = {
+                    "case_id": case["meta"]["case_id"],
+                    "category": case["meta"]["category"],
+                    "context_mode": run_mode,
+                    "success": False,
+                    "error": response.error if response else "missing from batch results",
+                    "batch_id": batch_id,
+                }
+                continue
+
+            result = {
+                "raw_response": response.text,
+                "parsed_response": extract_json(response.text),
+                "input_tokens": response.input_tokens,
+                "output_tokens": response.output_tokens,
+                # Per-request latency is not observable in batch mode
+                "elapsed_time": 0.0,
+                "cost": calculate_cost(config, response.input_tokens, response.output_tokens)
+                * config.get("batch_discount", 1.0),
+                "batch_id": batch_id,
+                "batch_turnaround": turnaround,
+            }
+            if cache and key:
+                store_in_cache(cache, key, model, result)
+                result["cache_hit"] = False
+            if recorded_hash:
+                result["prompt_hash"] = recorded_hash
+            results[n] = annotate_result(result, case, run_mode)
+
+    return results  # type: ignore[return-value]
+
+
+def parse_shard(value: str) -> tuple[int, int]:
+    """Parse ``--shard i/N`` (1-based) into (index, count).
+
+    Raises:
+        ValueError: If the value is not of the form i/N with 1 <= i <= N
+    """
+    match = re.fullmatch(r"(\d+)/(\d+)", value.strip())
+    if not match or not 1 <= int(match.group(1)) <= int(match.group(2)):
+        raise ValueError(f"Invalid shard '{value}'. Expected i/N with 1 <= i <= N, e.g. 2/4")
+    return int(match.group(1)), int(match.group(2))
+
+
+def shard_of(framework: str, case_id: str, mode: RunMode, count: int) -> int:
+    """Shard (1-based) that owns a run.
+
+    Uses a stable hash of framework/case_id/mode, so every node computes the
+    same partition regardless of case discovery order or Python's hash seed.
+    """
+    digest = hashlib.sha256(f"{framework}/{case_id}/{mode}".encode()).digest()
+    return int.from_bytes(digest[:8], "big") % count + 1
+
+
+def plan_runs(
+    case_dirs: list[Path],
+    mode: RunMode,
+    framework: str = "rails",
+    shard: tuple[int, int] | None = None,
+) -> list[tuple[int, Path, RunMode]]:
+    """Expand case directories into the ordered list of (index, case_dir, context_mode) runs.
+
+    In dual mode, implicit runs are only scheduled for dual-capable cases.
+    With ``shard=(i, N)`` only the runs owned by shard i are returned.
+    The returned order is the order results are written to ``{model}.json``.
+    """
     # dual モードでは実行回数が2倍
     modes_to_run: list[RunMode] = ["explicit", "implicit"] if mode == "dual" else [mode]
 
+    runs: list[tuple[int, Path, RunMode]] = []
     for i, case_dir in enumerate(case_dirs, 1):
-        case_id = case_dir.name
-        category = case_dir.parent.name
-        meta = json.loads((case_dir / "meta.json").read_text())
+        record = get_corpus(case_dir.parent, framework).get(case_dir)
 
         # dual モード対応ケースかチェック
-        is_dual_capable = meta.get("evaluation_mode") == "dual"
+        is_dual_capable = record.is_dual_capable
 
         for run_mode in modes_to_run:
             # dual モードでも、dual 非対応ケースは explicit のみ実行
             if mode == "dual" and run_mode == "implicit" and not is_dual_capable:
                 continue
+            if shard is not None and shard_of(framework, record.case_id, run_mode, shard[1]) != shard[0]:
+                continue
+            runs.append((i, case_dir, run_mode))
+    return runs
+
+
+def load_checkpoint(checkpoint_path: Path) -> dict[tuple[str, str], dict[str, Any]]:
+    """Load successful results from a ``{model}.jsonl`` checkpoint.
 
-            mode_label = f" ({run_mode})" if mode == "dual" else ""
-            print(f"[{i:3d}/{len(case_dirs)}] {category}/{case_id}{mode_label}", end=" ... ", flush=True)
+    Later lines win, so a run that failed and was retried successfully is
+    picked up. Falls back to ``{model}.json`` for runs written before
+    checkpoints existed. A truncated last line (crash mid-write) is ignored.
 
+    Returns:
+        Mapping of (case_id, context_mode) to the successful result
+    """
+    results: list[dict[str, Any]] = []
+    if checkpoint_path.exists():
+        for line in checkpoint_path.read_text().splitlines():
             try:
-                result = run_single_case(model, case_dir, run_mode, verbose, framework)
+                results.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+    else:
+        legacy_path = checkpoint_path.with_suffix(".json")
+        if legacy_path.exists():
+            results = json.loads(legacy_path.read_text())
+
+    completed: dict[tuple[str, str], dict[str, Any]] = {}
+    for result in results:
+        key = (result.get("case_id", ""), result.get("context_mode", "explicit"))
+        if result.get("success"):
+            completed[key] = result
+        else:
+            completed.pop(key, None)
+    return completed
 
-                total_cost += result.get("cost", 0)
-                total_time += result.get("elapsed_time", 0)
 
-                print(f"OK ({result.get('elapsed_time', 0):.1f}s, ${result.get('cost', 0):.4f})")
+async def run_benchmark_async(
+    model: ModelName,
+    case_dirs: list[Path],
+    output_dir: Path,
+    mode: RunMode = "explicit",
+    verbose: bool = False,
+    framework: str = "rails",
+    concurrency: int = 1,
+    cache: ResponseCache | None = None,
+    resume: bool = False,
+    batch_backend: BatchBackend | None = None,
+    batch_poll_interval: float = 30.0,
+    replay: ReplayStore | None = None,
+    record: bool = False,
+    semaphore: asyncio.Semaphore | None = None,
+    label: str = "",
+    output_stem: str | None = None,
+    shard: tuple[int, int] | None = None,
+    work_queue: WorkQueue | None = None,
+    queue_poll_interval: float = 1.0,
+) -> dict[str, Any]:
+    """単一モデルでベンチマークを実行（非同期版）
+
+    Reviews are dispatched to worker threads with at most ``concurrency``
+    requests in flight. Results are collected in case order, so the output
+    file is identical to a sequential run. With adaptive concurrency
+    enabled, the provider's AIMD limiter further bounds in-flight attempts
+    and ``concurrency`` acts as the ceiling.
+
+    Each finished run is appended to ``{model}.jsonl`` immediately. With
+    ``resume=True`` runs that already succeeded in that file are reused and
+    only missing or failed runs are executed.
+
+    With ``batch_backend`` all pending runs are submitted as a single batch
+    instead of individual requests. With ``work_queue`` they are enqueued for
+    ``runner.py worker`` processes and results are collected as they finish.
+
+    Args:
+        model: モデル名
+        case_dirs: ケースディレクトリのリスト
+        output_dir: 結果出力ディレクトリ
+        mode: 実行モード（explicit/implicit/dual）
+        verbose: 詳細出力
+        framework: フレームワーク
+        concurrency: 同時実行数
+        cache: レスポンスキャッシュ（None でキャッシュ無効）
+        resume: {model}.jsonl の成功済み結果を再利用する
+        batch_backend: バッチ実行バックエンド（None で逐次 API 呼び出し）
+        batch_poll_interval: バッチ状態のポーリング間隔（秒）
+        replay: 記録済みレスポンス（指定時は API を呼ばない）
+        record: 結果に prompt_hash を付与してリプレイ可能にする
+        semaphore: 共有する同時実行枠（None でモデル専用に concurrency 枠を作成）
+        label: 進捗行の接頭辞（複数モデル・複数フレームワーク並列実行時）
+        output_stem: 結果ファイル名（デフォルト: モデル名）
+        shard: (i, N) 指定時は i 番目のシャードに属する実行のみ行う
+        work_queue: ワーカープロセス用のキュー（None でこのプロセス内で実行）
+        queue_poll_interval: キューの結果確認間隔（秒）
+
+    Returns:
+        サマリーの辞書
+    """
+    mode_suffix = f" [{mode}]" if mode != "explicit" else ""
+    stem = output_stem or model
+    print(f"\n{'='*60}")
+    print(f"Running: {stem}{mode_suffix}")
+    print(f"{'='*60}")
 
-                if verbose and result.get("parsed_response"):
-                    parsed = result["parsed_response"]
-                    if parsed.get("has_issues"):
-                        print(f"       Issues found: {len(parsed.get('issues', []))}")
+    runs = plan_runs(case_dirs, mode, framework, shard)
+    if shard is not None:
+        print(f"Shard {shard[0]}/{shard[1]}: {len(runs)} runs")
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+    wall_start = time.time()
+
+    # 完了済み結果を逐次追記するチェックポイント
+    checkpoint_path = output_dir / f"{stem}.jsonl"
+    completed = load_checkpoint(checkpoint_path) if resume else {}
+    if resume:
+        print(f"Resuming: {len(completed)} of {len(runs)} runs already completed")
+
+    # バッチ実行の結果（run index -> result）
+    prefetched: dict[int, dict[str, Any]] = {}
+
+    # 適応的同時実行数（有効時は concurrency が上限）
+    limiter = get_model_concurrency_limiter(model) if batch_backend is None and work_queue is None else None
+
+    def run_label(i: int, case_dir: Path, run_mode: RunMode) -> str:
+        mode_label = f" ({run_mode})" if mode == "dual" else ""
+        prefix = f"{label} " if label else ""
+        return f"{prefix}[{i:3d}/{len(case_dirs)}] {case_dir.parent.name}/{case_dir.name}{mode_label}"
+
+    def write_result(label: str, result: dict[str, Any]) -> None:
+        checkpoint.write(json.dumps(result, ensure_ascii=False) + "\n")
+        checkpoint.flush()
+
+        if not result["success"]:
+            print(f"{label} ... ERROR: {result['error']}", flush=True)
+            return
+
+        if result.get("batch_id"):
+            timing = f"batch {result['batch_id']}"
+        else:
+            timing = f"{result.get('elapsed_time', 0):.1f}s"
+        if result.get("cache_hit"):
+            cached_label = ", cached"
+        elif result.get("replayed"):
+            cached_label = ", replayed"
+        elif result.get("simulated"):
+            cached_label = ", simulated"
+        else:
+            cached_label = ""
+        concurrency_label = f", c={limiter.limit}" if limiter is not None else ""
+        print(f"{label} ... OK ({timing}, ${result.get('cost', 0):.4f}{cached_label}{concurrency_label})", flush=True)
+        if verbose and result.get("parsed_response"):
+            parsed = result["parsed_response"]
+            if parsed.get("has_issues"):
+                print(f"       Issues found: {len(parsed.get('issues', []))}")
+
+    async def run_batch() -> None:
+        pending = [
+            (n, run) for n, run in enumerate(runs)
+            if (run[1].name, run[2]) not in completed
+        ]
+        if not pending:
+            return
+        batch_results = await asyncio.to_thread(
+            run_batch_reviews, model, [run for _, run in pending], framework,
+            batch_backend, cache, batch_poll_interval, record,
+        )
+        for (n, run), result in zip(pending, batch_results):
+            prefetched[n] = result
+            write_result(run_label(*run), result)
+
+    async def run_queue() -> None:
+        pending = {
+            Task.make_key(model, framework, str(run[1].resolve()), run[2]): (n, run)
+            for n, run in enumerate(runs)
+            if (run[1].name, run[2]) not in completed
+        }
+        if not pending:
+            return
+        await asyncio.to_thread(work_queue.enqueue, [
+            Task(key, model, framework, str(case_dir.resolve()), run_mode)
+            for key, (_, (_, case_dir, run_mode)) in pending.items()
+        ])
+        while pending:
+            finished = await asyncio.to_thread(work_queue.results, list(pending))
+            for key in [key for key in pending if key in finished]:
+                n, run = pending.pop(key)
+                prefetched[n] = finished[key]
+                write_result(run_label(*run), finished[key])
+            if pending:
+                await asyncio.sleep(queue_poll_interval)
+
+    async def run_one(n: int, i: int, case_dir: Path, run_mode: RunMode) -> dict[str, Any]:
+        category = case_dir.parent.name
+        previous = completed.get((case_dir.name, run_mode))
+        if previous is not None:
+            return previous
+        if n in prefetched:
+            return prefetched[n]
 
+        async with semaphore:
+            try:
+                result = await asyncio.to_thread(
+                    run_single_case, model, case_dir, run_mode, verbose, framework, cache, replay, record,
+                )
             except Exception as e:
                 result = {
                     "case_id": case_dir.name,
@@ -957,14 +1583,51 @@ def run_benchmark(
                     "success": False,
                     "error": str(e),
                 }
-                errors.append(f"{category}/{case_id} ({run_mode}): {e}")
-                print(f"ERROR: {e}")
 
-            results.append(result)
+        write_result(run_label(i, case_dir, run_mode), result)
+        return result
+
+    with checkpoint_path.open("a" if resume else "w") as checkpoint:
+        if batch_backend is not None:
+            await run_batch()
+        elif work_queue is not None:
+            await run_queue()
+        results = list(await asyncio.gather(*(run_one(n, *run) for n, run in enumerate(runs))))
+    wall_time = time.time() - wall_start
+
+    total_cost = 0.0
+    total_time = 0.0
+    cache_hits = 0
+    cached_cost = 0.0
+    input_tokens = 0
+    cache_read_tokens = 0
+    cache_write_tokens = 0
+    retries = 0
+    recovered = 0
+    retry_time = 0.0
+    hedged = 0
+    errors = []
+    for result in results:
+        if result.get("success"):
+            if result.get("attempts", 1) > 1:
+                retries += result["attempts"] - 1
+                recovered += 1
+                retry_time += result.get("retry_time", 0.0)
+            hedged += bool(result.get("hedged"))
+            total_cost += result.get("cost", 0)
+            total_time += result.get("elapsed_time", 0)
+            input_tokens += result.get("input_tokens", 0)
+            cache_read_tokens += result.get("cache_read_tokens", 0)
+            cache_write_tokens += result.get("cache_write_tokens", 0)
+            if result.get("cache_hit"):
+                cache_hits += 1
+                cached_cost += result.get("cost", 0)
+        else:
+            errors.append(f"{result['category']}/{result['case_id']} ({result['context_mode']}): {result['error']}")
 
     # 結果保存
     # dual モードの場合はファイル名にモードを含めない（結果にcontext_modeが含まれる）
-    output_file = output_dir / f"{model}.json"
+    output_file = output_dir / f"{stem}.json"
     output_file.write_text(json.dumps(results, indent=2, ensure_ascii=False))
 
     # サマリー
@@ -979,8 +1642,41 @@ def run_benchmark(
         "total_cost": total_cost,
         "total_time": total_time,
         "avg_time_per_run": total_time / actual_runs if actual_runs else 0,
+        "wall_time": wall_time,
+        "concurrency": concurrency,
+        "cache_hits": cache_hits,
+        "cached_cost": cached_cost,
+        "prompt_cache": {
+            "input_tokens": input_tokens,
+            "cache_read_tokens": cache_read_tokens,
+            "cache_write_tokens": cache_write_tokens,
+            "cache_read_rate": cache_read_tokens / input_tokens if input_tokens else 0.0,
+            "savings": prompt_cache_savings(MODEL_CONFIG[model], cache_read_tokens, cache_write_tokens),
+        },
+        "retries": {
+            "retried_requests": retries,
+            "recovered_runs": recovered,
+            "retry_time": retry_time,
+            "hedged_runs": hedged,
+        },
+        "execution": "batch" if batch_backend is not None else "queue" if work_queue is not None else "interactive",
+        "provider": (
+            "replay" if replay is not None
+            else "simulate" if get_simulator() is not None
+            else "record" if record
+            else "live"
+        ),
         "errors": errors,
     }
+    if stem != model:
+        summary["framework"] = framework
+    if shard is not None:
+        summary["shard"] = f"{shard[0]}/{shard[1]}"
+    if limiter is not None:
+        summary["adaptive_concurrency"] = limiter.to_dict()
+    if batch_backend is not None:
+        summary["batch_backend"] = batch_backend.name
+        summary["batch_ids"] = sorted({r["batch_id"] for r in results if r.get("batch_id")})
 
     if mode == "dual":
         explicit_results = [r for r in results if r.get("context_mode") == "explicit"]
@@ -988,18 +1684,398 @@ def run_benchmark(
         summary["explicit_runs"] = len(explicit_results)
         summary["implicit_runs"] = len(implicit_results)
 
-    print(f"\n{model} Summary:")
-    print(f"  Runs: {summary['successful']}/{summary['total_runs']} successful")
+    # 並列実行中の他モデルの進捗と混ざらないよう一度に出力する
+    lines = []
+    lines.append(f"\n{stem} Summary:")
+    lines.append(f"  Runs: {summary['successful']}/{summary['total_runs']} successful")
     if mode == "dual":
-        print(f"  (explicit: {summary.get('explicit_runs', 0)}, implicit: {summary.get('implicit_runs', 0)})")
-    print(f"  Total cost: ${summary['total_cost']:.4f}")
-    print(f"  Total time: {summary['total_time']:.1f}s")
-    print(f"  Avg time/run: {summary['avg_time_per_run']:.1f}s")
+        lines.append(f"  (explicit: {summary.get('explicit_runs', 0)}, implicit: {summary.get('implicit_runs', 0)})")
+    lines.append(f"  Total cost: ${summary['total_cost']:.4f}")
+    lines.append(f"  Total time: {summary['total_time']:.1f}s (wall: {summary['wall_time']:.1f}s, concurrency: {concurrency})")
+    lines.append(f"  Avg time/run: {summary['avg_time_per_run']:.1f}s")
+    if cache is not None:
+        lines.append(f"  Cache hits: {cache_hits}/{actual_runs} (${cached_cost:.4f} not re-spent)")
+    if limiter is not None:
+        adaptive = summary["adaptive_concurrency"]
+        lines.append(
+            f"  Adaptive concurrency ({limiter.name}): {adaptive['limit']} "
+            f"(range {adaptive['lowest_limit']}-{adaptive['highest_limit']}, "
+            f"{adaptive['throttle_events']} throttle events)"
+        )
+    if retries or hedged:
+        lines.append(f"  Retries: {retries} ({recovered} runs recovered, {retry_time:.1f}s retrying), hedged: {hedged}")
+    if cache_read_tokens or cache_write_tokens:
+        prompt_cache = summary["prompt_cache"]
+        lines.append(
+            f"  Prompt cache: {cache_read_tokens}/{input_tokens} input tokens read from cache "
+            f"({cache_write_tokens} written, ${prompt_cache['savings']:.4f} saved)"
+        )
+
+    print("\n".join(lines), flush=True)
 
     return summary
 
 
+def report_concurrency_change(provider: str, old_limit: int, new_limit: int, reason: str) -> None:
+    """Print adaptive concurrency changes alongside the progress lines."""
+    arrow = "↓" if new_limit < old_limit else "↑"
+    # Called from worker threads: write the line in one call so it does not interleave
+    sys.stdout.write(f"  {arrow} {provider} concurrency {old_limit} -> {new_limit} ({reason})\n")
+    sys.stdout.flush()
+
+
+def run_async(coro: Any, max_workers: int) -> Any:
+    """Run a coroutine on a fresh event loop whose default executor has ``max_workers`` threads.
+
+    ``asyncio.to_thread`` uses the loop's default executor, so this bounds the
+    number of provider calls that can block a thread at the same time.
+    """
+    async def _main() -> Any:
+        asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(max_workers=max(1, max_workers)))
+        return await coro
+
+    return asyncio.run(_main())
+
+
+def run_benchmark(
+    model: ModelName,
+    case_dirs: list[Path],
+    output_dir: Path,
+    mode: RunMode = "explicit",
+    verbose: bool = False,
+    framework: str = "rails",
+    concurrency: int = 1,
+    cache: ResponseCache | None = None,
+    resume: bool = False,
+    batch_backend: BatchBackend | None = None,
+    batch_poll_interval: float = 30.0,
+    replay: ReplayStore | None = None,
+    record: bool = False,
+) -> dict[str, Any]:
+    """単一モデルでベンチマークを実行
+
+    Args:
+        model: モデル名
+        case_dirs: ケースディレクトリのリスト
+        output_dir: 結果出力ディレクトリ
+        mode: 実行モード
+            - "explicit": ガイドライン有りでレビュー
+            - "implicit": ガイドライン無しでレビュー
+            - "dual": 両方実行して比較用データを生成
+        verbose: 詳細出力
+        framework: フレームワーク（rails または django）
+        concurrency: 同時実行数（1 で逐次実行）
+        cache: レスポンスキャッシュ（None でキャッシュ無効）
+        resume: {model}.jsonl の成功済み結果を再利用する
+        batch_backend: バッチ実行バックエンド（None で逐次 API 呼び出し）
+        batch_poll_interval: バッチ状態のポーリング間隔（秒）
+        replay: 記録済みレスポンス（指定時は API を呼ばない）
+        record: 結果に prompt_hash を付与してリプレイ可能にする
+    """
+    return run_async(
+        run_benchmark_async(
+            model, case_dirs, output_dir, mode, verbose, framework, concurrency, cache, resume,
+            batch_backend, batch_poll_interval, replay, record,
+        ),
+        max_workers=concurrency,
+    )
+
+
+def provider_groups(models: list[ModelName]) -> dict[str, list[ModelName]]:
+    """Group models by provider, preserving model order."""
+    groups: dict[str, list[ModelName]] = {}
+    for model in models:
+        groups.setdefault(MODEL_CONFIG[model]["provider"], []).append(model)
+    return groups
+
+
+async def run_models_async(
+    models: list[ModelName],
+    cases_by_framework: dict[str, list[Path]],
+    output_dir: Path,
+    mode: RunMode = "explicit",
+    verbose: bool = False,
+    concurrency: int = 1,
+    cache: ResponseCache | None = None,
+    resume: bool = False,
+    batch_backends: dict[str, BatchBackend | None] | None = None,
+    batch_poll_interval: float = 30.0,
+    replay: ReplayStore | None = None,
+    record: bool = False,
+    shard: tuple[int, int] | None = None,
+    work_queue: WorkQueue | None = None,
+) -> list[dict[str, Any]]:
+    """複数モデル・複数フレームワークを 1 つのスケジューラで並列実行
+
+    Every (model, framework) pair runs concurrently. Models of the same
+    provider share one pool of ``concurrency`` in-flight requests (they
+    share the provider account's limits); different providers proceed
+    independently, so a full sweep takes about as long as the slowest
+    provider. With more than one framework, result files are tagged
+    ``{model}.{framework}.json``.
+
+    Args:
+        models: モデル名のリスト
+        cases_by_framework: フレームワークごとのケースディレクトリ
+        concurrency: プロバイダごとの同時実行数
+        batch_backends: モデルごとのバッチ実行バックエンド（None で逐次 API 呼び出し）
+        その他の引数は run_benchmark_async と同じ
+
+    Returns:
+        (model, framework) 順のサマリーのリスト
+    """
+    semaphores = {
+        provider: asyncio.Semaphore(max(1, concurrency))
+        for provider in provider_groups(models)
+    }
+    batch_backends = batch_backends or {}
+    tagged = len(cases_by_framework) > 1
+    jobs = [(model, framework) for model in models for framework in cases_by_framework]
+    return list(await asyncio.gather(*(
+        run_benchmark_async(
+            model, cases_by_framework[framework], output_dir, mode, verbose, framework, concurrency,
+            cache, resume, batch_backends.get(model), batch_poll_interval, replay, record,
+            semaphore=semaphores[MODEL_CONFIG[model]["provider"]],
+            # ケースのラベルに cases/ 直下のフレームワーク名が含まれるためモデル名のみ
+            label=model if len(jobs) > 1 else "",
+            output_stem=result_stem(model, framework, tagged),
+            shard=shard,
+            work_queue=work_queue,
+        )
+        for model, framework in jobs
+    )))
+
+
+def configure_execution(
+    config: dict[str, Any],
+    concurrency: int,
+) -> tuple[ReplayStore | None, SimulatedProvider | None, ResponseCache | None]:
+    """プロバイダ・キャッシュ・リトライ・同時実行数をこのプロセスに設定
+
+    The coordinator stores the same ``config`` in the work queue so that
+    workers call this with identical settings.
+
+    Args:
+        config: provider, replay_latency, simulate_seed, simulate_time_scale,
+            no_cache, refresh_cache, max_attempts, timeout, deadline, hedge,
+            adaptive_concurrency
+        concurrency: 同時実行数（適応的同時実行数の上限）
+
+    Returns:
+        Tuple of (replay store, simulator, response cache); each may be None
+
+    Raises:
+        FileNotFoundError: If the replay directory does not exist
+    """
+    provider_mode, provider_path = parse_provider_spec(config["provider"])
+
+    # レスポンスキャッシュ（リプレイ時は不要）
+    replay = None
+    simulator = None
+    if provider_mode == "replay":
+        if not provider_path.exists():
+            raise FileNotFoundError(f"Replay directory not found: {provider_path}")
+        replay = ReplayStore.from_run_dir(provider_path, latency_scale=config["replay_latency"])
+        print(f"Replaying {len(replay)} recorded responses from {provider_path}")
+    elif provider_mode == "simulate":
+        simulator = configure_simulator(
+            provider_path, seed=config["simulate_seed"], time_scale=config["simulate_time_scale"],
+        )
+        print(f"Simulated provider (seed: {config['simulate_seed']}, time scale: {config['simulate_time_scale']})")
+    if config["no_cache"] or replay is not None or simulator is not None:
+        cache = None
+    else:
+        cache = ResponseCache(REVIEW_CACHE_DIR, refresh=config["refresh_cache"])
+
+    # リトライ/タイムアウト/ヘッジ設定
+    configure_retry_policy(RetryPolicy(
+        max_attempts=max(1, config["max_attempts"]),
+        attempt_timeout=config["timeout"] or None,
+        deadline=config["deadline"] or None,
+        hedge=config["hedge"],
+    ))
+
+    # 適応的同時実行数（プロバイダ単位の AIMD）
+    if config["adaptive_concurrency"]:
+        configure_adaptive_concurrency(
+            initial=min(4, max(1, concurrency)),
+            max_limit=max(1, concurrency),
+            on_change=report_concurrency_change,
+        )
+    return replay, simulator, cache
+
+
+def spawn_workers(queue_path: Path, count: int, concurrency: int, log_dir: Path) -> list[subprocess.Popen]:
+    """Start local ``runner.py worker`` processes, logging to ``log_dir/worker-N.log``."""
+    workers = []
+    if count > 0:
+        log_dir.mkdir(parents=True, exist_ok=True)
+    for n in range(1, count + 1):
+        with (log_dir / f"worker-{n}.log").open("w") as log:
+            workers.append(subprocess.Popen(
+                [
+                    sys.executable, str(Path(__file__).resolve()), "worker",
+                    "--queue", str(queue_path), "--concurrency", str(concurrency),
+                    "--worker-id", f"{socket.gethostname()}-local{n}",
+                ],
+                stdout=log,
+                stderr=subprocess.STDOUT,
+            ))
+    if workers:
+        print(f"Started {len(workers)} local workers (logs: {log_dir})")
+    return workers
+
+
+def run_worker(
+    work_queue: WorkQueue,
+    worker_id: str,
+    concurrency: int = 1,
+    poll_interval: float = 1.0,
+) -> int:
+    """ワークキューからタスクを取得して実行（runner.py worker）
+
+    ``concurrency`` threads each lease one task at a time. A heartbeat thread
+    renews the leases of tasks in flight every third of the lease time. The
+    worker exits once the coordinator has closed the queue and no task is
+    pending or leased.
+
+    Args:
+        work_queue: コーディネータが作成したキュー
+        worker_id: リースの所有者名
+        concurrency: 同時実行数
+        poll_interval: タスクが無い時の待機間隔（秒）
+
+    Returns:
+        実行したタスク数
+    """
+    config = work_queue.get_config()
+    while config is None:
+        time.sleep(poll_interval)
+        config = work_queue.get_config()
+    work_queue.lease_seconds = config["lease_seconds"]
+    replay, _, cache = configure_execution(config, concurrency)
+
+    held: set[int] = set()
+    held_lock = threading.Lock()
+    stopped = threading.Event()
+    executed = 0
+
+    def heartbeat() -> None:
+        while not stopped.wait(work_queue.lease_seconds / 3):
+            with held_lock:
+                task_ids = list(held)
+            if task_ids:
+                work_queue.renew(task_ids, worker_id)
+
+    def drained() -> bool:
+        counts = work_queue.counts()
+        return work_queue.is_closed() and counts["pending"] == 0 and counts["leased"] == 0
+
+    def work() -> None:
+        nonlocal executed
+        while True:
+            task = work_queue.lease(worker_id)
+            if task is None:
+                if drained():
+                    return
+                time.sleep(poll_interval)
+                continue
+
+            with held_lock:
+                held.add(task.id)
+            case_dir = Path(task.case_dir)
+            try:
+                result = run_single_case(
+                    task.model, case_dir, task.context_mode, config["verbose"], task.framework,
+                    cache, replay, config["record"],
+                )
+            except Exception as e:
+                result = {
+                    "case_id": case_dir.name,
+                    "category": case_dir.parent.name,
+                    "context_mode": task.context_mode,
+                    "success": False,
+                    "error": str(e),
+                }
+            stored = work_queue.complete(task, worker_id, result)
+            with held_lock:
+                held.discard(task.id)
+                executed += 1
+
+            status = "OK" if result["success"] else f"ERROR: {result['error']}"
+            stale = "" if stored else " (already completed elsewhere, discarded)"
+            sys.stdout.write(
+                f"[{worker_id}] {task.model} {task.framework}/{case_dir.name} ({task.context_mode}) ... {status}{stale}\n"
+            )
+            sys.stdout.flush()
+
+    heartbeat_thread = threading.Thread(target=heartbeat, daemon=True)
+    heartbeat_thread.start()
+    threads = [threading.Thread(target=work) for _ in range(max(1, concurrency))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    stopped.set()
+    return executed
+
+
+def worker_main(argv: list[str]) -> None:
+    """``runner.py worker``: execute runs enqueued by a coordinator."""
+    parser = argparse.ArgumentParser(
+        prog="runner.py worker",
+        description="Lease and run reviews from a work queue created with 'runner.py --queue'",
+    )
+    parser.add_argument(
+        "--queue",
+        type=Path,
+        required=True,
+        metavar="QUEUE_DB",
+        help="SQLite work queue written by the coordinator",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=1,
+        help="Number of tasks this worker runs at once (default: 1)",
+    )
+    parser.add_argument(
+        "--worker-id",
+        default=f"{socket.gethostname()}-{os.getpid()}",
+        help="Name recorded on leases (default: hostname-pid)",
+    )
+    parser.add_argument(
+        "--poll-interval",
+        type=float,
+        default=1.0,
+        help="Seconds between queue polls when no task is available (default: 1)",
+    )
+    args = parser.parse_args(argv)
+
+    if not args.queue.exists():
+        print(f"Error: Work queue not found: {args.queue}", file=sys.stderr)
+        sys.exit(1)
+    work_queue = WorkQueue(args.queue)
+    print(f"Worker {args.worker_id}: {args.queue} (concurrency: {args.concurrency})")
+    executed = run_worker(work_queue, args.worker_id, args.concurrency, args.poll_interval)
+    print(f"Worker {args.worker_id}: queue drained, {executed} tasks executed")
+
+
+def write_run_status(output_dir: Path, status: str, run_id: str, started_at: str) -> None:
+    """Write RUN_STATUS_FILE atomically (status: "running" or "complete")."""
+    data = {"status": status, "run_id": run_id, "started_at": started_at}
+    if status == "complete":
+        data["finished_at"] = datetime.now().isoformat()
+    tmp_path = output_dir / f"{RUN_STATUS_FILE}.tmp"
+    tmp_path.write_text(json.dumps(data, indent=2))
+    tmp_path.replace(output_dir / RUN_STATUS_FILE)
+
+
 def main() -> None:
+    if sys.argv[1:2] == ["worker"]:
+        worker_main(sys.argv[2:])
+        return
+
     parser = argparse.ArgumentParser(description="AIコードレビューベンチマーク実行")
     parser.add_argument(
         "--model",
@@ -1015,9 +2091,9 @@ def main() -> None:
     )
     parser.add_argument(
         "--framework",
-        choices=["rails", "django", "laravel", "springboot-java", "springboot-kotlin"],
         default="rails",
-        help="Target framework (default: rails)",
+        help="Target framework: rails (default), django, laravel, springboot-java, springboot-kotlin, "
+             "a comma-separated list, or 'all'. Multiple frameworks share one run directory and scheduler",
     )
     parser.add_argument(
         "--cases",
@@ -1039,40 +2115,196 @@ def main() -> None:
         action="store_true",
         help="API呼び出しをせずにケース一覧のみ表示",
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=1,
+        help="Number of reviews in flight at once per provider (default: 1 = sequential)",
+    )
+    parser.add_argument(
+        "--adaptive-concurrency",
+        action="store_true",
+        help="Adapt in-flight requests per provider (AIMD): start at min(4, --concurrency), "
+             "grow while p95 latency stays flat, halve on 429/overloaded errors",
+    )
+    parser.add_argument(
+        "--shard",
+        metavar="I/N",
+        help="Run only shard I of N (1-based), partitioned by a stable hash of framework/case_id/mode; "
+             "combine shard directories with merge_runs.py",
+    )
+    parser.add_argument(
+        "--queue",
+        nargs="?",
+        const="",
+        metavar="QUEUE_DB",
+        help="Enqueue runs in a SQLite work queue (default: {output_dir}/queue.db) for "
+             "'runner.py worker' processes instead of running them in this process",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=0,
+        help="With --queue, start this many local worker processes (default: 0 = external workers only)",
+    )
+    parser.add_argument(
+        "--lease-timeout",
+        type=float,
+        default=60.0,
+        help="With --queue, seconds before an unrenewed lease expires and the run is re-queued (default: 60)",
+    )
+    parser.add_argument(
+        "--resume",
+        type=Path,
+        metavar="RUN_DIR",
+        help="Resume an interrupted run: skip runs that already succeeded in RUN_DIR/{model}.jsonl and retry failures",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Disable the response cache (results/.cache/reviews)",
+    )
+    parser.add_argument(
+        "--refresh-cache",
+        action="store_true",
+        help="Ignore cached responses and overwrite them with fresh API results",
+    )
+    parser.add_argument(
+        "--provider",
+        default="live",
+        metavar="{live,record,replay:RUN_DIR}",
+        help="live (default), record (add prompt_hash to results for later replay), "
+             "replay:RUN_DIR (serve responses recorded in RUN_DIR/{model}.json without API calls), "
+             "or simulate[:PROFILES_JSON] (synthetic provider with configurable latency and errors)",
+    )
+    parser.add_argument(
+        "--replay-latency",
+        type=float,
+        nargs="?",
+        const=1.0,
+        metavar="SCALE",
+        help="When replaying, sleep for the recorded elapsed_time (optionally scaled, e.g. 0.1)",
+    )
+    parser.add_argument(
+        "--simulate-seed",
+        type=int,
+        default=0,
+        help="Seed for --provider simulate (default: 0)",
+    )
+    parser.add_argument(
+        "--simulate-time-scale",
+        type=float,
+        default=1.0,
+        help="Scale simulated latencies and rate-limit windows, e.g. 0.01 for 100x faster (default: 1.0)",
+    )
+    parser.add_argument(
+        "--max-attempts",
+        type=int,
+        default=3,
+        help="Attempts per request; transient errors (429, 5xx, timeouts) are retried with backoff (default: 3)",
+    )
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=300.0,
+        help="Seconds before a single attempt is abandoned and retried (default: 300, 0 = no timeout)",
+    )
+    parser.add_argument(
+        "--deadline",
+        type=float,
+        default=900.0,
+        help="Seconds allowed per review including retries (default: 900, 0 = no deadline)",
+    )
+    parser.add_argument(
+        "--hedge",
+        action="store_true",
+        help="Send a duplicate request when one runs longer than the model's observed p95 latency",
+    )
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="Submit reviews through the provider Batch API (discounted, results within 24h)",
+    )
+    parser.add_argument(
+        "--batch-backend",
+        choices=["api", "local"],
+        default="api",
+        help="Batch backend: provider API, or a local file-based stand-in server (default: api)",
+    )
+    parser.add_argument(
+        "--batch-dir",
+        type=Path,
+        help="Directory shared with the local batch server (default: {output_dir}/batches)",
+    )
+    parser.add_argument(
+        "--batch-poll-interval",
+        type=float,
+        help="Seconds between batch status polls (default: 30, local: 1)",
+    )
 
     args = parser.parse_args()
 
-    # Determine cases directory
+    try:
+        provider_mode, _ = parse_provider_spec(args.provider)
+    except ValueError as e:
+        parser.error(str(e))
+    if provider_mode in ("replay", "simulate") and args.batch:
+        parser.error(f"--batch cannot be combined with --provider {provider_mode}")
+    if args.queue is not None and args.batch:
+        parser.error("--batch cannot be combined with --queue")
+    try:
+        frameworks = parse_frameworks(args.framework)
+    except ValueError as e:
+        parser.error(str(e))
+    if args.cases and len(frameworks) > 1:
+        parser.error("--cases cannot be combined with multiple frameworks")
+    try:
+        shard = parse_shard(args.shard) if args.shard else None
+    except ValueError as e:
+        parser.error(str(e))
+
+    # Determine cases directories
     if args.cases:
-        cases_dir = args.cases
+        cases_dirs = {frameworks[0]: args.cases}
     else:
-        cases_dir = get_cases_dir(args.framework)
+        cases_dirs = {framework: get_cases_dir(framework) for framework in frameworks}
 
     # 出力ディレクトリ設定
-    if args.output_dir:
+    if args.resume:
+        if not args.resume.exists():
+            print(f"Error: Run directory not found: {args.resume}", file=sys.stderr)
+            sys.exit(1)
+        output_dir = args.resume
+    elif args.output_dir:
         output_dir = args.output_dir
     else:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         output_dir = RESULTS_DIR / f"{timestamp}_run"
 
     # ケース探索
-    if not cases_dir.exists():
-        print(f"Error: Cases directory not found: {cases_dir}", file=sys.stderr)
-        sys.exit(1)
-
-    case_dirs = discover_cases(cases_dir)
-    print(f"Found {len(case_dirs)} cases in {cases_dir} (framework: {args.framework})")
+    cases_by_framework: dict[str, list[Path]] = {}
+    for framework, cases_dir in cases_dirs.items():
+        if not cases_dir.exists():
+            print(f"Error: Cases directory not found: {cases_dir}", file=sys.stderr)
+            sys.exit(1)
+        cases_by_framework[framework] = discover_cases(cases_dir)
+        print(f"Found {len(cases_by_framework[framework])} cases in {cases_dir} (framework: {framework})")
+    total_cases = sum(len(case_dirs) for case_dirs in cases_by_framework.values())
 
     if args.dry_run:
         print("\nCases to run:")
-        for case_dir in case_dirs:
-            print(f"  - {case_dir.parent.name}/{case_dir.name}")
-        print(f"\nTotal: {len(case_dirs)} cases")
+        for case_dirs in cases_by_framework.values():
+            for case_dir in case_dirs:
+                print(f"  - {case_dir.parent.name}/{case_dir.name}")
+        print(f"\nTotal: {total_cases} cases")
         return
 
     # 出力ディレクトリ作成
     output_dir.mkdir(parents=True, exist_ok=True)
     print(f"Output directory: {output_dir}")
+    run_id = uuid.uuid4().hex
+    run_started = datetime.now().isoformat()
+    write_run_status(output_dir, "running", run_id, run_started)
 
     # モデル選択
     if args.model == "all":
@@ -1080,22 +2312,111 @@ def main() -> None:
     else:
         models = [args.model]
 
-    # 実行
-    all_summaries = []
+    # プロバイダ・キャッシュ・リトライ・同時実行数の設定（ワーカーと共通）
+    execution_config = {
+        "provider": args.provider,
+        "replay_latency": args.replay_latency,
+        "simulate_seed": args.simulate_seed,
+        "simulate_time_scale": args.simulate_time_scale,
+        "no_cache": args.no_cache,
+        "refresh_cache": args.refresh_cache,
+        "max_attempts": args.max_attempts,
+        "timeout": args.timeout,
+        "deadline": args.deadline,
+        "hedge": args.hedge,
+        "adaptive_concurrency": args.adaptive_concurrency,
+    }
+    try:
+        replay, simulator, cache = configure_execution(execution_config, args.concurrency)
+    except FileNotFoundError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    # ワークキュー（ワーカープロセスに実行を分散）
+    work_queue = None
+    workers: list[subprocess.Popen] = []
+    if args.queue is not None:
+        queue_path = Path(args.queue) if args.queue else output_dir / "queue.db"
+        work_queue = WorkQueue(queue_path, lease_seconds=args.lease_timeout)
+        work_queue.set_config({
+            **execution_config,
+            "verbose": args.verbose,
+            "record": provider_mode == "record",
+            "lease_seconds": args.lease_timeout,
+        })
+        print(f"Work queue: {queue_path}")
+        workers = spawn_workers(queue_path, args.workers, args.concurrency, output_dir / "workers")
+        if not workers:
+            print(f"Waiting for workers: python scripts/runner.py worker --queue {queue_path}")
+
+    # バッチ実行設定
+    batch_dir = args.batch_dir or output_dir / "batches"
+    batch_poll_interval = args.batch_poll_interval
+    if batch_poll_interval is None:
+        batch_poll_interval = 1.0 if args.batch_backend == "local" else 30.0
+    if args.batch and args.batch_backend == "local":
+        LocalBatchServer(batch_dir).start_in_background()
+        print(f"Local batch server: {batch_dir}")
+
+    # 実行（モデルは並列、同時実行数はプロバイダ単位）
+    batch_backends = {}
     for model in models:
-        summary = run_benchmark(model, case_dirs, output_dir, mode=args.mode, verbose=args.verbose, framework=args.framework)
-        all_summaries.append(summary)
+        batch_backends[model] = get_batch_backend(model, args.batch_backend, batch_dir) if args.batch else None
+        if args.batch and batch_backends[model] is None:
+            print(f"Note: {model} has no batch support; falling back to interactive requests")
+    providers = provider_groups(models)
+    if len(models) > 1 or len(frameworks) > 1:
+        print(
+            f"Running {len(models)} models x {len(frameworks)} frameworks "
+            f"across {len(providers)} providers in parallel"
+        )
+    all_summaries = run_async(
+        run_models_async(
+            models, cases_by_framework, output_dir,
+            mode=args.mode, verbose=args.verbose,
+            concurrency=args.concurrency, cache=cache, resume=args.resume is not None,
+            batch_backends=batch_backends, batch_poll_interval=batch_poll_interval,
+            replay=replay, record=provider_mode == "record", shard=shard, work_queue=work_queue,
+        ),
+        # バッチのポーリングはモデルごとにスレッドを 1 つ占有する
+        max_workers=args.concurrency * len(providers) + (len(models) if args.batch else 0),
+    )
+    if work_queue is not None:
+        work_queue.close()
+        for worker in workers:
+            worker.wait()
 
     # 全体サマリー保存
     summary_file = output_dir / "summary.json"
     summary_data = {
         "timestamp": datetime.now().isoformat(),
-        "framework": args.framework,
+        "run_id": run_id,
+        "framework": args.framework if len(frameworks) > 1 else frameworks[0],
+        "frameworks": frameworks,
         "mode": args.mode,
-        "total_cases": len(case_dirs),
+        "concurrency": args.concurrency,
+        "adaptive_concurrency": concurrency_stats() if args.adaptive_concurrency else None,
+        "retry_policy": {
+            "max_attempts": args.max_attempts,
+            "timeout": args.timeout or None,
+            "deadline": args.deadline or None,
+            "hedge": args.hedge,
+        },
+        "batch": args.batch_backend if args.batch else None,
+        "total_cases": total_cases,
+        "cases_by_framework": {framework: len(case_dirs) for framework, case_dirs in cases_by_framework.items()},
+        "shard": args.shard,
+        "work_queue": {"path": str(work_queue.path), "local_workers": len(workers)} if work_queue else None,
         "models": all_summaries,
+        "rate_limits": rate_limiter_stats(),
+        "client_pool": get_client_registry().stats(),
+        "response_cache": cache.stats() if cache else None,
+        "provider": args.provider,
+        "replay": replay.stats() if replay else None,
+        "simulator": simulator.stats() if simulator else None,
     }
     summary_file.write_text(json.dumps(summary_data, indent=2, ensure_ascii=False))
+    write_run_status(output_dir, "complete", run_id, run_started)
 
     print(f"\n{'='*60}")
     print("Benchmark completed!")
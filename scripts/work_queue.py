@@ -0,0 +1,247 @@
+"""
+SQLite-backed work queue for distributing reviews across worker processes.
+
+A coordinator (``runner.py --queue PATH``) enqueues one task per
+(model, framework, case_dir, context_mode) run and waits for results. Any
+number of ``runner.py worker --queue PATH`` processes, on the same machine or
+on hosts sharing the volume, lease tasks, run them and write the result back.
+
+Leases expire after ``lease_seconds`` unless renewed, so the tasks of a
+crashed worker become available again. Workers renew their leases while a
+review is in flight. A task whose lease has expired ``max_leases`` times is
+completed with a failed result instead of being retried forever.
+"""
+
+import json
+import sqlite3
+import time
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    key TEXT NOT NULL UNIQUE,
+    model TEXT NOT NULL,
+    framework TEXT NOT NULL,
+    case_dir TEXT NOT NULL,
+    context_mode TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',  -- pending | leased | done
+    leases INTEGER NOT NULL DEFAULT 0,
+    worker TEXT,
+    lease_expires REAL,
+    result TEXT,
+    enqueued_at REAL NOT NULL,
+    finished_at REAL
+);
+CREATE INDEX IF NOT EXISTS tasks_status ON tasks (status, lease_expires);
+CREATE TABLE IF NOT EXISTS meta (
+    name TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+@dataclass(frozen=True)
+class Task:
+    """One review run."""
+    key: str
+    model: str
+    framework: str
+    case_dir: str
+    context_mode: str
+    id: int | None = None
+    leases: int = 0
+
+    @staticmethod
+    def make_key(model: str, framework: str, case_dir: str, context_mode: str) -> str:
+        return f"{model}|{framework}|{case_dir}|{context_mode}"
+
+
+class WorkQueue:
+    """Task queue in a SQLite file shared by a coordinator and workers.
+
+    Every operation opens its own connection, so one instance can be used from
+    several threads and processes.
+    """
+
+    def __init__(self, path: Path, lease_seconds: float = 60.0, max_leases: int = 3):
+        """Initialize queue, creating the database if needed.
+
+        Args:
+            path: SQLite file
+            lease_seconds: Seconds a lease lasts without renewal
+            max_leases: Leases per task before it is failed
+        """
+        self.path = Path(path)
+        self.lease_seconds = lease_seconds
+        self.max_leases = max_leases
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connection() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        # Autocommit: each statement is its own transaction unless BEGIN is issued
+        conn = sqlite3.connect(self.path, timeout=60.0, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    @contextmanager
+    def _connection(self) -> Iterator[sqlite3.Connection]:
+        conn = self._connect()
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    # Run configuration shared with workers
+
+    def set_config(self, config: dict[str, Any]) -> None:
+        """Store the run configuration workers use to set up providers."""
+        with self._connection() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO meta (name, value) VALUES ('config', ?)",
+                (json.dumps(config),),
+            )
+            conn.execute("DELETE FROM meta WHERE name = 'closed'")
+
+    def get_config(self) -> dict[str, Any] | None:
+        """Run configuration, or None if no coordinator has started yet."""
+        with self._connection() as conn:
+            row = conn.execute("SELECT value FROM meta WHERE name = 'config'").fetchone()
+        return json.loads(row["value"]) if row else None
+
+    def close(self) -> None:
+        """Tell workers no more tasks will be enqueued."""
+        with self._connection() as conn:
+            conn.execute("INSERT OR REPLACE INTO meta (name, value) VALUES ('closed', '1')")
+
+    def is_closed(self) -> bool:
+        with self._connection() as conn:
+            return conn.execute("SELECT 1 FROM meta WHERE name = 'closed'").fetchone() is not None
+
+    # Coordinator side
+
+    def enqueue(self, tasks: Iterable[Task]) -> int:
+        """Add tasks; tasks already in the queue (same key) are left as they are.
+
+        Returns:
+            Number of tasks added
+        """
+        now = time.time()
+        with self._connection() as conn:
+            before = conn.total_changes
+            conn.executemany(
+                "INSERT OR IGNORE INTO tasks (key, model, framework, case_dir, context_mode, enqueued_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                [(t.key, t.model, t.framework, t.case_dir, t.context_mode, now) for t in tasks],
+            )
+            return conn.total_changes - before
+
+    def results(self, keys: Iterable[str]) -> dict[str, dict[str, Any]]:
+        """Results of finished tasks among ``keys``."""
+        keys = list(keys)
+        found: dict[str, dict[str, Any]] = {}
+        with self._connection() as conn:
+            # Stay under SQLite's bound-parameter limit
+            for start in range(0, len(keys), 500):
+                chunk = keys[start:start + 500]
+                rows = conn.execute(
+                    f"SELECT key, result FROM tasks WHERE status = 'done' AND key IN ({','.join('?' * len(chunk))})",
+                    chunk,
+                ).fetchall()
+                found.update((row["key"], json.loads(row["result"])) for row in rows)
+        return found
+
+    def counts(self) -> dict[str, int]:
+        """Number of tasks per status."""
+        with self._connection() as conn:
+            rows = conn.execute("SELECT status, COUNT(*) AS n FROM tasks GROUP BY status").fetchall()
+        counts = {"pending": 0, "leased": 0, "done": 0}
+        counts.update((row["status"], row["n"]) for row in rows)
+        return counts
+
+    # Worker side
+
+    def lease(self, worker: str) -> Task | None:
+        """Lease the oldest available task (pending, or leased with an expired lease).
+
+        Returns:
+            The leased task, or None if nothing is available
+        """
+        now = time.time()
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            while True:
+                row = conn.execute(
+                    "SELECT * FROM tasks WHERE status = 'pending' "
+                    "OR (status = 'leased' AND lease_expires < ?) ORDER BY id LIMIT 1",
+                    (now,),
+                ).fetchone()
+                if row is None:
+                    conn.execute("COMMIT")
+                    return None
+                if row["leases"] >= self.max_leases:
+                    # Every lease so far expired: the task keeps killing or hanging workers
+                    conn.execute(
+                        "UPDATE tasks SET status = 'done', result = ?, finished_at = ?, worker = NULL WHERE id = ?",
+                        (json.dumps(self._abandoned_result(row)), now, row["id"]),
+                    )
+                    continue
+                conn.execute(
+                    "UPDATE tasks SET status = 'leased', leases = leases + 1, worker = ?, lease_expires = ? WHERE id = ?",
+                    (worker, now + self.lease_seconds, row["id"]),
+                )
+                conn.execute("COMMIT")
+                return Task(
+                    key=row["key"], model=row["model"], framework=row["framework"],
+                    case_dir=row["case_dir"], context_mode=row["context_mode"],
+                    id=row["id"], leases=row["leases"] + 1,
+                )
+        except BaseException:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+
+    def renew(self, task_ids: Iterable[int], worker: str) -> None:
+        """Extend the leases a worker still holds."""
+        expires = time.time() + self.lease_seconds
+        with self._connection() as conn:
+            conn.executemany(
+                "UPDATE tasks SET lease_expires = ? WHERE id = ? AND status = 'leased' AND worker = ?",
+                [(expires, task_id, worker) for task_id in task_ids],
+            )
+
+    def complete(self, task: Task, worker: str, result: dict[str, Any]) -> bool:
+        """Store a task's result.
+
+        A worker whose lease expired may still finish after the task was
+        re-leased; the first result written wins.
+
+        Returns:
+            True if this result was stored
+        """
+        with self._connection() as conn:
+            cursor = conn.execute(
+                "UPDATE tasks SET status = 'done', result = ?, finished_at = ?, worker = ? "
+                "WHERE id = ? AND status != 'done'",
+                (json.dumps(result, ensure_ascii=False), time.time(), worker, task.id),
+            )
+            return cursor.rowcount == 1
+
+    def _abandoned_result(self, row: sqlite3.Row) -> dict[str, Any]:
+        case_dir = Path(row["case_dir"])
+        return {
+            "case_id": case_dir.name,
+            "category": case_dir.parent.name,
+            "context_mode": row["context_mode"],
+            "success": False,
+            "error": f"Lease expired {row['leases']} times (worker crashed or hung)",
+        }
@@ -0,0 +1,6 @@
+"""Shared pytest setup: the scripts run with scripts/ on sys.path, so the tests do too."""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
@@ -0,0 +1,79 @@
+"""Tests for case lookups in the in-memory corpus (case_corpus.py)."""
+
+import json
+from pathlib import Path
+
+import pytest
+from case_corpus import CaseCorpus, DuplicateCaseError
+
+CASES_ROOT = Path(__file__).parent.parent / "cases"
+
+
+@pytest.fixture(scope="module")
+def corpus():
+    return CaseCorpus(CASES_ROOT)
+
+
+@pytest.fixture(scope="module")
+def shared_case_ids(corpus):
+    frameworks: dict[str, set[str]] = {}
+    for record in corpus:
+        frameworks.setdefault(record.case_id, set()).add(record.framework)
+    return {case_id: names for case_id, names in frameworks.items() if len(names) > 1}
+
+
+def write_case(case_dir, case_id):
+    case_dir.mkdir(parents=True)
+    (case_dir / "meta.json").write_text(json.dumps({"case_id": case_id}))
+    (case_dir / "plan.md").write_text(f"plan for {case_dir.name}")
+
+
+def test_corpus_shares_case_ids_across_frameworks(shared_case_ids):
+    assert len(shared_case_ids) == 98
+
+
+def test_find_without_framework_raises_for_shared_case_ids(corpus, shared_case_ids):
+    for case_id, frameworks in shared_case_ids.items():
+        with pytest.raises(DuplicateCaseError) as excinfo:
+            corpus.find(case_id)
+        assert excinfo.value.case_id == case_id
+        assert len(excinfo.value.case_dirs) == len(frameworks)
+
+
+def test_find_with_framework_returns_that_frameworks_case(corpus, shared_case_ids):
+    for case_id, frameworks in shared_case_ids.items():
+        for framework in frameworks:
+            record = corpus.find(case_id, framework)
+            assert record.case_id == case_id
+            assert record.framework == framework
+            assert record.case_dir.parent.name == framework
+
+
+def test_find_unknown_case_id_returns_none(corpus):
+    assert corpus.find("NO_SUCH_CASE", "rails") is None
+
+
+def test_duplicate_within_a_framework_is_reported(tmp_path):
+    write_case(tmp_path / "rails" / "auth" / "AUTH_001", "AUTH_001")
+    write_case(tmp_path / "rails" / "legacy" / "AUTH_001", "AUTH_001")
+    write_case(tmp_path / "rails" / "calc" / "CALC_001", "CALC_001")
+    corpus = CaseCorpus(tmp_path / "rails", "rails")
+
+    with pytest.raises(DuplicateCaseError):
+        corpus.find("AUTH_001", "rails")
+    assert corpus.find("CALC_001", "rails").plan == "plan for CALC_001"
+    assert list(corpus.duplicates()) == [("rails", "AUTH_001")]
+
+
+def test_refresh_reindexes_changed_case_id(tmp_path):
+    case_dir = tmp_path / "rails" / "AUTH_001"
+    write_case(case_dir, "AUTH_001")
+    corpus = CaseCorpus(tmp_path / "rails", "rails")
+    old_hash = corpus.find("AUTH_001").content_hash
+
+    (case_dir / "meta.json").write_text(json.dumps({"case_id": "AUTH_101"}))
+    record = corpus.refresh(case_dir)
+
+    assert corpus.find("AUTH_001") is None
+    assert corpus.find("AUTH_101") is record
+    assert record.content_hash != old_hash
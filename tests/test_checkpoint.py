@@ -0,0 +1,62 @@
+"""Tests for resuming runs from ``{model}.jsonl`` checkpoints (runner.load_checkpoint)."""
+
+import json
+
+from runner import load_checkpoint
+
+
+def write_lines(path, lines):
+    path.write_text("".join(line + "\n" for line in lines))
+
+
+def result(case_id, success, mode="explicit", **extra):
+    return json.dumps({"case_id": case_id, "context_mode": mode, "success": success, **extra})
+
+
+def test_truncated_last_line_is_ignored(tmp_path):
+    checkpoint = tmp_path / "claude-haiku.jsonl"
+    complete = result("AUTH_001", True)
+    truncated = result("AUTH_002", True)[:20]
+    checkpoint.write_text(complete + "\n" + truncated)
+
+    completed = load_checkpoint(checkpoint)
+
+    assert list(completed) == [("AUTH_001", "explicit")]
+
+
+def test_later_success_replaces_earlier_failure(tmp_path):
+    checkpoint = tmp_path / "claude-haiku.jsonl"
+    write_lines(checkpoint, [
+        result("AUTH_001", False, error="timeout"),
+        result("AUTH_001", True, attempt="retry"),
+    ])
+
+    completed = load_checkpoint(checkpoint)
+
+    assert completed[("AUTH_001", "explicit")]["attempt"] == "retry"
+
+
+def test_failures_are_not_completed(tmp_path):
+    checkpoint = tmp_path / "claude-haiku.jsonl"
+    write_lines(checkpoint, [
+        result("AUTH_001", True),
+        result("AUTH_002", False),
+        result("AUTH_001", True, mode="implicit"),
+    ])
+
+    completed = load_checkpoint(checkpoint)
+
+    assert set(completed) == {("AUTH_001", "explicit"), ("AUTH_001", "implicit")}
+
+
+def test_falls_back_to_legacy_json(tmp_path):
+    legacy = tmp_path / "claude-haiku.json"
+    legacy.write_text(json.dumps([json.loads(result("AUTH_001", True)), json.loads(result("AUTH_002", False))]))
+
+    completed = load_checkpoint(tmp_path / "claude-haiku.jsonl")
+
+    assert list(completed) == [("AUTH_001", "explicit")]
+
+
+def test_missing_checkpoint_is_empty(tmp_path):
+    assert load_checkpoint(tmp_path / "claude-haiku.jsonl") == {}
@@ -0,0 +1,113 @@
+"""Tests for adaptive (AIMD) concurrency limits (providers/concurrency.py)."""
+
+from types import SimpleNamespace
+
+import pytest
+from providers import concurrency
+from providers.concurrency import AIMDLimiter
+
+
+class Throttled(Exception):
+    status_code = 429
+
+
+class Clock:
+    """Fake monotonic clock: every reading advances by ``step`` seconds."""
+
+    def __init__(self, step=1.0):
+        self.now = 100.0
+        self.step = step
+
+    def __call__(self):
+        self.now += self.step
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(concurrency, "time", SimpleNamespace(monotonic=clock))
+    return clock
+
+
+def succeed(limiter, times):
+    for _ in range(times):
+        with limiter.slot():
+            pass
+
+
+def throttle(limiter):
+    with pytest.raises(Throttled), limiter.slot():
+        raise Throttled()
+
+
+def test_throttling_halves_the_limit():
+    limiter = AIMDLimiter("anthropic", initial=8)
+
+    throttle(limiter)
+
+    assert limiter.limit == 4
+    assert limiter.stats.decreases == 1
+
+
+def test_burst_of_throttles_decreases_once():
+    limiter = AIMDLimiter("anthropic", initial=8)
+
+    for _ in range(5):
+        throttle(limiter)
+
+    # One cohort of 429s within the cooldown only halves the limit once
+    assert limiter.limit == 4
+    assert limiter.stats.throttle_events == 5
+    assert limiter.stats.decreases == 1
+
+
+def test_limit_never_drops_below_minimum():
+    limiter = AIMDLimiter("anthropic", initial=2, min_limit=2)
+
+    throttle(limiter)
+
+    assert limiter.limit == 2
+
+
+def test_other_errors_do_not_back_off():
+    limiter = AIMDLimiter("anthropic", initial=8)
+
+    with pytest.raises(ValueError), limiter.slot():
+        raise ValueError("bad request")
+
+    assert limiter.limit == 8
+    assert limiter.in_flight == 0
+
+
+def test_backs_off_then_recovers(clock):
+    limiter = AIMDLimiter("anthropic", initial=8)
+    throttle(limiter)
+    assert limiter.limit == 4
+
+    # Each window of successes at steady latency adds one slot
+    for expected in (5, 6, 7, 8):
+        succeed(limiter, limiter.limit)
+        assert limiter.limit == expected
+
+    assert limiter.stats.increases == 4
+    assert limiter.stats.min_limit_reached == 4
+
+
+def test_growing_latency_stops_increases(clock):
+    limiter = AIMDLimiter("anthropic", initial=4, latency_tolerance=1.5)
+    succeed(limiter, 4)
+    assert limiter.limit == 5
+
+    clock.step = 2.0  # p95 doubles, beyond the 1.5x tolerance
+    succeed(limiter, 5)
+
+    assert limiter.limit == 5
+
+
+def test_limit_stops_at_maximum(clock):
+    limiter = AIMDLimiter("anthropic", initial=4, max_limit=5)
+
+    succeed(limiter, 20)
+
+    assert limiter.limit == 5
@@ -0,0 +1,107 @@
+"""Tests for bootstrap and Wilson confidence intervals (metrics/confidence.py)."""
+
+import math
+import random
+
+import numpy as np
+import pytest
+from metrics import EvaluationTable, bootstrap_intervals, wilson_interval
+
+
+def evaluations(seed, models=("claude-haiku", "gpt-4o"), cases=120, bug_rate=0.7):
+    """Every model reviews the same cases; detection rates differ per model."""
+    rng = random.Random(seed)
+    rows = []
+    for i in range(cases):
+        expected = rng.random() < bug_rate
+        for m, model in enumerate(models):
+            detected = rng.random() < 0.5 + 0.2 * m
+            rows.append({
+                "model": model,
+                "framework": "rails",
+                "case_id": f"CASE_{i:03d}",
+                "expected_detection": expected,
+                "detected": detected,
+                "detection_score": 1.0 if expected and detected else 0.0,
+                "critical_count": int(not expected and rng.random() < 0.2),
+            })
+    return rows
+
+
+def test_wilson_matches_known_interval():
+    low, high = wilson_interval(np.array(8), np.array(10))
+
+    assert low == pytest.approx(0.4902, abs=1e-4)
+    assert high == pytest.approx(0.9433, abs=1e-4)
+
+
+def test_wilson_stays_within_unit_interval_at_the_extremes():
+    intervals = wilson_interval(np.array([0, 10]), np.array([10, 10]))
+
+    assert intervals[0, 0] == pytest.approx(0.0)
+    assert intervals[1, 1] == pytest.approx(1.0)
+    assert ((intervals >= 0) & (intervals <= 1)).all()
+
+
+def test_wilson_is_nan_without_cases():
+    assert np.isnan(wilson_interval(np.array(0), np.array(0))).all()
+
+
+def test_bootstrap_is_deterministic_for_a_seed():
+    table = EvaluationTable.from_evaluations(evaluations(0))
+
+    first = bootstrap_intervals(table, resamples=500, seed=7)
+    second = bootstrap_intervals(table, resamples=500, seed=7)
+    other = bootstrap_intervals(table, resamples=500, seed=8)
+
+    for metric in first.bootstrap:
+        np.testing.assert_array_equal(first.bootstrap[metric], second.bootstrap[metric])
+        np.testing.assert_array_equal(first.differences[metric], second.differences[metric])
+    assert not np.array_equal(first.bootstrap["recall"], other.bootstrap["recall"])
+
+
+def test_bootstrap_intervals_contain_the_estimates():
+    table = EvaluationTable.from_evaluations(evaluations(1))
+
+    intervals = bootstrap_intervals(table, resamples=1000, seed=0)
+
+    for model in intervals.models:
+        for metric, values in intervals.for_model(model).items():
+            low, high = values["bootstrap"]
+            assert low <= values["estimate"] <= high, (model, metric)
+
+
+def test_difference_with_itself_is_zero():
+    table = EvaluationTable.from_evaluations(evaluations(2))
+
+    intervals = bootstrap_intervals(table, resamples=200, seed=0)
+
+    assert intervals.difference("gpt-4o", "gpt-4o")["recall"] == {"estimate": 0.0, "bootstrap": [0.0, 0.0]}
+
+
+def test_metrics_without_cases_are_nan():
+    # No bug cases: recall, weighted recall and F1 are undefined
+    table = EvaluationTable.from_evaluations(evaluations(3, bug_rate=0.0))
+
+    intervals = bootstrap_intervals(table, resamples=200, seed=0)
+
+    recall = intervals.for_model("claude-haiku")["recall"]
+    assert recall == {"estimate": None, "bootstrap": None, "wilson": None}
+    assert math.isnan(intervals.estimates["f1_score"][0])
+    assert intervals.for_model("claude-haiku")["false_positive_rate"]["bootstrap"] is not None
+
+
+def test_no_resamples_give_nan_bootstrap_intervals():
+    table = EvaluationTable.from_evaluations(evaluations(4))
+
+    intervals = bootstrap_intervals(table, resamples=0)
+
+    assert np.isnan(intervals.bootstrap["recall"]).all()
+    assert not np.isnan(intervals.wilson["recall"]).any()
+
+
+def test_empty_table_has_no_intervals():
+    intervals = bootstrap_intervals(EvaluationTable.from_evaluations([]), resamples=100)
+
+    assert intervals.models == ()
+    assert intervals.bootstrap["recall"].shape == (0, 2)
@@ -0,0 +1,129 @@
+"""Tests for ``--budget`` spend accounting (evaluator.JudgeBudget)."""
+
+import threading
+from concurrent.futures import Future
+from types import SimpleNamespace
+
+import pytest
+from evaluator import JudgeBudget
+
+
+def reserve_in_thread(budget, method, estimate):
+    """Start a reservation that may block; returns (thread, result holder)."""
+    result = {}
+    thread = threading.Thread(target=lambda: result.setdefault("amount", budget.reserve(method, estimate)))
+    thread.start()
+    return thread, result
+
+
+def test_unlimited_budget_always_reserves():
+    budget = JudgeBudget(None)
+
+    for _ in range(100):
+        assert budget.reserve("semantic", 1.0) == 1.0
+
+    assert not budget.exhausted
+
+
+def test_settle_replaces_reservation_with_actual_cost():
+    budget = JudgeBudget(1.0)
+    reserved = budget.reserve("semantic", 0.01)
+
+    budget.settle("semantic", reserved, 0.03)
+
+    assert budget.spent == pytest.approx(0.03)
+    assert budget.reserved == pytest.approx(0.0)
+    assert budget.in_flight == 0
+    # Later reservations use the most expensive call seen for the method
+    assert budget.reserve("semantic", 0.01) == pytest.approx(0.03)
+    assert budget.reserve("ensemble", 0.05) == pytest.approx(0.05)
+
+
+def test_budget_is_exhausted_when_nothing_in_flight_can_free_room():
+    budget = JudgeBudget(0.05)
+    budget.settle("semantic", budget.reserve("semantic", 0.03), 0.03)
+
+    assert budget.reserve("semantic", 0.03) is None
+    assert budget.exhausted
+    assert budget.skipped == 1
+    # Once exhausted, no further reservations are granted
+    assert budget.reserve("semantic", 0.001) is None
+    assert budget.skipped == 2
+
+
+def test_reservation_waits_for_in_flight_call_to_settle():
+    budget = JudgeBudget(0.05)
+    first = budget.reserve("semantic", 0.03)
+
+    thread, result = reserve_in_thread(budget, "semantic", 0.03)
+    thread.join(0.1)
+    assert thread.is_alive()
+
+    budget.settle("semantic", first, 0.01)
+    thread.join(1.0)
+
+    assert result["amount"] == pytest.approx(0.01)
+    assert not budget.exhausted
+
+
+def late_judge():
+    """Future of an ensemble judge that timed out and is still running."""
+    future = Future()
+    future.set_running_or_notify_cancel()
+    return future
+
+
+def test_late_judge_holds_reservation_until_it_finishes():
+    budget = JudgeBudget(1.0)
+    reserved = budget.reserve("ensemble", 0.05)
+    judge = late_judge()
+
+    budget.settle("ensemble", reserved, 0.02, late=[judge])
+
+    assert budget.spent == pytest.approx(0.02)
+    assert budget.reserved == pytest.approx(0.05)
+    assert budget.in_flight == 1
+
+    judge.set_result(SimpleNamespace(judge_cost=0.01))
+
+    assert budget.spent == pytest.approx(0.03)
+    assert budget.late_cost == pytest.approx(0.01)
+    assert budget.reserved == pytest.approx(0.0)
+    assert budget.in_flight == 0
+    # The late judge's cost counts toward the method's largest call
+    assert budget.reserve("ensemble", 0.01) == pytest.approx(0.03)
+
+
+def test_late_judge_that_fails_costs_nothing():
+    budget = JudgeBudget(1.0)
+    reserved = budget.reserve("ensemble", 0.05)
+    failed, finished = late_judge(), late_judge()
+
+    budget.settle("ensemble", reserved, 0.02, late=[failed, finished])
+    failed.set_exception(TimeoutError("judge gave up"))
+    assert budget.in_flight == 1
+    finished.set_result(SimpleNamespace(judge_cost=0.01))
+
+    assert budget.spent == pytest.approx(0.03)
+    assert budget.late_cost == pytest.approx(0.01)
+    assert budget.in_flight == 0
+
+
+def test_late_judges_cannot_push_spend_past_the_limit():
+    budget = JudgeBudget(0.05)
+    reserved = budget.reserve("ensemble", 0.03)
+    judge = late_judge()
+    budget.settle("ensemble", reserved, 0.02, late=[judge])
+
+    # Waits while the late judge still holds the reservation
+    thread, result = reserve_in_thread(budget, "ensemble", 0.03)
+    thread.join(0.1)
+    assert thread.is_alive()
+
+    judge.set_result(SimpleNamespace(judge_cost=0.01))
+    thread.join(1.0)
+
+    assert result["amount"] is None
+    assert budget.exhausted
+    assert budget.spent == pytest.approx(0.03)
+    assert budget.spent <= budget.limit
@@ -0,0 +1,338 @@
+"""Parity of the columnar metrics (metrics/table.py, evaluator.model_metrics) with row-wise sums."""
+
+import random
+from dataclasses import asdict, fields
+from typing import Any
+
+import numpy as np
+import pytest
+from evaluator import (
+    EvaluationResult,
+    EvaluationTable,
+    ModelMetrics,
+    calculate_metrics,
+    calculate_metrics_by_model,
+)
+from metrics import group_count, group_sum
+
+MODELS = ("claude-haiku", "gpt-4o", "gemini-3-flash")
+CATEGORIES = ("auth", "calculation", "concurrency", "data_integrity", "false_positive")
+# "expert" is outside the easy/medium/hard breakdown and must be left out of it
+DIFFICULTIES = ("easy", "medium", "hard", "expert")
+SEVERITY_SCORES = {"critical": 1.0, "major": 0.5, "minor": 0.2, None: 0.0}
+
+
+def synthetic_evaluations(n: int, seed: int) -> list[EvaluationResult]:
+    """``n`` evaluations spread over MODELS with every field varied."""
+    rng = random.Random(seed)
+    evaluations = []
+    for i in range(n):
+        expected = rng.random() < 0.7
+        detected = rng.random() < 0.6
+        severity = rng.choice(["critical", "major", "minor", None]) if expected and detected else None
+        semantic = rng.random() < 0.5
+        counts = [rng.randint(0, 3) for _ in range(3)]
+        evaluations.append(EvaluationResult(
+            case_id=f"CASE_{i // len(MODELS):03d}",
+            category=rng.choice(CATEGORIES),
+            difficulty=rng.choice(DIFFICULTIES),
+            model=MODELS[i % len(MODELS)],
+            expected_detection=expected,
+            detected=detected,
+            detection_score=SEVERITY_SCORES[severity],
+            highest_severity=severity,
+            accuracy=rng.randint(0, 100),
+            noise_count=rng.randint(0, 4),
+            correct_location=rng.random() < 0.5,
+            reasoning="",
+            review_has_issues=detected,
+            review_issue_count=sum(counts),
+            critical_count=counts[0],
+            major_count=counts[1],
+            minor_count=counts[2],
+            evaluation_mode="semantic" if semantic else "severity",
+            semantic_score=rng.randint(1, 5) if semantic and rng.random() < 0.9 else None,
+            essential_finding_captured=rng.random() < 0.5 if semantic else None,
+            severity_aligned=rng.random() < 0.5 if semantic else None,
+            context_mode=rng.choice(["explicit", "implicit"]),
+            framework="rails",
+            fix_score=rng.random(),
+            fix_correct=rng.random() < 0.4,
+        ))
+    return evaluations
+
+
+def rowwise_metrics(evaluations: list[EvaluationResult]) -> ModelMetrics:
+    """The row-by-row calculate_metrics that EvaluationTable replaced, kept as the reference."""
+    if not evaluations:
+        return ModelMetrics(
+            model="",
+            total_cases=0,
+            bug_cases=0,
+            true_positives=0,
+            false_negatives=0,
+            clean_cases=0,
+            true_negatives=0,
+            false_positives=0,
+            recall=0.0,
+            weighted_recall=0.0,
+            precision=0.0,
+            false_positive_rate=0.0,
+            f1_score=0.0,
+            average_accuracy=0.0,
+            average_detection_score=0.0,
+            total_noise=0,
+            critical_detections=0,
+            major_detections=0,
+            minor_detections=0,
+            by_category={},
+            by_difficulty={},
+        )
+
+    model = evaluations[0].model
+
+    # バグありケース（expected_detection=True）
+    bug_evals = [e for e in evaluations if e.expected_detection]
+    true_positives = sum(1 for e in bug_evals if e.detected)
+    false_negatives = len(bug_evals) - true_positives
+
+    # Severity別検出カウント（バグケースのみ）
+    critical_detections = sum(1 for e in bug_evals if e.highest_severity == "critical")
+    major_detections = sum(1 for e in bug_evals if e.highest_severity == "major")
+    minor_detections = sum(1 for e in bug_evals if e.highest_severity == "minor")
+
+    # 重み付きRecall計算
+    total_detection_score = sum(e.detection_score for e in bug_evals)
+    weighted_recall = total_detection_score / len(bug_evals) if bug_evals else 0.0
+
+    # バグなしケース（expected_detection=False）
+    clean_evals = [e for e in evaluations if not e.expected_detection]
+    true_negatives = sum(1 for e in clean_evals if e.detected)  # detected=True means correctly identified as clean
+    false_positives = len(clean_evals) - true_negatives
+
+    # 指標計算
+    recall = true_positives / len(bug_evals) if bug_evals else 0.0
+    precision = true_positives / (true_positives + false_positives) if (true_positives + false_positives) > 0 else 0.0
+    fpr = false_positives / len(clean_evals) if clean_evals else 0.0
+    f1 = 2 * precision * recall / (precision + recall) if (precision + recall) > 0 else 0.0
+
+    # 平均検出スコア（全ケース）
+    avg_detection_score = sum(e.detection_score for e in evaluations) / len(evaluations)
+
+    # カテゴリ別集計
+    by_category: dict[str, dict[str, Any]] = {}
+    categories = {e.category for e in evaluations}
+    for cat in categories:
+        cat_evals = [e for e in evaluations if e.category == cat]
+        if cat_evals:
+            by_category[cat] = {
+                "total": len(cat_evals),
+                "detected": sum(1 for e in cat_evals if e.detected),
+                "detection_score_avg": sum(e.detection_score for e in cat_evals) / len(cat_evals),
+                "accuracy_avg": sum(e.accuracy for e in cat_evals) / len(cat_evals),
+            }
+
+    # 難易度別集計
+    by_difficulty: dict[str, dict[str, Any]] = {}
+    for diff in ["easy", "medium", "hard"]:
+        diff_evals = [e for e in evaluations if e.difficulty == diff]
+        if diff_evals:
+            by_difficulty[diff] = {
+                "total": len(diff_evals),
+                "detected": sum(1 for e in diff_evals if e.detected),
+                "detection_score_avg": sum(e.detection_score for e in diff_evals) / len(diff_evals),
+                "accuracy_avg": sum(e.accuracy for e in diff_evals) / len(diff_evals),
+            }
+
+    # Semantic evaluation metrics
+    semantic_evals = [e for e in evaluations if e.evaluation_mode == "semantic" and e.semantic_score is not None]
+    semantic_cases = len(semantic_evals)
+    avg_semantic_score = (
+        sum(e.semantic_score for e in semantic_evals) / semantic_cases
+        if semantic_cases > 0 else 0.0
+    )
+    essential_finding_rate = (
+        sum(1 for e in semantic_evals if e.essential_finding_captured) / semantic_cases
+        if semantic_cases > 0 else 0.0
+    )
+    severity_alignment_rate = (
+        sum(1 for e in semantic_evals if e.severity_aligned) / semantic_cases
+        if semantic_cases > 0 else 0.0
+    )
+
+    # Fix evaluation metrics
+    detected_evals = [e for e in bug_evals if e.detected]
+    fix_accuracy = (
+        sum(1 for e in detected_evals if e.fix_correct) / len(detected_evals)
+        if detected_evals else 0.0
+    )
+    avg_fix_score = (
+        sum(e.fix_score for e in detected_evals) / len(detected_evals)
+        if detected_evals else 0.0
+    )
+
+    # Dual mode metrics (explicit vs implicit comparison)
+    explicit_evals = [e for e in evaluations if e.context_mode == "explicit"]
+    implicit_evals = [e for e in evaluations if e.context_mode == "implicit"]
+
+    explicit_recall: float | None = None
+    implicit_recall: float | None = None
+    inference_gap: float | None = None
+    by_context_mode: dict[str, dict[str, Any]] | None = None
+
+    # Only calculate if both modes have data
+    if explicit_evals and implicit_evals:
+        explicit_bug_evals = [e for e in explicit_evals if e.expected_detection]
+        implicit_bug_evals = [e for e in implicit_evals if e.expected_detection]
+
+        if explicit_bug_evals:
+            explicit_tp = sum(1 for e in explicit_bug_evals if e.detected)
+            explicit_recall = explicit_tp / len(explicit_bug_evals)
+
+        if implicit_bug_evals:
+            implicit_tp = sum(1 for e in implicit_bug_evals if e.detected)
+            implicit_recall = implicit_tp / len(implicit_bug_evals)
+
+        if explicit_recall is not None and implicit_recall is not None:
+            inference_gap = explicit_recall - implicit_recall
+
+        by_context_mode = {
+            "explicit": {
+                "total": len(explicit_evals),
+                "bug_cases": len(explicit_bug_evals),
+                "detected": sum(1 for e in explicit_bug_evals if e.detected) if explicit_bug_evals else 0,
+                "recall": explicit_recall,
+                "fix_accuracy": (
+                    sum(1 for e in explicit_bug_evals if e.detected and e.fix_correct) /
+                    sum(1 for e in explicit_bug_evals if e.detected)
+                    if sum(1 for e in explicit_bug_evals if e.detected) > 0 else 0.0
+                ),
+            },
+            "implicit": {
+                "total": len(implicit_evals),
+                "bug_cases": len(implicit_bug_evals),
+                "detected": sum(1 for e in implicit_bug_evals if e.detected) if implicit_bug_evals else 0,
+                "recall": implicit_recall,
+                "fix_accuracy": (
+                    sum(1 for e in implicit_bug_evals if e.detected and e.fix_correct) /
+                    sum(1 for e in implicit_bug_evals if e.detected)
+                    if sum(1 for e in implicit_bug_evals if e.detected) > 0 else 0.0
+                ),
+            },
+        }
+
+    return ModelMetrics(
+        model=model,
+        total_cases=len(evaluations),
+        bug_cases=len(bug_evals),
+        true_positives=true_positives,
+        false_negatives=false_negatives,
+        clean_cases=len(clean_evals),
+        true_negatives=true_negatives,
+        false_positives=false_positives,
+        recall=recall,
+        weighted_recall=weighted_recall,
+        precision=precision,
+        false_positive_rate=fpr,
+        f1_score=f1,
+        average_accuracy=sum(e.accuracy for e in evaluations) / len(evaluations),
+        average_detection_score=avg_detection_score,
+        total_noise=sum(e.noise_count for e in evaluations),
+        critical_detections=critical_detections,
+        major_detections=major_detections,
+        minor_detections=minor_detections,
+        by_category=by_category,
+        by_difficulty=by_difficulty,
+        # Semantic evaluation metrics
+        semantic_cases=semantic_cases,
+        avg_semantic_score=avg_semantic_score,
+        essential_finding_rate=essential_finding_rate,
+        severity_alignment_rate=severity_alignment_rate,
+        # Fix evaluation metrics
+        fix_accuracy=fix_accuracy,
+        avg_fix_score=avg_fix_score,
+        # Dual mode comparison metrics
+        explicit_recall=explicit_recall,
+        implicit_recall=implicit_recall,
+        inference_gap=inference_gap,
+        by_context_mode=by_context_mode,
+    )
+
+
+def assert_same(actual: Any, expected: Any, path: str = "") -> None:
+    """Deep equality with float tolerance."""
+    if isinstance(expected, dict):
+        assert isinstance(actual, dict) and set(actual) == set(expected), path
+        for key in expected:
+            assert_same(actual[key], expected[key], f"{path}.{key}")
+    elif isinstance(expected, float):
+        assert actual == pytest.approx(expected), path
+    else:
+        assert actual == expected, path
+
+
+def assert_metrics_equal(actual: ModelMetrics, expected: ModelMetrics) -> None:
+    assert_same(asdict(actual), asdict(expected))
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_single_model_metrics_match_rowwise(seed):
+    evaluations = [e for e in synthetic_evaluations(300, seed) if e.model == "gpt-4o"]
+
+    assert_metrics_equal(calculate_metrics(evaluations), rowwise_metrics(evaluations))
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_grouped_metrics_match_rowwise_per_model(seed):
+    evaluations = synthetic_evaluations(300, seed)
+
+    by_model = calculate_metrics_by_model(EvaluationTable.from_evaluations(evaluations))
+
+    assert set(by_model) == set(MODELS)
+    for model in MODELS:
+        rows = [e for e in evaluations if e.model == model]
+        assert_metrics_equal(by_model[model], rowwise_metrics(rows))
+
+
+def test_single_context_mode_has_no_dual_metrics():
+    evaluations = [e for e in synthetic_evaluations(300, 3) if e.model == "claude-haiku"]
+    for evaluation in evaluations:
+        evaluation.context_mode = "explicit"
+
+    metrics = calculate_metrics(evaluations)
+
+    assert_metrics_equal(metrics, rowwise_metrics(evaluations))
+    assert metrics.by_context_mode is None
+    assert metrics.inference_gap is None
+
+
+def test_empty_evaluations_give_zero_metrics():
+    metrics = calculate_metrics([])
+
+    assert metrics.total_cases == 0
+    assert metrics.recall == 0.0
+
+
+def test_table_round_trips_from_dicts():
+    evaluations = synthetic_evaluations(60, 4)
+
+    from_objects = EvaluationTable.from_evaluations(evaluations)
+    from_dicts = EvaluationTable.from_evaluations([asdict(e) for e in evaluations])
+
+    for field in fields(EvaluationTable):
+        assert np.array_equal(getattr(from_objects, field.name), getattr(from_dicts, field.name)), field.name
+
+
+def test_group_reductions_match_python_sums():
+    rng = random.Random(5)
+    groups = [rng.randrange(4) for _ in range(300)]
+    values = [rng.random() for _ in range(300)]
+    mask = [rng.random() < 0.5 for _ in range(300)]
+
+    counts = group_count(np.array(groups), 4, np.array(mask))
+    sums = group_sum(np.array(groups), 4, np.array(values), np.array(mask))
+
+    for group in range(4):
+        rows = [i for i in range(300) if groups[i] == group and mask[i]]
+        assert counts[group] == len(rows)
+        assert sums[group] == pytest.approx(sum(values[i] for i in rows))
@@ -0,0 +1,68 @@
+"""Tests for the token-bucket rate limiter (providers/rate_limit.py)."""
+
+import pytest
+from providers.rate_limit import RateLimiter, TokenBucket
+
+
+def test_token_bucket_takes_available_tokens_without_waiting():
+    bucket = TokenBucket(capacity=10, refill_per_second=1)
+
+    assert bucket.acquire(4) == 0.0
+    assert bucket.acquire(6) == 0.0
+
+
+def test_token_bucket_waits_for_refill():
+    bucket = TokenBucket(capacity=10, refill_per_second=100)
+    bucket.acquire(10)
+
+    waited = bucket.acquire(5)
+
+    assert waited == pytest.approx(0.05, abs=0.02)
+
+
+def test_token_bucket_clamps_requests_above_capacity():
+    bucket = TokenBucket(capacity=10, refill_per_second=1000)
+
+    # Larger than the bucket: served as a full bucket instead of blocking forever
+    assert bucket.acquire(50) == 0.0
+
+
+def test_reserve_settles_to_actual_tokens():
+    limiter = RateLimiter("test", tokens_per_minute=600)
+
+    with limiter.reserve(100) as reservation:
+        reservation.actual_tokens = 40
+
+    # 100 were charged up front and 60 refunded on exit
+    assert limiter.token_bucket._level == pytest.approx(560, abs=1)
+    assert limiter.stats.estimated_tokens == 100
+    assert limiter.stats.actual_tokens == 40
+
+
+def test_reserve_charges_usage_above_estimate():
+    limiter = RateLimiter("test", tokens_per_minute=600)
+
+    with limiter.reserve(100) as reservation:
+        reservation.actual_tokens = 250
+
+    assert limiter.token_bucket._level == pytest.approx(350, abs=1)
+
+
+def test_reserve_keeps_estimate_when_request_fails():
+    limiter = RateLimiter("test", tokens_per_minute=600)
+
+    with pytest.raises(RuntimeError), limiter.reserve(100):
+        raise RuntimeError("request failed")
+
+    assert limiter.token_bucket._level == pytest.approx(500, abs=1)
+    assert limiter.stats.actual_tokens == 100
+
+
+def test_unlimited_limiter_never_waits():
+    limiter = RateLimiter("test")
+
+    with limiter.reserve(10_000) as reservation:
+        reservation.actual_tokens = 20_000
+
+    assert reservation.wait_time == 0.0
+    assert limiter.stats.requests == 1
@@ -0,0 +1,126 @@
+"""Tests for the shared retry policy (providers/retry.py)."""
+
+import time
+from types import SimpleNamespace
+
+import pytest
+from providers import retry
+from providers.retry import (
+    AttemptTimeoutError,
+    RetryPolicy,
+    is_retryable,
+    retry_after_of,
+)
+
+
+class APIError(Exception):
+    """Stand-in for an SDK error carrying an HTTP status."""
+
+    def __init__(self, status_code, retry_after=None, headers=None):
+        super().__init__(f"status {status_code}")
+        self.status_code = status_code
+        if retry_after is not None:
+            self.retry_after = retry_after
+        if headers is not None:
+            self.response = SimpleNamespace(headers=headers)
+
+
+class Flaky:
+    """Callable that raises the given errors in turn, then returns "ok"."""
+
+    def __init__(self, *errors):
+        self.errors = list(errors)
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return "ok"
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Record backoff delays instead of sleeping."""
+    delays = []
+    monkeypatch.setattr(retry.time, "sleep", delays.append)
+    return delays
+
+
+def test_retries_transient_errors_until_success(sleeps):
+    fn = Flaky(APIError(503), APIError(429))
+
+    result, stats = RetryPolicy(max_attempts=3, base_delay=0.01).call(fn)
+
+    assert result == "ok"
+    assert stats.attempts == 3
+    assert len(stats.errors) == 2
+    assert len(sleeps) == 2
+
+
+def test_backoff_honours_retry_after(sleeps):
+    fn = Flaky(APIError(429, retry_after=7))
+
+    RetryPolicy(max_attempts=2, base_delay=0.01).call(fn)
+
+    assert sleeps == [7.0]
+
+
+def test_retry_after_header_is_read_from_response():
+    assert retry_after_of(APIError(429, headers={"retry-after": "2.5"})) == 2.5
+    assert retry_after_of(APIError(429, headers={"retry-after": "soon"})) is None
+    assert retry_after_of(APIError(429)) is None
+
+
+def test_jittered_backoff_stays_under_cap():
+    policy = RetryPolicy(base_delay=1.0, max_delay=3.0)
+
+    delays = [policy.backoff(retry_number) for retry_number in (1, 2, 3, 4, 5) for _ in range(50)]
+
+    assert all(0 <= delay <= 3.0 for delay in delays)
+
+
+def test_gives_up_after_max_attempts(sleeps):
+    fn = Flaky(*(APIError(503) for _ in range(5)))
+
+    with pytest.raises(APIError):
+        RetryPolicy(max_attempts=3, base_delay=0.01).call(fn)
+
+    assert fn.calls == 3
+
+
+def test_gives_up_when_backoff_would_pass_deadline(sleeps):
+    fn = Flaky(APIError(429, retry_after=10))
+
+    with pytest.raises(APIError):
+        RetryPolicy(max_attempts=5, deadline=1.0).call(fn)
+
+    assert fn.calls == 1
+    assert sleeps == []
+
+
+@pytest.mark.parametrize("error", [APIError(400), APIError(401), ValueError("bad prompt")])
+def test_non_retryable_errors_are_raised_immediately(sleeps, error):
+    fn = Flaky(error)
+
+    with pytest.raises(type(error)):
+        RetryPolicy(max_attempts=5, base_delay=0.01).call(fn)
+
+    assert fn.calls == 1
+    assert sleeps == []
+
+
+def test_is_retryable_classification():
+    assert is_retryable(APIError(529))
+    assert is_retryable(TimeoutError())
+    assert not is_retryable(APIError(404))
+    assert not is_retryable(KeyError("x"))
+
+
+def test_attempt_timeout_abandons_slow_attempt():
+    def slow():
+        time.sleep(0.5)
+        return "late"
+
+    with pytest.raises(AttemptTimeoutError):
+        RetryPolicy(max_attempts=1, attempt_timeout=0.05).call(slow)
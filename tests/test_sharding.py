@@ -0,0 +1,74 @@
+"""Tests for sharded runs: partitioning (runner.plan_runs) and merging (merge_runs.py)."""
+
+import pytest
+from merge_runs import merge_results
+from runner import discover_cases, get_cases_dir, parse_shard, plan_runs, shard_of
+
+
+@pytest.fixture(scope="module")
+def rails_cases():
+    return discover_cases(get_cases_dir("rails"))
+
+
+@pytest.mark.parametrize("count", [1, 2, 3, 4, 7])
+def test_shards_are_disjoint_and_cover_every_run(rails_cases, count):
+    all_runs = plan_runs(rails_cases, "dual", "rails")
+
+    shards = [plan_runs(rails_cases, "dual", "rails", shard=(i, count)) for i in range(1, count + 1)]
+
+    seen = [run for shard in shards for run in shard]
+    assert len(seen) == len(set(seen))
+    assert sorted(seen) == sorted(all_runs)
+
+
+def test_shards_keep_unsharded_order(rails_cases):
+    all_runs = plan_runs(rails_cases, "dual", "rails")
+
+    shard = plan_runs(rails_cases, "dual", "rails", shard=(2, 3))
+
+    assert shard == [run for run in all_runs if run in shard]
+
+
+def test_shard_of_is_stable_and_in_range():
+    owners = {shard_of("rails", f"CASE_{n:03d}", "explicit", 4) for n in range(200)}
+
+    assert owners == {1, 2, 3, 4}
+    assert shard_of("rails", "AUTH_001", "implicit", 4) == shard_of("rails", "AUTH_001", "implicit", 4)
+
+
+@pytest.mark.parametrize("value", ["0/4", "5/4", "2", "a/b", "1/0"])
+def test_parse_shard_rejects_invalid_values(value):
+    with pytest.raises(ValueError):
+        parse_shard(value)
+
+
+def result(case_id, mode="explicit"):
+    return {"case_id": case_id, "context_mode": mode, "success": True}
+
+
+def test_merge_results_restores_unsharded_order():
+    shard_1 = [result("AUTH_002"), result("AUTH_001", "implicit")]
+    shard_2 = [result("AUTH_001"), result("CALC_001")]
+
+    merged = merge_results("claude-haiku", [shard_1, shard_2])
+
+    assert [(r["case_id"], r["context_mode"]) for r in merged] == [
+        ("AUTH_001", "explicit"),
+        ("AUTH_001", "implicit"),
+        ("AUTH_002", "explicit"),
+        ("CALC_001", "explicit"),
+    ]
+
+
+def test_merge_results_rejects_overlapping_shards():
+    shard_1 = [result("AUTH_001"), result("AUTH_002")]
+    shard_2 = [result("AUTH_002")]
+
+    with pytest.raises(ValueError, match="AUTH_002"):
+        merge_results("claude-haiku", [shard_1, shard_2])
+
+
+def test_merge_results_keeps_modes_of_one_case_apart():
+    merged = merge_results("claude-haiku", [[result("AUTH_001")], [result("AUTH_001", "implicit")]])
+
+    assert len(merged) == 2
@@ -0,0 +1,108 @@
+"""Tests for the SQLite work queue shared by a coordinator and workers (work_queue.py)."""
+
+import time
+
+import pytest
+from work_queue import Task, WorkQueue
+
+
+def make_task(case_id, mode="explicit"):
+    case_dir = f"cases/rails/{case_id}"
+    return Task(
+        key=Task.make_key("claude-haiku", "rails", case_dir, mode),
+        model="claude-haiku", framework="rails", case_dir=case_dir, context_mode=mode,
+    )
+
+
+@pytest.fixture
+def queue(tmp_path):
+    return WorkQueue(tmp_path / "queue.db", lease_seconds=60.0, max_leases=3)
+
+
+def test_enqueue_ignores_duplicate_keys(queue):
+    assert queue.enqueue([make_task("AUTH_001"), make_task("AUTH_002")]) == 2
+    assert queue.enqueue([make_task("AUTH_001"), make_task("AUTH_003")]) == 1
+    assert queue.counts() == {"pending": 3, "leased": 0, "done": 0}
+
+
+def test_leased_task_is_not_handed_out_twice(queue):
+    queue.enqueue([make_task("AUTH_001")])
+
+    assert queue.lease("w1") is not None
+    assert queue.lease("w2") is None
+
+
+def test_expired_lease_is_handed_to_another_worker(tmp_path):
+    queue = WorkQueue(tmp_path / "queue.db", lease_seconds=0.01)
+    queue.enqueue([make_task("AUTH_001")])
+    first = queue.lease("w1")
+    time.sleep(0.02)
+
+    second = queue.lease("w2")
+
+    assert second is not None
+    assert second.key == first.key
+    assert second.leases == 2
+
+
+def test_renewed_lease_does_not_expire(tmp_path):
+    queue = WorkQueue(tmp_path / "queue.db", lease_seconds=0.2)
+    queue.enqueue([make_task("AUTH_001")])
+    task = queue.lease("w1")
+    time.sleep(0.1)
+    queue.renew([task.id], "w1")
+    time.sleep(0.15)
+
+    assert queue.lease("w2") is None
+
+
+def test_task_is_abandoned_after_max_leases(tmp_path):
+    queue = WorkQueue(tmp_path / "queue.db", lease_seconds=0.01, max_leases=2)
+    task = make_task("AUTH_001")
+    queue.enqueue([task])
+    for worker in ("w1", "w2"):
+        assert queue.lease(worker) is not None
+        time.sleep(0.02)
+
+    assert queue.lease("w3") is None
+
+    result = queue.results([task.key])[task.key]
+    assert result["success"] is False
+    assert result["case_id"] == "AUTH_001"
+    assert "Lease expired 2 times" in result["error"]
+    assert queue.counts()["done"] == 1
+
+
+def test_first_complete_wins(tmp_path):
+    queue = WorkQueue(tmp_path / "queue.db", lease_seconds=0.01)
+    queue.enqueue([make_task("AUTH_001")])
+    stale = queue.lease("w1")
+    time.sleep(0.02)
+    fresh = queue.lease("w2")
+
+    assert queue.complete(fresh, "w2", {"case_id": "AUTH_001", "success": True, "by": "w2"})
+    assert not queue.complete(stale, "w1", {"case_id": "AUTH_001", "success": True, "by": "w1"})
+
+    assert queue.results([fresh.key])[fresh.key]["by"] == "w2"
+
+
+def test_results_only_returns_finished_tasks(queue):
+    queue.enqueue([make_task("AUTH_001"), make_task("AUTH_002")])
+    task = queue.lease("w1")
+    queue.complete(task, "w1", {"case_id": "AUTH_001", "success": True})
+
+    keys = [make_task("AUTH_001").key, make_task("AUTH_002").key]
+    assert list(queue.results(keys)) == [task.key]
+
+
+def test_config_and_close_round_trip(queue):
+    assert queue.get_config() is None
+    queue.set_config({"models": ["claude-haiku"]})
+    queue.close()
+
+    assert queue.get_config() == {"models": ["claude-haiku"]}
+    assert queue.is_closed()
+
+    # A new coordinator reopens the queue
+    queue.set_config({"models": ["gpt-4o"]})
+    assert not queue.is_closed()